@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+
+
+SRC_DIRECTORY = Path(__file__).resolve().parent / "src"
+
+
+def discover_modules(root: Path) -> list[str]:
+    modules = []
+    for path in sorted(root.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        parts = path.relative_to(root).with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if parts:
+            modules.append(".".join(parts))
+    return modules
+
+
+def measure_import(module: str, root: Path) -> tuple[int, int]:
+    env = dict(os.environ, PYTHONPATH=str(root))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, env=env, capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    for line in reversed(result.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module and not name[1:].startswith(" "):
+            return int(self_us), int(cumulative_us)
+    return 0, 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cumulative import time of every module in src/")
+    parser.add_argument("modules", nargs="*", help="modules to measure (default: all modules in src/)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module, the fastest one is reported")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if any module exceeds this budget")
+    args = parser.parse_args()
+
+    modules = args.modules or discover_modules(SRC_DIRECTORY)
+    timings: dict[str, tuple[int, int]] = {}
+    for module in modules:
+        try:
+            timings[module] = min(measure_import(module, SRC_DIRECTORY) for _ in range(max(args.repeat, 1)))
+        except RuntimeError as e:
+            print(f"Ошибка при импорте модуля {module}: {e}")
+
+    width = max((len(module) for module in timings), default=6)
+    print(f"{'module':<{width}}  {'cumulative ms':>13}  {'self ms':>8}")
+    over_budget = []
+    for module, (self_us, cumulative_us) in sorted(timings.items(), key=lambda item: item[1][1], reverse=True):
+        cumulative_ms = cumulative_us / 1000
+        marker = ""
+        if args.budget_ms is not None and cumulative_ms > args.budget_ms:
+            over_budget.append(module)
+            marker = "  !"
+        print(f"{module:<{width}}  {cumulative_ms:>13.1f}  {self_us / 1000:>8.1f}{marker}")
+
+    if over_budget:
+        print(f"Превышен бюджет {args.budget_ms} мс: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, ForeignKey, TIMESTAMP, insert
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, BigInteger, String, ForeignKey, TIMESTAMP, insert
 from sqlalchemy.sql import text
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -85,3 +85,9 @@ travel_accommodations = Table('travel_accommodations', metadata,
     Column('accommodation_id', Integer, ForeignKey('test.accommodations.id'), nullable=False),
     schema='test'
 )
+
+table_version = Table('table_version', metadata,
+    Column('table_name', String, primary_key=True),
+    Column('version', BigInteger, nullable=False, default=0),
+    schema='test'
+)
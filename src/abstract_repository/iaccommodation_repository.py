@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Collection
 
 from models.accommodation import Accommodation
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 
 
 class IAccommodationRepository(ABC):
@@ -12,7 +15,16 @@ class IAccommodationRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_id(self, accommodation_id: int) -> Accommodation | None:
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[Accommodation]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, accommodation_id: int, fields: Collection[str] | None = None) -> Accommodation | None:
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, accommodation_ids: list[int]) -> dict[int, Accommodation]:
         pass
 
     @abstractmethod
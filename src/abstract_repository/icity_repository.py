@@ -15,6 +15,14 @@ class ICityRepository(ABC):
     async def get_by_id(self, city_id: int) -> City | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, city_ids: list[int]) -> dict[int, City]:
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> City | None:
+        pass
+
     @abstractmethod
     async def add(self, city: City) -> None:
         pass
@@ -4,6 +4,8 @@ from abc import ABC
 from abc import abstractmethod
 
 from models.directory_route import DirectoryRoute
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 
 
 class IDirectoryRouteRepository(ABC):
@@ -11,10 +13,18 @@ class IDirectoryRouteRepository(ABC):
     async def get_list(self) -> list[DirectoryRoute]:
         pass
 
+    @abstractmethod
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Page[DirectoryRoute]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, directory_route_id: int) -> DirectoryRoute | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, directory_route_ids: list[int]) -> dict[int, DirectoryRoute]:
+        pass
+
     @abstractmethod
     async def add(self, directory_route: DirectoryRoute) -> None:
         pass
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Collection
 
 from models.entertainment import Entertainment
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 
 
 class IEntertainmentRepository(ABC):
@@ -12,7 +15,16 @@ class IEntertainmentRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_id(self, entertainment_id: int) -> Entertainment | None:
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[Entertainment]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, entertainment_id: int, fields: Collection[str] | None = None) -> Entertainment | None:
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, entertainment_ids: list[int]) -> dict[int, Entertainment]:
         pass
 
     @abstractmethod
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Collection
+
+
+class ITableStatsRepository(ABC):
+    @abstractmethod
+    async def get_change_counts(self, tables: Collection[str]) -> dict[str, int]:
+        pass
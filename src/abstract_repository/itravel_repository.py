@@ -3,18 +3,29 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.travel import Travel
 
 
 class ITravelRepository(ABC):
     @abstractmethod
-    async def get_list(self) -> list[Travel]:
+    async def get_list(self, with_details: bool = True) -> list[Travel]:
+        pass
+
+    @abstractmethod
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       with_details: bool = True) -> Page[Travel]:
         pass
 
     @abstractmethod
     async def get_by_id(self, travel_id: int) -> Travel | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, travel_ids: list[int]) -> dict[int, Travel]:
+        pass
+
     @abstractmethod
     async def add(self, travel: Travel) -> None:
         pass
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Collection
 
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.user import User
 
 
@@ -12,7 +15,16 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_id(self, user_id: int) -> User | None:
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[User]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int, fields: Collection[str] | None = None) -> User | None:
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, user_ids: list[int]) -> dict[int, User]:
         pass
 
     @abstractmethod
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Collection
 
 from models.accommodation import Accommodation
 
 
 class IAccommodationService(ABC):
     @abstractmethod
-    async def get_by_id(self, accommodation_id: int) -> Accommodation | None:
+    async def get_by_id(self, accommodation_id: int, fields: Collection[str] | None = None) -> Accommodation | None:
         pass
 
     @abstractmethod
@@ -11,9 +11,21 @@ class ICityService(ABC):
     async def get_by_id(self, city_id: int) -> City | None:
         pass
     
+    @abstractmethod
+    async def get_by_name(self, name: str) -> City | None:
+        pass
+
     @abstractmethod
     async def get_all_cities(self) -> list[City]:
         pass
+
+    @abstractmethod
+    async def refresh_cache(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_cache_stats(self) -> dict[str, int]:
+        pass
     
     @abstractmethod
     async def add(self, city: City) -> City:
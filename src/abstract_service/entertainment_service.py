@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Collection
 
 from models.entertainment import Entertainment
 
 
 class IEntertainmentService(ABC):
     @abstractmethod
-    async def get_by_id(self, entertainment_id: int) -> Entertainment | None:
+    async def get_by_id(self, entertainment_id: int, fields: Collection[str] | None = None) -> Entertainment | None:
         pass
 
     @abstractmethod
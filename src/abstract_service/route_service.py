@@ -3,19 +3,23 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.route import Route
 
 
-Route.model_rebuild()
-
-
 class IRouteService(ABC):
     @abstractmethod
-    async def get_by_id(self, route_id: int) -> Route | None:
+    async def get_by_id(self, route_id: int, expand_travel: bool = False) -> Route | None:
         pass
     
     @abstractmethod
-    async def get_all_routes(self) -> list[Route]:
+    async def get_all_routes(self, expand_travel: bool = False) -> list[Route]:
+        pass
+
+    @abstractmethod
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       expand_travel: bool = False) -> Page[Route]:
         pass
 
     @abstractmethod
@@ -3,19 +3,23 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.travel import Travel
 
 
-Travel.model_rebuild()
-
-
 class ITravelService(ABC):
     @abstractmethod
     async def get_by_id(self, travel_id: int) -> Travel | None:
         pass
     
     @abstractmethod
-    async def get_all_travels(self) -> list[Travel]:
+    async def get_all_travels(self, with_details: bool = True) -> list[Travel]:
+        pass
+
+    @abstractmethod
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       with_details: bool = True) -> Page[Travel]:
         pass
 
     @abstractmethod
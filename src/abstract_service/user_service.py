@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Collection
 
 from models.user import User
 
 
 class IUserService(ABC):
     @abstractmethod
-    async def get_by_id(self, user_id: int) -> User | None:
+    async def get_by_id(self, user_id: int, fields: Collection[str] | None = None) -> User | None:
         pass
 
     @abstractmethod
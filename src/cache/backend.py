@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Collection
+from collections.abc import Mapping
+
+
+class CacheError(Exception):
+    pass
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get_many(self, keys: Collection[str]) -> dict[str, bytes]:
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, bytes]) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, keys: Collection[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from collections.abc import Mapping
+
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+from cache.tiered import TieredCache
+from cache.tiered import shared_cache
+
+
+class EntityCache[T: BaseModel]:
+    def __init__(self, namespace: str, model: type[T], backend: TieredCache = shared_cache) -> None:
+        self.namespace = namespace
+        self.model = model
+        self.backend = backend
+
+    def key(self, entity_id: int, version: int) -> str:
+        return f"{self.namespace}:{version}:{entity_id}"
+
+    async def get_many(self, entity_ids: Collection[int], version: int) -> tuple[dict[int, T], list[int]]:
+        keys = {self.key(entity_id, version): entity_id for entity_id in entity_ids}
+        found: dict[int, T] = {}
+        for key, value in (await self.backend.get_many(keys)).items():
+            try:
+                found[keys[key]] = self.model.model_validate_json(value)
+            except ValidationError:
+                continue
+        return found, [entity_id for entity_id in entity_ids if entity_id not in found]
+
+    async def set_many(self, entities: Mapping[int, T], version: int) -> None:
+        await self.backend.set_many({
+            self.key(entity_id, version): entity.model_dump_json().encode() for entity_id, entity in entities.items()
+        })
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+
+from collections.abc import Collection
+from collections.abc import Mapping
+from contextlib import suppress
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+from cache.backend import CacheBackend
+from cache.backend import CacheError
+
+
+type RespValue = bytes | int | str | list[RespValue] | None
+
+
+class RespError(CacheError):
+    pass
+
+
+def encode_command(*args: bytes | str | int) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> RespValue:
+    line = (await reader.readuntil(b"\r\n"))[:-2]
+    prefix, payload = line[:1], line[1:]
+    if prefix == b"+":
+        return payload.decode()
+    if prefix == b"-":
+        raise RespError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise CacheError(f"Неизвестный ответ RESP: {line!r}")
+
+
+class RespCache(CacheBackend):
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, ttl: float = 60.0,
+                 timeout: float = 1.0, username: str | None = None, password: str | None = None) -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.username = username
+        self.password = password
+        self.ttl = ttl
+        self.timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float = 60.0) -> RespCache:
+        parts = urlsplit(url)
+        db = int(parts.path.lstrip("/") or 0)
+        username = unquote(parts.username) if parts.username else None
+        password = unquote(parts.password) if parts.password is not None else None
+        return cls(parts.hostname or "localhost", parts.port or 6379, db, ttl, username=username, password=password)
+
+    async def _connection(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._reader is None or self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            if self.password is not None:
+                credentials = (self.username, self.password) if self.username else (self.password,)
+                self._writer.write(encode_command("AUTH", *credentials))
+                await self._writer.drain()
+                await read_reply(self._reader)
+            if self.db:
+                self._writer.write(encode_command("SELECT", self.db))
+                await self._writer.drain()
+                await read_reply(self._reader)
+        return self._reader, self._writer
+
+    def _abort(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+
+    async def _disconnect(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            with suppress(OSError):
+                await writer.wait_closed()
+
+    async def execute_many(self, commands: list[tuple[bytes | str | int, ...]]) -> list[RespValue]:
+        async with self._lock:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    reader, writer = await self._connection()
+                    writer.write(b"".join(encode_command(*command) for command in commands))
+                    await writer.drain()
+                    replies: list[RespValue] = []
+                    error: RespError | None = None
+                    for _ in commands:
+                        try:
+                            replies.append(await read_reply(reader))
+                        except RespError as e:
+                            replies.append(None)
+                            error = error or e
+            except (OSError, TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                await self._disconnect()
+                raise CacheError(f"RESP-кэш {self.host}:{self.port}: {e}") from e
+            except BaseException:
+                self._abort()
+                raise
+        if error is not None:
+            raise error
+        return replies
+
+    async def get_many(self, keys: Collection[str]) -> dict[str, bytes]:
+        if not keys:
+            return {}
+        keys = list(keys)
+        [values] = await self.execute_many([("MGET", *keys)])
+        if not isinstance(values, list):
+            raise CacheError(f"Неожиданный ответ на MGET: {values!r}")
+        return {key: value for key, value in zip(keys, values, strict=True) if isinstance(value, bytes)}
+
+    async def set_many(self, items: Mapping[str, bytes]) -> None:
+        ttl_ms = max(int(self.ttl * 1000), 1)
+        if items:
+            await self.execute_many([("SET", key, value, "PX", ttl_ms) for key, value in items.items()])
+
+    async def delete_many(self, keys: Collection[str]) -> None:
+        if keys:
+            await self.execute_many([("DEL", *keys)])
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._disconnect()
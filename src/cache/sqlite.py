@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+from collections.abc import Callable
+from collections.abc import Collection
+from collections.abc import Mapping
+from itertools import batched
+
+from cache.backend import CacheBackend
+from cache.backend import CacheError
+
+
+MAX_VARIABLES = 500
+MMAP_SIZE = 64 * 1024 * 1024
+
+
+class SQLiteCache(CacheBackend):
+    def __init__(self, path: str, ttl: float = 60.0) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=1.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS cache_entries_expires_at ON cache_entries (expires_at)")
+            self._connection = connection
+        return self._connection
+
+    async def _run[T](self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        def run() -> T:
+            with self._lock:
+                try:
+                    return operation(self._connect())
+                except sqlite3.Error as e:
+                    raise CacheError(f"SQLite-кэш {self.path}: {e}") from e
+
+        return await asyncio.to_thread(run)
+
+    async def get_many(self, keys: Collection[str]) -> dict[str, bytes]:
+        def get(connection: sqlite3.Connection) -> dict[str, bytes]:
+            now = time.time()
+            found: dict[str, bytes] = {}
+            for chunk in batched(keys, MAX_VARIABLES, strict=False):
+                rows = connection.execute(
+                    f"SELECT key, value FROM cache_entries WHERE key IN ({', '.join('?' * len(chunk))}) "
+                    "AND expires_at > ?",
+                    (*chunk, now)
+                )
+                found.update(rows)
+            return found
+
+        return await self._run(get) if keys else {}
+
+    async def set_many(self, items: Mapping[str, bytes]) -> None:
+        def put(connection: sqlite3.Connection) -> None:
+            now = time.time()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+                connection.executemany("""
+                    INSERT INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at
+                """, [(key, value, now + self.ttl) for key, value in items.items()])
+                connection.execute("COMMIT")
+            except sqlite3.Error:
+                connection.execute("ROLLBACK")
+                raise
+
+        if items:
+            await self._run(put)
+
+    async def delete_many(self, keys: Collection[str]) -> None:
+        def delete(connection: sqlite3.Connection) -> None:
+            for chunk in batched(keys, MAX_VARIABLES, strict=False):
+                connection.execute(f"DELETE FROM cache_entries WHERE key IN ({', '.join('?' * len(chunk))})", chunk)
+
+        if keys:
+            await self._run(delete)
+
+    async def close(self) -> None:
+        def close() -> None:
+            with self._lock:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+
+        await asyncio.to_thread(close)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable
+from collections.abc import Collection
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+from cache.backend import CacheBackend
+from cache.backend import CacheError
+from cache.memory import MemoryCache
+from cache.resp import RespCache
+from cache.sqlite import SQLiteCache
+from metrics import metrics
+from settings import Settings
+
+
+class TieredCache:
+    def __init__(self, tiers: Sequence[CacheBackend] = ()) -> None:
+        self.tiers = list(tiers)
+
+    def configure(self, tiers: Sequence[CacheBackend]) -> None:
+        self.tiers = list(tiers)
+
+    @staticmethod
+    async def _call[T](tier: CacheBackend, operation: Awaitable[T], default: T) -> T:
+        try:
+            return await operation
+        except CacheError as e:
+            metrics.increment("cache.errors")
+            print(f"Ошибка кэша {type(tier).__name__}: {e}")
+            return default
+
+    async def get_many(self, keys: Collection[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        missing = list(dict.fromkeys(keys))
+        for level, tier in enumerate(self.tiers):
+            if not missing:
+                break
+            hits = await self._call(tier, tier.get_many(missing), {})
+            if not hits:
+                continue
+            for upper in self.tiers[:level]:
+                await self._call(upper, upper.set_many(hits), None)
+            found.update(hits)
+            missing = [key for key in missing if key not in hits]
+        if self.tiers:
+            metrics.increment("cache.hits", len(found))
+            metrics.increment("cache.misses", len(missing))
+        return found
+
+    async def set_many(self, items: Mapping[str, bytes]) -> None:
+        if not items:
+            return
+        for tier in self.tiers:
+            await self._call(tier, tier.set_many(items), None)
+
+    async def delete_many(self, keys: Collection[str]) -> None:
+        if not keys:
+            return
+        for tier in self.tiers:
+            await self._call(tier, tier.delete_many(keys), None)
+
+    async def close(self) -> None:
+        tiers, self.tiers = self.tiers, []
+        for tier in tiers:
+            await self._call(tier, tier.close(), None)
+
+
+def build_tiers(settings: Settings) -> list[CacheBackend]:
+    tiers: list[CacheBackend] = []
+    if settings.cache_local_size > 0:
+        tiers.append(MemoryCache(settings.cache_local_size, settings.cache_local_ttl))
+    if settings.cache_sqlite_path:
+        tiers.append(SQLiteCache(settings.cache_sqlite_path, settings.cache_ttl))
+    if settings.cache_redis_url:
+        tiers.append(RespCache.from_url(settings.cache_redis_url, settings.cache_ttl))
+    return tiers
+
+
+shared_cache = TieredCache()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from metrics import metrics
+from retry import RetryPolicy
+
+
+if TYPE_CHECKING:
+    from models.city import City
+
+
+type CityLoader = Callable[[], Awaitable[list[City]]]
+
+logger = logging.getLogger(__name__)
+
+REFRESH_BACKOFF = RetryPolicy(base_delay=0.5, max_delay=30.0)
+
+
+def normalize_city_name(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+class CityCache:
+    def __init__(self, ttl: float = 30.0) -> None:
+        self.ttl = ttl
+        self._by_id: dict[int, City] = {}
+        self._by_name: dict[str, City] = {}
+        self._loader: CityLoader | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._generation = 0
+        self._expires_at = 0.0
+        self._failures = 0
+        self._retry_at = 0.0
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def configure(self, loader: CityLoader | None, ttl: float) -> None:
+        self._loader = loader
+        self.ttl = ttl
+
+    def load(self, cities: Iterable[City]) -> None:
+        self._by_id = {city.city_id: city for city in cities}
+        self._by_name = {normalize_city_name(city.name): city for city in self._by_id.values()}
+        self._expires_at = time.monotonic() + self.ttl
+        self.loaded = True
+
+    def _is_fresh(self) -> bool:
+        if not self.loaded:
+            self.schedule_refresh()
+            return False
+        if self._expires_at <= time.monotonic():
+            metrics.increment("city_cache.expired")
+            self.schedule_refresh()
+            return False
+        return True
+
+    def get(self, city_id: int) -> City | None:
+        if not self._is_fresh():
+            return None
+        city = self._by_id.get(city_id)
+        metrics.increment("city_cache.hits" if city is not None else "city_cache.misses")
+        return city
+
+    def get_by_name(self, name: str) -> City | None:
+        if not self._is_fresh():
+            return None
+        city = self._by_name.get(normalize_city_name(name))
+        metrics.increment("city_cache.hits" if city is not None else "city_cache.misses")
+        return city
+
+    def find(self, city_ids: Iterable[int]) -> tuple[dict[int, City], list[int]]:
+        found: dict[int, City] = {}
+        missing: list[int] = []
+        for city_id in city_ids:
+            city = self.get(city_id)
+            if city is None:
+                missing.append(city_id)
+            else:
+                found[city_id] = city
+        return found, missing
+
+    def put(self, city: City) -> None:
+        if not self.loaded:
+            return
+        self.discard(city.city_id)
+        self._by_id[city.city_id] = city
+        self._by_name[normalize_city_name(city.name)] = city
+
+    def discard(self, city_id: int) -> None:
+        self._generation += 1
+        city = self._by_id.pop(city_id, None)
+        if city is not None and self._by_name.get(normalize_city_name(city.name)) is city:
+            del self._by_name[normalize_city_name(city.name)]
+
+    def schedule_refresh(self) -> None:
+        if self._loader is None or (self._refresh_task is not None and not self._refresh_task.done()):
+            return
+        if time.monotonic() < self._retry_at:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_task = loop.create_task(self.refresh())
+
+    async def refresh(self) -> None:
+        if self._loader is None:
+            return
+        while True:
+            generation = self._generation
+            try:
+                cities = await self._loader()
+            except (SQLAlchemyError, OSError) as e:
+                self._failures += 1
+                self._retry_at = time.monotonic() + REFRESH_BACKOFF.backoff(self._failures)
+                metrics.increment("city_cache.refresh_errors")
+                logger.warning("Ошибка при загрузке справочника городов: %s", e)
+                return
+            if generation == self._generation:
+                self._failures = 0
+                self._retry_at = 0.0
+                self.load(cities)
+                metrics.increment("city_cache.refreshes")
+                return
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._by_name.clear()
+        self.loaded = False
+
+    async def close(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self.clear()
+        self._loader = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self),
+            "hits": metrics.get("city_cache.hits"),
+            "misses": metrics.get("city_cache.misses"),
+            "refreshes": metrics.get("city_cache.refreshes")
+        }
+
+
+city_cache = CityCache()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import Request
 
+from controllers.fields import ACCOMMODATION_FIELDS
+from controllers.fields import select_fields
+from controllers.fields import serialize
 from models.accommodation import Accommodation
+from models.page import DEFAULT_PAGE_SIZE
 from services.accommodation_service import AccommodationService
 
 
@@ -54,43 +59,28 @@ class AccommodationController:
             accommodation_id = data.get("id")
             if accommodation_id is None:
                 return {"message": "Missing 'id' in request"}
-            accommodation = await self.accommodation_service.get_by_id(accommodation_id)
+            fields = data.get("fields")
+            selected = select_fields(fields, ACCOMMODATION_FIELDS)
+            accommodation = await self.accommodation_service.get_by_id(
+                accommodation_id, None if fields is None else set(selected.values())
+            )
             if accommodation:
-                
-                return {
-                    "accommodation": {
-                        "id": accommodation.accommodation_id,
-                        "price": accommodation.price,
-                        "address": accommodation.address,
-                        "name": accommodation.name,
-                        "type": accommodation.type,
-                        "rating": accommodation.rating,
-                        "check_in": accommodation.check_in.isoformat(),
-                        "check_out": accommodation.check_out.isoformat()
-                    }
-                }
+                return {"accommodation": serialize(accommodation, selected)}
             return {"message": "Accommodation not found"}
         except Exception as e:
             return {"message": "Error fetching details", "error": str(e)}
 
-    async def get_all_accommodation(self) -> dict[str, Any]:
+    async def get_all_accommodation(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                                    fields: str | Iterable[str] | None = None) -> dict[str, Any]:
         try:
-            accommodation_list = await self.accommodation_service.get_list()
+            selected = select_fields(fields, ACCOMMODATION_FIELDS)
+            page = await self.accommodation_service.get_page(
+                after_id, limit, None if fields is None else set(selected.values())
+            )
             return {
-                    "accommodations": [
-                        {
-                            "id": a.accommodation_id,
-                            "price": a.price,
-                            "address": a.address,
-                            "name": a.name,
-                            "type": a.type,
-                            "rating": a.rating,
-                            "check_in": a.check_in.isoformat(),
-                            "check_out": a.check_out.isoformat()
-                        }
-                        for a in accommodation_list
-                    ]
-                }
+                "accommodations": [serialize(a, selected) for a in page.items],
+                "next_cursor": page.next_cursor
+            }
         except Exception as e:
             return {"message": "Error fetching accommodations", "error": str(e)}
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import Request
 
+from controllers.fields import ENTERTAINMENT_FIELDS
+from controllers.fields import select_fields
+from controllers.fields import serialize
 from models.entertainment import Entertainment
+from models.page import DEFAULT_PAGE_SIZE
 from services.entertainment_service import EntertainmentService
 
 
@@ -48,35 +53,27 @@ class EntertainmentController:
             entertainment_id = data.get("id")
             if entertainment_id is None:
                 return {"message": "Missing 'id' in request"}
-            entertainment = await self.entertainment_service.get_by_id(entertainment_id)
+            fields = data.get("fields")
+            selected = select_fields(fields, ENTERTAINMENT_FIELDS)
+            entertainment = await self.entertainment_service.get_by_id(
+                entertainment_id, None if fields is None else set(selected.values())
+            )
             if entertainment:
-                return {
-                    "entertainment": {
-                        "id": entertainment.entertainment_id,
-                        "duration": entertainment.duration,
-                        "address": entertainment.address,
-                        "event_name": entertainment.event_name,
-                        "event_time": entertainment.event_time.isoformat()
-                        }
-                }
+                return {"entertainment": serialize(entertainment, selected)}
             return {"message": "Entertainment not found"}
         except Exception as e:
             return {"message": "Error fetching details", "error": str(e)}
 
-    async def get_all_entertainment(self) -> dict[str, Any]:
+    async def get_all_entertainment(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                                    fields: str | Iterable[str] | None = None) -> dict[str, Any]:
         try:
-            entertainment_list = await self.entertainment_service.get_list()
+            selected = select_fields(fields, ENTERTAINMENT_FIELDS)
+            page = await self.entertainment_service.get_page(
+                after_id, limit, None if fields is None else set(selected.values())
+            )
             return {
-                "entertainments": [
-                    {
-                        "id": e.entertainment_id,
-                        "duration": e.duration,
-                        "address": e.address,
-                        "event_name": e.event_name,
-                        "event_time": e.event_time.isoformat()
-                    }
-                    for e in entertainment_list
-                ]
+                "entertainments": [serialize(e, selected) for e in page.items],
+                "next_cursor": page.next_cursor
             }
         except Exception as e:
             return {"message": "Error fetching entertainments", "error": str(e)}
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+ACCOMMODATION_FIELDS = {
+    "id": "accommodation_id",
+    "price": "price",
+    "address": "address",
+    "name": "name",
+    "type": "type",
+    "rating": "rating",
+    "check_in": "check_in",
+    "check_out": "check_out"
+}
+ENTERTAINMENT_FIELDS = {
+    "id": "entertainment_id",
+    "duration": "duration",
+    "address": "address",
+    "event_name": "event_name",
+    "event_time": "event_time"
+}
+USER_FIELDS = {
+    "id": "user_id",
+    "fio": "fio",
+    "number_passport": "number_passport",
+    "phone_number": "phone_number",
+    "email": "email",
+    "login": "login",
+    "password": "password",
+    "user_id": "user_id",
+    "is_admin": "is_admin"
+}
+USER_LIST_FIELDS = ("id", "fio", "phone_number", "email", "login", "user_id", "is_admin")
+
+
+def select_fields(requested: str | Iterable[str] | None, available: Mapping[str, str],
+                  default: Iterable[str] | None = None) -> dict[str, str]:
+    if requested is None:
+        names = list(available if default is None else default)
+    else:
+        if isinstance(requested, str):
+            requested = requested.split(",")
+        names = [name.strip() for name in requested if name.strip()]
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return {name: available[name] for name in names}
+
+
+def serialize(entity: BaseModel, selected: Mapping[str, str]) -> dict[str, Any]:
+    data = {}
+    for name, attribute in selected.items():
+        value = getattr(entity, attribute)
+        data[name] = value.isoformat() if isinstance(value, datetime) else value
+    return data
@@ -4,6 +4,7 @@ from typing import Any
 
 from fastapi import Request
 
+from models.page import DEFAULT_PAGE_SIZE
 from models.route import Route
 from services.route_service import RouteService
 
@@ -105,9 +106,9 @@ class RouteController:
         except Exception as e:
             return {"message": "Error deleting route", "error": str(e)}
     
-    async def get_all_route(self) -> dict[str, Any]:
+    async def get_all_route(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> dict[str, Any]:
         try:
-            route_list = await self.route_service.get_all_routes()
+            page = await self.route_service.get_page(after_id, limit)
             return {
                 "routes": [
                     {
@@ -118,8 +119,9 @@ class RouteController:
                         "end_time": r.end_time,
                         "route_id": r.route_id 
                     }
-                    for r in route_list if r is not None and r.d_route is not None and r.travels is not None
-                ]
+                    for r in page.items if r.d_route is not None and r.travels is not None
+                ],
+                "next_cursor": page.next_cursor
             }
         except Exception as e:
             return {"message": "Error fetching routes", "error": str(e)}
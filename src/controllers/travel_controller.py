@@ -4,6 +4,8 @@ from typing import Any
 
 from fastapi import Request
 
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import MAX_PAGE_SIZE
 from models.travel import Travel
 from services.travel_service import TravelService
 
@@ -12,6 +14,37 @@ class TravelController:
     def __init__(self, travel_service: TravelService) -> None:
         self.travel_service = travel_service
 
+    @staticmethod
+    def _travel_details(travel: Travel, user_id: int) -> dict[str, Any]:
+        return {
+            "id": travel.travel_id,
+            "status": travel.status,
+            "user_id": user_id,
+            "entertainments": [
+                {
+                    "id": e.entertainment_id,
+                    "duration": e.duration,
+                    "address": e.address,
+                    "event_name": e.event_name,
+                    "event_time": e.event_time.isoformat()
+                }
+                for e in travel.entertainments
+            ],
+            "accommodations": [
+                {
+                    "id": a.accommodation_id,
+                    "price": a.price,
+                    "address": a.address,
+                    "name": a.name,
+                    "e_type": a.type,
+                    "rating": a.rating,
+                    "check_in": a.check_in.isoformat(),
+                    "check_out": a.check_out.isoformat()
+                }
+                for a in travel.accommodations
+            ]
+        }
+
     async def create_new_travel(self, request: Request) -> dict[str, Any]:
         try:
             data = await request.json()
@@ -28,39 +61,8 @@ class TravelController:
             if travel_id is None:
                 return {"message": "Missing 'id' in request"}
             travel = await self.travel_service.get_by_id(travel_id)
-            entertainment_list = await self.travel_service.get_entertainments_by_travel(travel_id)
-            accommodation_list = await self.travel_service.get_accommodations_by_travel(travel_id)
             if travel and travel.users:
-                return {
-                    "travel": {
-                        "id": travel.travel_id,
-                        "status": travel.status,
-                        "user_id": travel.users.user_id,
-                        "entertainments": [
-                            {
-                                "id": e.entertainment_id,
-                                "duration": e.duration,
-                                "address": e.address,
-                                "event_name": e.event_name,
-                                "event_time": e.event_time.isoformat()
-                            }
-                            for e in entertainment_list
-                        ],
-                         "accommodations": [
-                            {
-                                "id": a.accommodation_id,
-                                "price": a.price,
-                                "address": a.address,
-                                "name": a.name,
-                                "e_type": a.type,
-                                "rating": a.rating,
-                                "check_in": a.check_in.isoformat(),
-                                "check_out": a.check_out.isoformat()
-                            }
-                            for a in accommodation_list
-                        ]
-                    }
-                }
+                return {"travel": self._travel_details(travel, travel.users.user_id)}
             return {"message": "Entertainment not found"}
         except Exception as e:
             return {"message": "Error fetching details", "error": str(e)}
@@ -76,10 +78,10 @@ class TravelController:
         except Exception as e:
             return {"message": "Error complete travel", "error": str(e)}
 
-    async def check_archive_travels(self) -> dict[str, Any]:
+    async def check_archive_travels(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> dict[str, Any]:
         try:
-            archived_travels = await self.travel_service.check_archive()
-            return {"archived_travels": archived_travels}
+            page = await self.travel_service.get_archive_page(after_id, limit)
+            return {"archived_travels": page.items, "next_cursor": page.next_cursor}
         except Exception as e:
             return {"message": "Error checking archive travels", "error": str(e)}
 
@@ -111,51 +113,24 @@ class TravelController:
             if not travel_dict:
                 return {"message": "Missing search parameters"}
             
-            search_results = await self.travel_service.search(travel_dict)
+            limit = min(max(int(data.get("limit") or MAX_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+            search_results = await self.travel_service.search(
+                travel_dict,
+                limit=limit,
+                offset=data.get("offset", 0),
+                sort=data.get("sort", "id")
+            )
             return {"search_results": search_results}
         
         except Exception as e:
             return {"message": "Error searching for travel", "error": str(e)}
 
-    async def get_all_travels(self) -> dict[str, Any]:
+    async def get_all_travels(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> dict[str, Any]:
         try:
-            travel_list = await self.travel_service.get_all_travels()
-            
-            travels = []
-            for t in travel_list:
-                entertainment_list = await self.travel_service.get_entertainments_by_travel(t.travel_id)
-                accommodation_list = await self.travel_service.get_accommodations_by_travel(t.travel_id)
-                if t.users:
-                    travels.append({
-                        "id": t.travel_id,
-                        "status": t.status,
-                        "user_id": t.users.user_id,
-                        "entertainments": [
-                            {
-                                "id": e.entertainment_id,
-                                "duration": e.duration,
-                                "address": e.address,
-                                "event_name": e.event_name,
-                                "event_time": e.event_time.isoformat()
-                            }
-                            for e in entertainment_list
-                        ],
-                        "accommodations": [
-                            {
-                                "id": a.accommodation_id,
-                                "price": a.price,
-                                "address": a.address,
-                                "name": a.name,
-                                "e_type": a.type,
-                                "rating": a.rating,
-                                "check_in": a.check_in.isoformat(),
-                                "check_out": a.check_out.isoformat()
-                            }
-                            for a in accommodation_list
-                        ]
-                    })
+            page = await self.travel_service.get_page(after_id, limit)
+            travels = [self._travel_details(t, t.users.user_id) for t in page.items if t.users]
 
-            return {"travels": travels}
+            return {"travels": travels, "next_cursor": page.next_cursor}
         
         except Exception as e:
             return {"message": "Error fetching travels", "error": str(e)}
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import Request
 
+from controllers.fields import USER_FIELDS
+from controllers.fields import USER_LIST_FIELDS
+from controllers.fields import select_fields
+from controllers.fields import serialize
+from models.page import DEFAULT_PAGE_SIZE
 from models.user import User
 from services.user_service import AuthService
 from services.user_service import UserService
@@ -20,43 +26,23 @@ class UserController:
             user_id = data.get("id")
             if user_id is None:
                 return {"message": "Missing 'id' in request"}
-            user = await self.user_service.get_by_id(user_id)
+            fields = data.get("fields")
+            selected = select_fields(fields, USER_FIELDS)
+            user = await self.user_service.get_by_id(user_id, None if fields is None else set(selected.values()))
             if user:
-                return {
-                    "user": {
-                            "id": user.user_id,
-                            "fio": user.fio,
-                            "number_passport": user.number_passport,
-                            "phone_number": user.phone_number,
-                            "email": user.email,
-                            "login": user.login,
-                            "password": user.password,
-                            "user_id": user.user_id,
-                            "is_admin": user.is_admin
-                        }
-                }
+                return {"user": serialize(user, selected)}
             return {"message": "User not found"}
         except Exception as e:
             return {"message": "Error fetching details", "error": str(e)}
 
-    async def get_all_users(self) -> dict[str, Any]:
+    async def get_all_users(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                            fields: str | Iterable[str] | None = None) -> dict[str, Any]:
         try:
-            user_list = await self.user_service.get_list()
+            selected = select_fields(fields, USER_FIELDS, USER_LIST_FIELDS)
+            page = await self.user_service.get_page(after_id, limit, set(selected.values()))
             return {
-                "users": [
-                    {
-                        "id": u.user_id,
-                        "fio": u.fio,
-                        "number_passport": u.number_passport,
-                        "phone_number": u.phone_number,
-                        "email": u.email,
-                        "login": u.login,
-                        "password": u.password,
-                        "user_id": u.user_id,
-                        "is_admin": u.is_admin
-                    }
-                    for u in user_list
-                ]
+                "users": [serialize(u, selected) for u in page.items],
+                "next_cursor": page.next_cursor
             }
         except Exception as e:
             return {"message": "Error fetching users", "error": str(e)}
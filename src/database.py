@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import ARRAY
+from sqlalchemy import Executable
+from sqlalchemy import Result
+from sqlalchemy import String
+from sqlalchemy import bindparam
+from sqlalchemy import make_url
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from identity_map import IdentityMap
+from metrics import metrics
+from retry import RetryPolicy
+from retry import get_sqlstate
+from retry import is_transient
+from settings import Settings
+from table_versions import table_versions
+
+
+READ_ONLY_OPTION = "read_only"
+WRITES_OPTION = "writes"
+PRIMARY_OPTION = "primary"
+SET_STATEMENT_TIMEOUT = text("SELECT set_config('statement_timeout', :timeout, true)")
+BUMP_TABLE_VERSIONS = text("""
+    INSERT INTO table_version (table_name, version)
+    SELECT table_name, 1 FROM unnest(:tables) AS table_name ORDER BY table_name
+    ON CONFLICT (table_name) DO UPDATE SET version = table_version.version + 1
+""").bindparams(bindparam("tables", type_=ARRAY(String)))
+
+
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_replica_engine: AsyncEngine | None = None
+_replica_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_retry_policy = RetryPolicy()
+QUERY_CANCELED = "57014"
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class Deadline:
+    def __init__(self, timeout: float) -> None:
+        self.expires_at = time.monotonic() + timeout
+        self.exceeded = False
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def expire(self) -> DeadlineExceeded:
+        if not self.exceeded:
+            self.exceeded = True
+            metrics.increment("db.deadline_exceeded")
+        return DeadlineExceeded("Превышено время выполнения запроса.")
+
+
+_deadline: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
+class RequestSessions:
+    def __init__(self, primary_maker: async_sessionmaker[AsyncSession],
+                 replica_maker: async_sessionmaker[AsyncSession] | None) -> None:
+        self.primary_maker = primary_maker
+        self.replica_maker = replica_maker
+        self.primary: AsyncSession | None = None
+        self.replica: AsyncSession | None = None
+        self.pinned_to_primary = False
+        self.write_pending = False
+        self.written_tables: set[str] = set()
+        self.timeout_applied: set[int] = set()
+        self.state: dict[str, Any] = {}
+        self.identity_map = IdentityMap()
+
+    def get_primary(self) -> AsyncSession:
+        if self.primary is None:
+            self.primary = self.primary_maker()
+        return self.primary
+
+    def get_for_read(self) -> AsyncSession:
+        if self.replica_maker is None or self.pinned_to_primary:
+            return self.get_primary()
+        if self.replica is None:
+            self.replica = self.replica_maker()
+        return self.replica
+
+    async def close(self) -> None:
+        for session in (self.primary, self.replica):
+            if session is not None:
+                await session.close()
+
+
+_current_sessions: ContextVar[RequestSessions | None] = ContextVar("current_sessions", default=None)
+
+
+def create_engine(settings: Settings, dsn: str | None = None, search_path: str | None = None) -> AsyncEngine:
+    url = make_url(dsn or settings.dsn).update_query_dict({
+        "prepared_statement_cache_size": str(settings.prepared_statement_cache_size)
+    })
+    return create_async_engine(
+        url,
+        connect_args={
+            "statement_cache_size": settings.statement_cache_size,
+            "server_settings": {
+                "search_path": search_path or settings.search_path
+            }
+        },
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_pre_ping=settings.pool_pre_ping,
+        pool_recycle=settings.pool_recycle,
+        echo=bool(settings.echo)
+    )
+
+
+def init_engine(settings: Settings) -> AsyncEngine:
+    global _engine, _sessionmaker, _replica_engine, _replica_sessionmaker, _retry_policy
+    if _engine is not None:
+        return _engine
+    _retry_policy = RetryPolicy.from_settings(settings)
+    _engine = create_engine(settings)
+    _sessionmaker = async_sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+    if settings.replica_dsn or settings.replica_search_path:
+        _replica_engine = create_engine(settings, settings.replica_dsn, settings.replica_search_path)
+        _replica_sessionmaker = async_sessionmaker(_replica_engine, class_=AsyncSession, expire_on_commit=False)
+    return _engine
+
+
+async def dispose_engine() -> None:
+    global _engine, _sessionmaker, _replica_engine, _replica_sessionmaker
+    if _replica_engine is not None:
+        await _replica_engine.dispose()
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
+    _replica_engine = None
+    _replica_sessionmaker = None
+
+
+def get_engine() -> AsyncEngine:
+    if _engine is None:
+        raise RuntimeError("Движок БД не инициализирован: вызовите init_engine() при старте приложения.")
+    return _engine
+
+
+def get_replica_engine() -> AsyncEngine | None:
+    return _replica_engine
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    if _sessionmaker is None:
+        raise RuntimeError("Движок БД не инициализирован: вызовите init_engine() при старте приложения.")
+    return _sessionmaker
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncGenerator[RequestSessions]:
+    sessions = RequestSessions(get_sessionmaker(), _replica_sessionmaker)
+    token = _current_sessions.set(sessions)
+    try:
+        yield sessions
+    finally:
+        _current_sessions.reset(token)
+        await sessions.close()
+
+
+def get_deadline() -> Deadline | None:
+    return _deadline.get()
+
+
+@contextmanager
+def deadline_scope(timeout: float) -> Generator[Deadline]:
+    deadline = Deadline(timeout)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def use_primary() -> None:
+    sessions = _current_sessions.get()
+    if sessions is not None:
+        sessions.pinned_to_primary = True
+
+
+def is_pinned_to_primary() -> bool:
+    sessions = _current_sessions.get()
+    return sessions is not None and sessions.pinned_to_primary
+
+
+def has_pending_write() -> bool:
+    sessions = _current_sessions.get()
+    return sessions is not None and sessions.write_pending
+
+
+def reads_from_replica() -> bool:
+    sessions = _current_sessions.get()
+    return sessions is not None and sessions.replica_maker is not None and not sessions.pinned_to_primary
+
+
+def is_read_only(statement: Executable) -> bool:
+    return bool(statement.get_execution_options().get(READ_ONLY_OPTION, False))
+
+
+def reads_primary(statement: Executable) -> bool:
+    return bool(statement.get_execution_options().get(PRIMARY_OPTION, False))
+
+
+def written_tables(statement: Executable) -> tuple[str, ...]:
+    return tuple(statement.get_execution_options().get(WRITES_OPTION, ()))
+
+
+def current_sessions() -> RequestSessions:
+    sessions = _current_sessions.get()
+    if sessions is None:
+        raise RuntimeError("Сессия БД не привязана к текущему запросу.")
+    return sessions
+
+
+class ScopedSession:
+    @staticmethod
+    def current() -> AsyncSession:
+        return current_sessions().get_primary()
+
+    @staticmethod
+    async def _apply_statement_timeout(sessions: RequestSessions, session: AsyncSession, deadline: Deadline) -> None:
+        if id(session) in sessions.timeout_applied:
+            return
+        timeout_ms = max(int(deadline.remaining() * 1000), 1)
+        await session.execute(SET_STATEMENT_TIMEOUT, {"timeout": str(timeout_ms)})
+        sessions.timeout_applied.add(id(session))
+
+    @classmethod
+    async def _execute_with_deadline(cls, sessions: RequestSessions, session: AsyncSession, statement: Executable,
+                                     params: Mapping[str, Any] | None) -> Result[Any]:
+        deadline = get_deadline()
+        if deadline is None:
+            return await session.execute(statement, params)
+        if deadline.remaining() <= 0:
+            raise deadline.expire()
+        try:
+            async with asyncio.timeout(deadline.remaining()):
+                await cls._apply_statement_timeout(sessions, session, deadline)
+                return await session.execute(statement, params)
+        except TimeoutError:
+            raise deadline.expire()
+        except DBAPIError as e:
+            if get_sqlstate(e) == QUERY_CANCELED:
+                deadline.expire()
+            raise
+
+    async def execute(self, statement: Executable, params: Mapping[str, Any] | None = None) -> Result[Any]:
+        sessions = current_sessions()
+        read_only = is_read_only(statement)
+        attempt = 0
+        while True:
+            if read_only:
+                session = sessions.get_primary() if reads_primary(statement) else sessions.get_for_read()
+            else:
+                sessions.pinned_to_primary = True
+                sessions.identity_map.clear()
+                session = sessions.get_primary()
+            replayable = session is not sessions.primary or not sessions.write_pending
+            try:
+                result = await self._execute_with_deadline(sessions, session, statement, params)
+            except DBAPIError as e:
+                if not replayable or not is_transient(e):
+                    raise
+                delay = _retry_policy.backoff(attempt)
+                deadline = get_deadline()
+                expires_at = deadline.expires_at if deadline is not None else None
+                if attempt >= _retry_policy.attempts or not _retry_policy.can_sleep(delay, expires_at):
+                    metrics.increment("db.retries_exhausted")
+                    raise
+                metrics.increment("db.retries")
+                await session.rollback()
+                sessions.timeout_applied.discard(id(session))
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if not read_only:
+                sessions.write_pending = True
+                sessions.written_tables.update(written_tables(statement))
+            return result
+
+    async def stream(self, statement: Executable, params: Mapping[str, Any] | None = None) -> AsyncResult[Any]:
+        sessions = current_sessions()
+        if is_read_only(statement):
+            session = sessions.get_primary() if reads_primary(statement) else sessions.get_for_read()
+        else:
+            sessions.pinned_to_primary = True
+            sessions.identity_map.clear()
+            sessions.written_tables.update(written_tables(statement))
+            session = sessions.get_primary()
+        deadline = get_deadline()
+        if deadline is not None:
+            if deadline.remaining() <= 0:
+                raise deadline.expire()
+            await self._apply_statement_timeout(sessions, session, deadline)
+        return await session.stream(statement, params)
+
+    @staticmethod
+    async def commit() -> None:
+        sessions = current_sessions()
+        if sessions.primary is not None:
+            if sessions.written_tables:
+                await sessions.primary.execute(BUMP_TABLE_VERSIONS, {"tables": sorted(sessions.written_tables)})
+            await sessions.primary.commit()
+            sessions.timeout_applied.discard(id(sessions.primary))
+        table_versions.bump(sessions.written_tables)
+        sessions.written_tables.clear()
+        sessions.write_pending = False
+
+    @staticmethod
+    async def rollback() -> None:
+        sessions = current_sessions()
+        for session in (sessions.primary, sessions.replica):
+            if session is not None:
+                await session.rollback()
+        sessions.write_pending = False
+        sessions.written_tables.clear()
+        sessions.timeout_applied.clear()
+        sessions.identity_map.clear()
+
+
+def get_identity_map(session: AsyncSession | ScopedSession) -> IdentityMap:
+    if isinstance(session, ScopedSession):
+        return current_sessions().identity_map
+    return IdentityMap()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from metrics import metrics
+from retry import RetryPolicy
+
+
+if TYPE_CHECKING:
+    from models.directory_route import DirectoryRoute
+
+
+type DirectoryRouteLoader = Callable[[], Awaitable[list[DirectoryRoute]]]
+
+logger = logging.getLogger(__name__)
+
+REBUILD_BACKOFF = RetryPolicy(base_delay=0.5, max_delay=30.0)
+
+
+def _city_id(d_route: DirectoryRoute, attribute: str) -> int | None:
+    city = getattr(d_route, attribute)
+    return None if city is None else int(city.city_id)
+
+
+@dataclass(frozen=True)
+class DirectoryRouteSnapshot:
+    version: int
+    routes: Mapping[int, DirectoryRoute] = field(default_factory=lambda: MappingProxyType({}))
+    departures: Mapping[int, tuple[DirectoryRoute, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    options: Mapping[tuple[int, int], tuple[DirectoryRoute, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def build(cls, version: int, d_routes: Iterable[DirectoryRoute]) -> DirectoryRouteSnapshot:
+        routes = {d_route.d_route_id: d_route for d_route in d_routes}
+        departures: dict[int, list[DirectoryRoute]] = {}
+        options: dict[tuple[int, int], list[DirectoryRoute]] = {}
+        for d_route in sorted(routes.values(), key=lambda item: (item.cost, item.d_route_id)):
+            from_id = _city_id(d_route, "departure_city")
+            to_id = _city_id(d_route, "destination_city")
+            if from_id is None or to_id is None:
+                continue
+            departures.setdefault(from_id, []).append(d_route)
+            options.setdefault((from_id, to_id), []).append(d_route)
+        return cls(
+            version=version,
+            routes=MappingProxyType(routes),
+            departures=MappingProxyType({key: tuple(value) for key, value in departures.items()}),
+            options=MappingProxyType({key: tuple(value) for key, value in options.items()})
+        )
+
+    def get(self, d_route_id: int) -> DirectoryRoute | None:
+        d_route = self.routes.get(d_route_id)
+        return None if d_route is None else d_route.model_copy(deep=True)
+
+    def from_city(self, city_id: int) -> tuple[DirectoryRoute, ...]:
+        return tuple(d_route.model_copy(deep=True) for d_route in self.departures.get(city_id, ()))
+
+    def between(self, from_city_id: int, to_city_id: int) -> tuple[DirectoryRoute, ...]:
+        return tuple(d_route.model_copy(deep=True) for d_route in self.options.get((from_city_id, to_city_id), ()))
+
+
+class DirectoryRouteCache:
+    def __init__(self, ttl: float = 30.0) -> None:
+        self.ttl = ttl
+        self._version = 0
+        self._snapshot: DirectoryRouteSnapshot | None = None
+        self._expires_at = 0.0
+        self._loader: DirectoryRouteLoader | None = None
+        self._rebuild_task: asyncio.Task[None] | None = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def configure(self, loader: DirectoryRouteLoader | None, ttl: float) -> None:
+        self._loader = loader
+        self.ttl = ttl
+
+    def snapshot(self) -> DirectoryRouteSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self._version and self._expires_at <= time.monotonic():
+            metrics.increment("directory_route_cache.expired")
+            self.schedule_rebuild()
+            snapshot = None
+        if snapshot is None or snapshot.version != self._version:
+            if self._loader is not None:
+                metrics.increment("directory_route_cache.misses")
+                self.schedule_rebuild()
+            return None
+        metrics.increment("directory_route_cache.hits")
+        return snapshot
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._retry_at = 0.0
+        self.schedule_rebuild()
+
+    def schedule_rebuild(self) -> None:
+        if self._loader is None or (self._rebuild_task is not None and not self._rebuild_task.done()):
+            return
+        if time.monotonic() < self._retry_at:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._rebuild_task = loop.create_task(self.rebuild())
+
+    async def rebuild(self) -> None:
+        if self._loader is None:
+            return
+        while True:
+            version = self._version
+            try:
+                d_routes = await self._loader()
+            except (SQLAlchemyError, OSError) as e:
+                self._failures += 1
+                self._retry_at = time.monotonic() + REBUILD_BACKOFF.backoff(self._failures)
+                metrics.increment("directory_route_cache.rebuild_errors")
+                logger.warning("Ошибка при перестроении справочника маршрутов: %s", e)
+                return
+            if version == self._version:
+                self._failures = 0
+                self._retry_at = 0.0
+                self._snapshot = DirectoryRouteSnapshot.build(version, d_routes)
+                self._expires_at = time.monotonic() + self.ttl
+                metrics.increment("directory_route_cache.rebuilds")
+                return
+
+    async def close(self) -> None:
+        task, self._rebuild_task = self._rebuild_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._snapshot = None
+        self._loader = None
+
+
+directory_route_cache = DirectoryRouteCache()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import RowMapping
+
+from metrics import metrics
+
+
+class IdentityMap:
+    def __init__(self) -> None:
+        self._entities: dict[tuple[type[Any], int], Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get[T](self, model: type[T], key: int) -> T | None:
+        entity: T | None = self._entities.get((model, key))
+        return entity
+
+    def add[T](self, model: type[T], key: int, entity: T) -> T:
+        self._entities[model, key] = entity
+        return entity
+
+    def find[T](self, model: type[T], keys: Iterable[int]) -> tuple[dict[int, T], list[int]]:
+        found: dict[int, T] = {}
+        missing: list[int] = []
+        for key in keys:
+            entity = self.get(model, key)
+            if entity is None:
+                missing.append(key)
+            else:
+                found[key] = entity
+        metrics.increment("identity_map.hits", len(found))
+        metrics.increment("identity_map.misses", len(missing))
+        return found, missing
+
+    def resolve[T](self, model: type[T], key: int, build: Callable[[RowMapping], T], row: RowMapping) -> T:
+        entity = self.get(model, key)
+        if entity is None:
+            entity = self.add(model, key, build(row))
+        return entity
+
+    def clear(self) -> None:
+        self._entities.clear()
@@ -1,15 +1,55 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from cache.tiered import build_tiers
+from cache.tiered import shared_cache
+from city_cache import city_cache
+from database import dispose_engine
+from database import get_replica_engine
+from database import init_engine
+from directory_route_cache import directory_route_cache
+from middleware import deadline_middleware
+from page_cache import page_cache
 from routers.accommodation import accommodation_router
 from routers.entertainment import entertainment_router
+from routers.health import health_router
 from routers.travel import travel_router
 from routers.user import user_router
+from service_locator import init_service_locator
+from settings import get_settings
+from warmup import set_ready
+from warmup import warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    settings = get_settings()
+    engine = init_engine(settings)
+    init_service_locator()
+    page_cache.configure(settings.page_cache_size, settings.page_cache_ttl)
+    shared_cache.configure(build_tiers(settings))
+    replica_engine = get_replica_engine()
+    engines = [engine] if replica_engine is None else [engine, replica_engine]
+    try:
+        await warm_up(engines, min(settings.warmup_connections, settings.pool_size), settings.reference_cache_ttl)
+        yield
+    finally:
+        set_ready(False)
+        page_cache.clear()
+        await city_cache.close()
+        await directory_route_cache.close()
+        await shared_cache.close()
+        await dispose_engine()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+app.middleware("http")(deadline_middleware)
+app.include_router(health_router)
 app.include_router(user_router)
 app.include_router(accommodation_router)
 app.include_router(entertainment_router)
-app.include_router(travel_router)
\ No newline at end of file
+app.include_router(travel_router)
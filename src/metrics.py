@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections import Counter
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self._counters: Counter[str] = Counter()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self._counters[name] += value
+
+    def get(self, name: str) -> int:
+        return self._counters[name]
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self._counters)
+
+    def reset(self) -> None:
+        self._counters.clear()
+
+
+metrics = Metrics()
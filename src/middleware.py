@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from fastapi import Request
+from fastapi import Response
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import RequestResponseEndpoint
+
+from database import DeadlineExceeded
+from database import deadline_scope
+from metrics import metrics
+from settings import get_settings
+
+
+def deadline_exceeded_response() -> JSONResponse:
+    metrics.increment("http.deadline_exceeded")
+    return JSONResponse({"message": "Request deadline exceeded"}, status_code=status.HTTP_504_GATEWAY_TIMEOUT)
+
+
+async def deadline_middleware(request: Request, call_next: RequestResponseEndpoint) -> Response:
+    with deadline_scope(get_settings().request_timeout) as deadline:
+        try:
+            response = await call_next(request)
+        except DeadlineExceeded:
+            return deadline_exceeded_response()
+    if deadline.exceeded:
+        return deadline_exceeded_response()
+    return response
@@ -5,6 +5,7 @@ from pydantic import Field
 from pydantic import field_validator
 
 from models.city import City
+from models.reference import CityRef
 
 
 class DirectoryRoute(BaseModel):
@@ -12,8 +13,8 @@ class DirectoryRoute(BaseModel):
     type_transport: str
     cost: int
     distance: int
-    departure_city: City | None = Field(default=None, description="Город, откуда начинается маршрут")
-    destination_city: City | None = Field(default=None, description="Город, куда направляется маршрут")
+    departure_city: City | CityRef | None = Field(default=None, description="Город, откуда начинается маршрут")
+    destination_city: City | CityRef | None = Field(default=None, description="Город, куда направляется маршрут")
 
     @field_validator('d_route_id')
     @classmethod
@@ -46,14 +47,14 @@ class DirectoryRoute(BaseModel):
 
     @field_validator('departure_city')
     @classmethod
-    def check_departure_city(cls, value: City | None) -> City | None:
-        if value is not None and not isinstance(value, City):
+    def check_departure_city(cls, value: City | CityRef | None) -> City | CityRef | None:
+        if value is not None and not isinstance(value, City | CityRef):
             raise ValueError('departure_city должен быть экземпляром City')
         return value
 
     @field_validator('destination_city')
     @classmethod
-    def check_destination_city(cls, value: City | None) -> City | None:
-        if value is not None and not isinstance(value, City):
+    def check_destination_city(cls, value: City | CityRef | None) -> City | CityRef | None:
+        if value is not None and not isinstance(value, City | CityRef):
             raise ValueError('destination_city должен быть экземпляром City')
         return value
\ No newline at end of file
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class Page[T](BaseModel):
+    items: list[T] = Field(default_factory=list, description="Элементы страницы")
+    next_cursor: int | None = Field(default=None, description="ID, после которого начинается следующая страница")
+
+    @classmethod
+    def from_items(cls, items: list[T], limit: int, cursor: Callable[[T], int]) -> Page[T]:
+        if len(items) <= limit:
+            return cls(items=items)
+        items = items[:limit]
+        return cls(items=items, next_cursor=cursor(items[-1]))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import field_validator
+
+
+class UserRef(BaseModel):
+    user_id: int
+    fio: str | None = Field(default=None, description="ФИО пользователя")
+
+    @field_validator('user_id')
+    @classmethod
+    def check_user_id(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError('user_id должен быть положительным числом')
+        return value
+
+
+class TravelRef(BaseModel):
+    travel_id: int
+    status: str | None = Field(default=None, description="Статус путешествия")
+
+    @field_validator('travel_id')
+    @classmethod
+    def check_travel_id(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError('travel_id должен быть положительным числом')
+        return value
+
+
+class CityRef(BaseModel):
+    city_id: int
+    name: str | None = Field(default=None, description="Название города")
+
+    @field_validator('city_id')
+    @classmethod
+    def check_city_id(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError('city_id должен быть положительным числом')
+        return value
@@ -8,13 +8,14 @@ from pydantic import ValidationInfo
 from pydantic import field_validator
 
 from models.directory_route import DirectoryRoute
+from models.reference import TravelRef
 from models.travel import Travel
 
 
 class Route(BaseModel):
     route_id: int
     d_route: DirectoryRoute | None = Field(default=None, description="Справочник маршрутов")
-    travels: Travel | None = Field(default=None, description="Путешествие")
+    travels: Travel | TravelRef | None = Field(default=None, description="Путешествие")
     start_time: datetime 
     end_time: datetime 
 
@@ -42,7 +43,7 @@ class Route(BaseModel):
 
     @field_validator('travels')
     @classmethod
-    def check_users(cls, value: Travel | None) -> Travel | None:
-        if value is not None and not isinstance(value, Travel):
+    def check_users(cls, value: Travel | TravelRef | None) -> Travel | TravelRef | None:
+        if value is not None and not isinstance(value, Travel | TravelRef):
             raise ValueError('travels должен быть экземпляром Travel')
         return value
\ No newline at end of file
@@ -6,13 +6,14 @@ from pydantic import field_validator
 
 from models.accommodation import Accommodation
 from models.entertainment import Entertainment
+from models.reference import UserRef
 from models.user import User
 
 
 class Travel(BaseModel):
     travel_id: int
     status: str
-    users: User | None = Field(default=None, description="ID пользователя")
+    users: User | UserRef | None = Field(default=None, description="ID пользователя")
     entertainments: list[Entertainment] = Field(default_factory=list, description="Список развлечения")
     accommodations: list[Accommodation] = Field(default_factory=list, description="Список размещения")
 
@@ -33,8 +34,8 @@ class Travel(BaseModel):
     
     @field_validator('users')
     @classmethod
-    def check_users(cls, value: User | None) -> User | None:
-        if value is not None and not isinstance(value, User):
+    def check_users(cls, value: User | UserRef | None) -> User | UserRef | None:
+        if value is not None and not isinstance(value, User | UserRef):
             raise ValueError('route должен быть экземпляром User')
         return value
 
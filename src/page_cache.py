@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from metrics import metrics
+from table_versions import table_versions
+
+
+type PageKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    tables: tuple[str, ...]
+    expires_at: float
+
+
+class PageCache:
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._pages: OrderedDict[PageKey, CachedPage] = OrderedDict()
+        self._keys_by_table: dict[str, set[PageKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def configure(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._evict()
+
+    def get(self, key: PageKey) -> bytes | None:
+        page = self._pages.get(key)
+        if page is not None and page.expires_at <= time.monotonic():
+            self._remove(key)
+            page = None
+        if page is None:
+            metrics.increment("page_cache.misses")
+            return None
+        self._pages.move_to_end(key)
+        metrics.increment("page_cache.hits")
+        return page.body
+
+    def put(self, key: PageKey, body: bytes, tables: Iterable[str]) -> None:
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return
+        self._remove(key)
+        page = CachedPage(body=body, tables=tuple(tables), expires_at=time.monotonic() + self.ttl)
+        self._pages[key] = page
+        for table in page.tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+        self._evict()
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            for key in self._keys_by_table.pop(table, set()):
+                self._remove(key)
+                metrics.increment("page_cache.invalidations")
+
+    def clear(self) -> None:
+        self._pages.clear()
+        self._keys_by_table.clear()
+
+    def _evict(self) -> None:
+        while len(self._pages) > max(self.max_entries, 0):
+            key = next(iter(self._pages))
+            self._remove(key)
+            metrics.increment("page_cache.evictions")
+
+    def _remove(self, key: PageKey) -> None:
+        page = self._pages.pop(key, None)
+        if page is None:
+            return
+        for table in page.tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+
+page_cache = PageCache()
+table_versions.subscribe(page_cache.invalidate)
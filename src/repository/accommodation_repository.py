@@ -1,65 +1,118 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from collections.abc import Collection
+
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.iaccommodation_repository import IAccommodationRepository
+from cache.entity import EntityCache
+from database import ScopedSession
+from database import get_identity_map
 from models.accommodation import Accommodation
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
+from repository import statements
+from repository.loader import get_loader
+from repository.projection import Projection
+from repository.table_stats_repository import get_cache_version
+
+
+accommodation_cache = EntityCache("accommodation", Accommodation)
 
 
 class AccommodationRepository(IAccommodationRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession | ScopedSession):
         self.session = session
 
+    @staticmethod
+    def from_row(row: RowMapping) -> Accommodation:
+        return Accommodation(
+            accommodation_id=row["id"],
+            price=row["price"],
+            address=row["address"],
+            name=row["name"],
+            type=row["type"],
+            rating=row["rating"],
+            check_in=row["check_in"],
+            check_out=row["check_out"]
+        )
+
     async def get_list(self) -> list[Accommodation]:
-        query = text("SELECT * FROM accommodations ORDER BY id")
+        query = statements.ACCOMMODATION_GET_LIST
         try:
             result = await self.session.execute(query)
-            result = result.mappings()
-            return [
-                Accommodation(
-                    accommodation_id=row["id"],
-                    price=row["price"],
-                    address=row["address"],
-                    name=row["name"],
-                    type=row["type"],
-                    rating=row["rating"],
-                    check_in=row["check_in"],
-                    check_out=row["check_out"])
-                
-                for row in result
-            ]
+            identity_map = get_identity_map(self.session)
+            return [identity_map.resolve(Accommodation, row["id"], self.from_row, row) for row in result.mappings()]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка размещения: {e}")
             return []
 
-    async def get_by_id(self, accommodation_id: int) -> Accommodation | None:
-        query = text("SELECT * FROM accommodations WHERE id = :accommodation_id")
+    @staticmethod
+    def _projection(fields: Collection[str]) -> Projection[Accommodation]:
+        return Projection(Accommodation, statements.ACCOMMODATION_FIELD_COLUMNS, "accommodation_id", fields)
+
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[Accommodation]:
+        params = {"after_id": after_id, "limit": limit + 1}
+        projection = self._projection(fields) if fields is not None else None
         try:
-            result = await self.session.execute(query, {"accommodation_id": accommodation_id})
-            result = result.mappings().first()
-            if result:
-                return Accommodation(
-                    accommodation_id=result["id"],
-                    price=result["price"],
-                    address=result["address"],
-                    name=result["name"],
-                    type=result["type"],
-                    rating=result["rating"],
-                    check_in=result["check_in"],
-                    check_out=result["check_out"])
-            return None
+            if projection is None:
+                result = await self.session.execute(statements.ACCOMMODATION_GET_PAGE, params)
+                identity_map = get_identity_map(self.session)
+                items = [
+                    identity_map.resolve(Accommodation, row["id"], self.from_row, row) for row in result.mappings()
+                ]
+            else:
+                result = await self.session.execute(projection.statement("accommodation.get_page"), params)
+                items = [projection.construct(row) for row in result.mappings()]
+            return Page.from_items(items, limit, lambda item: item.accommodation_id)
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении страницы размещения после ID {after_id}: {e}")
+            return Page()
+
+    async def get_by_id(self, accommodation_id: int, fields: Collection[str] | None = None) -> Accommodation | None:
+        if fields is None:
+            return await get_loader(self.session, self.get_by_ids).load(accommodation_id)
+        projection = self._projection(fields)
+        try:
+            query = projection.statement("accommodation.get_by_id")
+            result = await self.session.execute(query, {"id": accommodation_id})
+            row = result.mappings().first()
+            return projection.construct(row) if row else None
         except SQLAlchemyError as e:
             print(f"Ошибка при получении размещения по ID {accommodation_id}: {e}")
             return None
 
+    async def get_by_ids(self, accommodation_ids: list[int]) -> dict[int, Accommodation]:
+        query = statements.ACCOMMODATION_GET_BY_IDS
+        identity_map = get_identity_map(self.session)
+        accommodations, missing = identity_map.find(Accommodation, accommodation_ids)
+        if not missing:
+            return accommodations
+        version = await get_cache_version(self.session, "accommodations")
+        cached, missing = ({}, missing) if version is None else await accommodation_cache.get_many(missing, version)
+        for accommodation_id, accommodation in cached.items():
+            accommodations[accommodation_id] = identity_map.add(Accommodation, accommodation_id, accommodation)
+        if not missing:
+            return accommodations
+        try:
+            result = await self.session.execute(query, {"accommodation_ids": missing})
+            loaded = {
+                row["id"]: identity_map.add(Accommodation, row["id"], self.from_row(row)) for row in result.mappings()
+            }
+            accommodations.update(loaded)
+            if version is not None:
+                await accommodation_cache.set_many(loaded, version)
+            return accommodations
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении размещения по ID {accommodation_ids}: {e}")
+            return accommodations
+
     async def add(self, accommodation: Accommodation) -> None:
-        query = text("""
-            INSERT INTO accommodations (price, address, name, type, rating, check_in, check_out)
-            VALUES (:price, :address, :name, :type, :rating, :check_in, :check_out)
-        """)
+        query = statements.ACCOMMODATION_ADD
         try:
             await self.session.execute(query, {
                 "price": accommodation.price,
@@ -79,17 +132,7 @@ class AccommodationRepository(IAccommodationRepository):
             await self.session.rollback()
 
     async def update(self, update_accommodation: Accommodation) -> None:
-        query = text("""
-            UPDATE accommodations
-            SET price = :price,
-                address = :address,
-                name = :name,
-                type = :type,
-                rating = :rating,
-                check_in = :check_in,
-                check_out = :check_out
-            WHERE id = :accommodation_id
-        """)
+        query = statements.ACCOMMODATION_UPDATE
         try:
             await self.session.execute(query, {
                     "price": update_accommodation.price,
@@ -106,7 +149,7 @@ class AccommodationRepository(IAccommodationRepository):
             print(f"Ошибка при обновлении размещения с ID {update_accommodation.accommodation_id}: {e}")
             
     async def delete(self, accommodation_id: int) -> None:
-        query = text("DELETE FROM accommodations WHERE id = :accommodation_id")
+        query = statements.ACCOMMODATION_DELETE
         try:
             await self.session.execute(query, {"accommodation_id": accommodation_id})
             await self.session.commit()
@@ -1,51 +1,85 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.icity_repository import ICityRepository
+from city_cache import city_cache
+from database import ScopedSession
+from database import get_identity_map
+from directory_route_cache import directory_route_cache
 from models.city import City
+from repository import statements
+from repository.loader import get_loader
 
 
 class CityRepository(ICityRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession | ScopedSession):
         self.session = session
 
+    @staticmethod
+    def from_row(row: RowMapping) -> City:
+        return City(
+            city_id=row["city_id"],
+            name=row["name"]
+        )
+
     async def get_list(self) -> list[City]:
-        query = text("SELECT * FROM city")
+        query = statements.CITY_GET_LIST
         try:
             result = await self.session.execute(query)
-            return [
-                City(
-                    city_id=row["city_id"],
-                    name=row["name"]
-                )
-                for row in result.mappings()
-            ]
+            identity_map = get_identity_map(self.session)
+            return [identity_map.resolve(City, row["city_id"], self.from_row, row) for row in result.mappings()]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка городов: {e}")
             return []
 
     async def get_by_id(self, city_id: int) -> City | None:
-        query = text("SELECT * FROM city WHERE city_id = :city_id")
+        return await get_loader(self.session, self.get_by_ids).load(city_id)
+
+    async def get_by_ids(self, city_ids: list[int]) -> dict[int, City]:
+        query = statements.CITY_GET_BY_IDS
+        cities, missing = city_cache.find(city_ids)
+        if not missing:
+            return cities
+        identity_map = get_identity_map(self.session)
+        mapped, missing = identity_map.find(City, missing)
+        cities.update(mapped)
+        if not missing:
+            return cities
+        try:
+            result = await self.session.execute(query, {"city_ids": missing})
+            for row in result.mappings():
+                cities[row["city_id"]] = identity_map.add(City, row["city_id"], self.from_row(row))
+            return cities
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении городов по ID {city_ids}: {e}")
+            return cities
+
+    async def get_by_name(self, name: str) -> City | None:
+        city = city_cache.get_by_name(name)
+        if city is not None:
+            return city
+        query = statements.CITY_GET_BY_NAME
         try:
-            result = await self.session.execute(query, {"city_id": city_id})
-            result = result.mappings().first()
-            return result if result else None
+            result = await self.session.execute(query, {"name": name})
+            row = result.mappings().first()
+            if row is None:
+                return None
+            return self.from_row(row)
         except SQLAlchemyError as e:
-            print(f"Ошибка при получении пользователя по ID {city_id}: {e}")
+            print(f"Ошибка при получении города по названию '{name}': {e}")
             return None
 
     async def add(self, city: City) -> None:
-        query = text("""
-            INSERT INTO city (name)
-            VALUES (:name)
-        """)
+        query = statements.CITY_ADD
         try:
-            await self.session.execute(query, {"name": city.name})
+            result = await self.session.execute(query, {"name": city.name})
+            city_id = result.scalar_one()
             await self.session.commit()
+            city_cache.put(City(city_id=city_id, name=city.name))
         except IntegrityError:
             print(f"Ошибка: город '{city.name}' уже существует в базе данных.")
             await self.session.rollback()
@@ -54,26 +88,30 @@ class CityRepository(ICityRepository):
             await self.session.rollback()
 
     async def update(self, update_city: City) -> None:
-        query = text("""
-            UPDATE city
-            SET name = :name
-            WHERE city_id = :city_id
-        """)
+        query = statements.CITY_UPDATE
         try:
-            await self.session.execute(query, {
+            result = await self.session.execute(query, {
                 "city_id": update_city.city_id,
                 "name": update_city.name
             })
+            updated = result.first() is not None
             await self.session.commit()
+            if updated:
+                city_cache.put(update_city.model_copy())
+            else:
+                city_cache.discard(update_city.city_id)
+            directory_route_cache.invalidate()
         except SQLAlchemyError as e:
             await self.session.rollback()
             print(f"Ошибка при обновлении города с ID {update_city.city_id}: {e}")
 
     async def delete(self, city_id: int) -> None:
-        query = text("DELETE FROM city WHERE city_id = :city_id")
+        query = statements.CITY_DELETE
         try:
             await self.session.execute(query, {"city_id": city_id})
             await self.session.commit()
+            city_cache.discard(city_id)
+            directory_route_cache.invalidate()
         except SQLAlchemyError as e:
             print(f"Ошибка при удалении города с ID {city_id}: {e}")
 
@@ -1,70 +1,118 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from collections.abc import AsyncIterator
+
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.idirectory_route_repository import IDirectoryRouteRepository
+from city_cache import city_cache
+from database import ScopedSession
+from database import get_identity_map
+from database import is_pinned_to_primary
+from directory_route_cache import directory_route_cache
+from identity_map import IdentityMap
+from models.city import City
 from models.directory_route import DirectoryRoute
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
+from repository import statements
 from repository.city_repository import CityRepository
+from repository.loader import get_loader
+
+
+STREAM_BATCH_SIZE = 500
 
 
 class DirectoryRouteRepository(IDirectoryRouteRepository):
-    def __init__(self, session: AsyncSession, city_repo: CityRepository):
+    def __init__(self, session: AsyncSession | ScopedSession, city_repo: CityRepository):
         self.session = session
         self.city_repo = city_repo
 
+    @staticmethod
+    def _joined_city(row: RowMapping, column: str, identity_map: IdentityMap) -> City | None:
+        name = row[f"{column}_name"]
+        if name is None:
+            return None
+        city_id = row[column]
+        city = city_cache.get(city_id)
+        if city is None or city.name != name:
+            city = identity_map.get(City, city_id) or identity_map.add(City, city_id, City(city_id=city_id, name=name))
+        return city
+
+    @classmethod
+    def from_row(cls, row: RowMapping, identity_map: IdentityMap, id_column: str = "id") -> DirectoryRoute:
+        d_route_id = row[id_column]
+        d_route = identity_map.get(DirectoryRoute, d_route_id)
+        if d_route is None:
+            d_route = identity_map.add(DirectoryRoute, d_route_id, DirectoryRoute(
+                d_route_id=d_route_id,
+                type_transport=row["type_transport"],
+                cost=row["price"],
+                distance=row["distance"],
+                departure_city=cls._joined_city(row, "departure_city", identity_map),
+                destination_city=cls._joined_city(row, "arrival_city", identity_map)
+            ))
+        return d_route
+
     async def get_list(self) -> list[DirectoryRoute]:
-        query = text("SELECT * FROM directory_route")
+        query = statements.DIRECTORY_ROUTE_GET_LIST
         try:
             result = await self.session.execute(query)
-            result = result.mappings()
-            return [
-                DirectoryRoute(
-                    d_route_id=row["id"],
-                    type_transport=row["type_transport"],
-                    cost=row["price"],
-                    distance=row["distance"],
-                    departure_city=await self.city_repo.get_by_id(row["departure_city"]),
-                    destination_city=await self.city_repo.get_by_id(row["arrival_city"])
-                )
-                for row in result
-            ]
+            identity_map = get_identity_map(self.session)
+            return [self.from_row(row, identity_map) for row in result.mappings()]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка справочника маршрутов: {e}")
             return []
 
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Page[DirectoryRoute]:
+        query = statements.DIRECTORY_ROUTE_GET_PAGE
+        try:
+            result = await self.session.execute(query, {"after_id": after_id, "limit": limit + 1})
+            identity_map = get_identity_map(self.session)
+            items = [self.from_row(row, identity_map) for row in result.mappings()]
+            return Page.from_items(items, limit, lambda item: item.d_route_id)
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении страницы справочника маршрутов после ID {after_id}: {e}")
+            return Page()
+
+    async def stream_list(self, batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[DirectoryRoute]:
+        query = statements.DIRECTORY_ROUTE_GET_LIST.execution_options(yield_per=batch_size)
+        try:
+            result = await self.session.stream(query)
+            async for row in result.mappings():
+                yield self.from_row(row, IdentityMap())
+        except SQLAlchemyError as e:
+            print(f"Ошибка при потоковом чтении справочника маршрутов: {e}")
+
     async def get_by_id(self, directory_route_id: int) -> DirectoryRoute | None:
-        query = text("SELECT * FROM directory_route WHERE id = :directory_route_id")
+        return await get_loader(self.session, self.get_by_ids).load(directory_route_id)
+
+    async def get_by_ids(self, directory_route_ids: list[int]) -> dict[int, DirectoryRoute]:
+        query = statements.DIRECTORY_ROUTE_GET_BY_IDS
+        if not is_pinned_to_primary() and (snapshot := directory_route_cache.snapshot()) is not None:
+            return {d_route_id: d_route for d_route_id in directory_route_ids
+                    if (d_route := snapshot.get(d_route_id)) is not None}
+        identity_map = get_identity_map(self.session)
+        d_routes, missing = identity_map.find(DirectoryRoute, directory_route_ids)
+        if not missing:
+            return d_routes
         try:
-            result = await self.session.execute(query, {"directory_route_id": directory_route_id})
-            result = result.mappings().first()
-            if result:
-                departure_city = await self.city_repo.get_by_id(result["departure_city"])
-                destination_city = await self.city_repo.get_by_id(result["arrival_city"])
-
-                return DirectoryRoute(
-                    d_route_id=result["id"],
-                    type_transport=result["type_transport"],
-                    cost=result["price"],
-                    distance=result["distance"],
-                    departure_city=departure_city,
-                    destination_city=destination_city
-                )
-            return None
+            result = await self.session.execute(query, {"directory_route_ids": missing})
+            for row in result.mappings():
+                d_routes[row["id"]] = self.from_row(row, identity_map)
+            return d_routes
         except SQLAlchemyError as e:
-            print(f"Ошибка при получении справочника маршрутов по ID {directory_route_id}: {e}")
-            return None
+            print(f"Ошибка при получении справочника маршрутов по ID {directory_route_ids}: {e}")
+            return d_routes
 
     async def add(self, directory_route: DirectoryRoute) -> None:
         if directory_route.departure_city is None or directory_route.destination_city is None:
             print("Ошибка: Отсутствуют данные о городах")
             return
-        query = text("""
-            INSERT INTO directory_route (type_transport, price, distance, departure_city, arrival_city)
-            VALUES (:type_transport, :price, :distance, :departure_city, :arrival_city)
-        """)
+        query = statements.DIRECTORY_ROUTE_ADD
         try:
             await self.session.execute(query, {
             "type_transport": directory_route.type_transport,
@@ -74,6 +122,7 @@ class DirectoryRouteRepository(IDirectoryRouteRepository):
             "arrival_city": directory_route.destination_city.city_id
             })
             await self.session.commit()
+            directory_route_cache.invalidate()
         except IntegrityError:
             print("Ошибка: такой справочник маршрута уже существует.")
             await self.session.rollback()
@@ -85,15 +134,7 @@ class DirectoryRouteRepository(IDirectoryRouteRepository):
         if update_directory_route.departure_city is None or update_directory_route.destination_city is None:
             print("Ошибка: Отсутствуют данные о городах")
             return
-        query = text("""
-            UPDATE directory_route
-            SET type_transport = :type_transport,
-                price = :price,
-                distance = :distance,
-                departure_city = :departure_city,
-                arrival_city = :arrival_city
-            WHERE id = :directory_route_id
-        """)
+        query = statements.DIRECTORY_ROUTE_UPDATE
         try:
             await self.session.execute(query, {
                 "type_transport": update_directory_route.type_transport,
@@ -104,53 +145,37 @@ class DirectoryRouteRepository(IDirectoryRouteRepository):
                 "directory_route_id": update_directory_route.d_route_id
             })
             await self.session.commit()
+            directory_route_cache.invalidate()
         except SQLAlchemyError as e:
             print(f"Ошибка при обновлении справочника маршрутов с ID {update_directory_route.d_route_id}: {e}")
             
     async def delete(self, directory_route_id: int) -> None:
-        query = text("DELETE FROM directory_route WHERE id = :directory_route_id")
+        query = statements.DIRECTORY_ROUTE_DELETE
         try:
             await self.session.execute(query, {"directory_route_id": directory_route_id})
             await self.session.commit()
+            directory_route_cache.invalidate()
         except SQLAlchemyError as e:
             print(f"Ошибка при удалении справочника маршрутов с ID {directory_route_id}: {e}")
 
     async def get_by_cities(self, from_city_id: int, to_city_id: int) -> DirectoryRoute | None:
-        query = text("""
-            SELECT * FROM directory_route 
-            WHERE departure_city = :from_id AND arrival_city = :to_id
-        """)
+        if not is_pinned_to_primary() and (snapshot := directory_route_cache.snapshot()) is not None:
+            options = snapshot.between(from_city_id, to_city_id)
+            return options[0] if options else None
+        query = statements.DIRECTORY_ROUTE_GET_BY_CITIES
         try:
             result = await self.session.execute(query, {
                 "from_id": from_city_id,
                 "to_id": to_city_id
             })
-            result = result.mappings().first()
-            if result:
-                departure_city = await self.city_repo.get_by_id(result["departure_city"])
-                destination_city = await self.city_repo.get_by_id(result["arrival_city"])
-
-                return DirectoryRoute(
-                    d_route_id=result["id"],
-                    type_transport=result["type_transport"],
-                    cost=result["price"],
-                    distance=result["distance"],
-                    departure_city=departure_city,
-                    destination_city=destination_city
-                )
-            return None
-
+            row = result.mappings().first()
+            return self.from_row(row, get_identity_map(self.session)) if row else None
         except SQLAlchemyError:
             print("Ошибка при удалении справочника маршрутов по городам")
         return None
     
     async def change_transport(self, d_route_id: int, transport: str, cost: int) -> None:
-        query = text("""
-            UPDATE directory_route
-            SET type_transport = :type_transport,
-            price = :price,
-            WHERE id = :directory_route_id
-        """)
+        query = statements.DIRECTORY_ROUTE_CHANGE_TRANSPORT
         try:
             await self.session.execute(query, {
                 "type_transport": transport,
@@ -158,5 +183,6 @@ class DirectoryRouteRepository(IDirectoryRouteRepository):
                 "directory_route_id": d_route_id
             })
             await self.session.commit()
+            directory_route_cache.invalidate()
         except SQLAlchemyError as e:
             print(f"Ошибка при обновлении справочника маршрутов с ID {d_route_id}: {e}")
\ No newline at end of file
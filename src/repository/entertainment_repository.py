@@ -1,59 +1,114 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from collections.abc import Collection
+
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.ientertainment_repository import IEntertainmentRepository
+from cache.entity import EntityCache
+from database import ScopedSession
+from database import get_identity_map
 from models.entertainment import Entertainment
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
+from repository import statements
+from repository.loader import get_loader
+from repository.projection import Projection
+from repository.table_stats_repository import get_cache_version
+
+
+entertainment_cache = EntityCache("entertainment", Entertainment)
 
 
 class EntertainmentRepository(IEntertainmentRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession | ScopedSession):
         self.session = session
 
+    @staticmethod
+    def from_row(row: RowMapping) -> Entertainment:
+        return Entertainment(
+            entertainment_id=row["id"],
+            duration=row["duration"],
+            address=row["address"],
+            event_name=row["event_name"],
+            event_time=row["event_time"]
+        )
+
     async def get_list(self) -> list[Entertainment]:
-        query = text("SELECT * FROM entertainment ORDER BY id")
+        query = statements.ENTERTAINMENT_GET_LIST
         try:
             result = await self.session.execute(query)
-            result = result.mappings()
-            return [
-                Entertainment(
-                    entertainment_id=row["id"],
-                    duration=row["duration"],
-                    address=row["address"],
-                    event_name=row["event_name"],
-                    event_time=row["event_time"]
-                )
-                for row in result
-            ]
+            identity_map = get_identity_map(self.session)
+            return [identity_map.resolve(Entertainment, row["id"], self.from_row, row) for row in result.mappings()]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка развлечений: {e}")
             return []
 
-    async def get_by_id(self, entertainment_id: int) -> Entertainment | None:
-        query = text("SELECT * FROM entertainment WHERE id = :entertainment_id")
+    @staticmethod
+    def _projection(fields: Collection[str]) -> Projection[Entertainment]:
+        return Projection(Entertainment, statements.ENTERTAINMENT_FIELD_COLUMNS, "entertainment_id", fields)
+
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[Entertainment]:
+        params = {"after_id": after_id, "limit": limit + 1}
+        projection = self._projection(fields) if fields is not None else None
         try:
-            result = await self.session.execute(query, {"entertainment_id": entertainment_id})
-            result = result.mappings().first()
-            if result:
-                return Entertainment(
-                    entertainment_id=result["id"],
-                    duration=result["duration"],
-                    address=result["address"],
-                    event_name=result["event_name"],
-                    event_time=result["event_time"])
-            return None
-            print("Ничего не найдено")
+            if projection is None:
+                result = await self.session.execute(statements.ENTERTAINMENT_GET_PAGE, params)
+                identity_map = get_identity_map(self.session)
+                items = [
+                    identity_map.resolve(Entertainment, row["id"], self.from_row, row) for row in result.mappings()
+                ]
+            else:
+                result = await self.session.execute(projection.statement("entertainment.get_page"), params)
+                items = [projection.construct(row) for row in result.mappings()]
+            return Page.from_items(items, limit, lambda item: item.entertainment_id)
         except SQLAlchemyError as e:
-            print(f"Ошибка при получении развлечений по ID {entertainment_id}: {e}")
+            print(f"Ошибка при получении страницы развлечений после ID {after_id}: {e}")
+            return Page()
+
+    async def get_by_id(self, entertainment_id: int, fields: Collection[str] | None = None) -> Entertainment | None:
+        if fields is None:
+            return await get_loader(self.session, self.get_by_ids).load(entertainment_id)
+        projection = self._projection(fields)
+        try:
+            query = projection.statement("entertainment.get_by_id")
+            result = await self.session.execute(query, {"id": entertainment_id})
+            row = result.mappings().first()
+            return projection.construct(row) if row else None
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении развлечения по ID {entertainment_id}: {e}")
             return None
 
+    async def get_by_ids(self, entertainment_ids: list[int]) -> dict[int, Entertainment]:
+        query = statements.ENTERTAINMENT_GET_BY_IDS
+        identity_map = get_identity_map(self.session)
+        entertainments, missing = identity_map.find(Entertainment, entertainment_ids)
+        if not missing:
+            return entertainments
+        version = await get_cache_version(self.session, "entertainment")
+        cached, missing = ({}, missing) if version is None else await entertainment_cache.get_many(missing, version)
+        for entertainment_id, entertainment in cached.items():
+            entertainments[entertainment_id] = identity_map.add(Entertainment, entertainment_id, entertainment)
+        if not missing:
+            return entertainments
+        try:
+            result = await self.session.execute(query, {"entertainment_ids": missing})
+            loaded = {
+                row["id"]: identity_map.add(Entertainment, row["id"], self.from_row(row)) for row in result.mappings()
+            }
+            entertainments.update(loaded)
+            if version is not None:
+                await entertainment_cache.set_many(loaded, version)
+            return entertainments
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении развлечений по ID {entertainment_ids}: {e}")
+            return entertainments
+
     async def add(self, entertainment: Entertainment) -> None:
-        query = text("""
-            INSERT INTO entertainment (duration, address, event_name, event_time)
-            VALUES (:duration, :address, :event_name, :event_time)
-        """)
+        query = statements.ENTERTAINMENT_ADD
         try:
             await self.session.execute(query, {
                     "duration": entertainment.duration,
@@ -67,14 +122,7 @@ class EntertainmentRepository(IEntertainmentRepository):
             await self.session.rollback()
 
     async def update(self, update_entertainment: Entertainment) -> None:
-        query = text("""
-            UPDATE entertainment
-            SET duration = :duration,
-                address = :address,
-                event_name = :event_name,
-                event_time = :event_time
-            WHERE id = :entertainment_id
-        """)
+        query = statements.ENTERTAINMENT_UPDATE
         try:
             await self.session.execute(query, {
                     "entertainment_id": update_entertainment.entertainment_id,
@@ -88,7 +136,7 @@ class EntertainmentRepository(IEntertainmentRepository):
             print(f"Ошибка при обновлении развлечений с ID {update_entertainment.entertainment_id}: {e}")
             
     async def delete(self, entertainment_id: int) -> None:
-        query = text("DELETE FROM entertainment WHERE id = :entertainment_id")
+        query = statements.ENTERTAINMENT_DELETE
         try:
             await self.session.execute(query, {"entertainment_id": entertainment_id})
             await self.session.commit()
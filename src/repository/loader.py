@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterable
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import ScopedSession
+from database import current_sessions
+from metrics import metrics
+
+
+type BatchLoad[T] = Callable[[list[int]], Awaitable[dict[int, T]]]
+
+LOADERS_STATE_KEY = "loaders"
+
+
+class DataLoader[T]:
+    def __init__(self, batch_load: BatchLoad[T], scope: LoaderScope) -> None:
+        self.batch_load = batch_load
+        self.scope = scope
+        self._pending: dict[int, asyncio.Future[T | None]] = {}
+
+    async def load(self, key: int) -> T | None:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[key] = loop.create_future()
+        return await future
+
+    async def load_many(self, keys: Iterable[int]) -> list[T | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        asyncio.ensure_future(self._run_batch(pending))
+
+    async def _run_batch(self, pending: dict[int, asyncio.Future[T | None]]) -> None:
+        metrics.increment("loader.batches")
+        metrics.increment("loader.keys", len(pending))
+        try:
+            values = await self.scope.run(self.batch_load, list(pending))
+        except asyncio.CancelledError:
+            for future in pending.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class LoaderScope:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.loaders: dict[Hashable, DataLoader[Any]] = {}
+
+    def get[T](self, batch_load: BatchLoad[T]) -> DataLoader[T]:
+        loader = self.loaders.get(batch_load)
+        if loader is None:
+            loader = self.loaders[batch_load] = DataLoader(batch_load, self)
+        return loader
+
+    async def run[T](self, batch_load: BatchLoad[T], keys: list[int]) -> dict[int, T]:
+        if _running_scope.get() is self:
+            return await batch_load(keys)
+        async with self.lock:
+            token = _running_scope.set(self)
+            try:
+                return await batch_load(keys)
+            finally:
+                _running_scope.reset(token)
+
+
+_running_scope: ContextVar[LoaderScope | None] = ContextVar("running_loader_scope", default=None)
+
+
+def get_loader_scope(session: AsyncSession | ScopedSession) -> LoaderScope:
+    if isinstance(session, ScopedSession):
+        state = current_sessions().state
+        if LOADERS_STATE_KEY not in state:
+            state[LOADERS_STATE_KEY] = LoaderScope()
+        scope: LoaderScope = state[LOADERS_STATE_KEY]
+        return scope
+    if LOADERS_STATE_KEY not in session.info:
+        session.info[LOADERS_STATE_KEY] = LoaderScope()
+    session_scope: LoaderScope = session.info[LOADERS_STATE_KEY]
+    return session_scope
+
+
+def get_loader[T](session: AsyncSession | ScopedSession, batch_load: BatchLoad[T]) -> DataLoader[T]:
+    return get_loader_scope(session).get(batch_load)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+
+from pydantic import BaseModel
+from sqlalchemy import RowMapping
+from sqlalchemy import TextClause
+
+from repository import statements
+
+
+class Projection[T: BaseModel]:
+    def __init__(self, model: type[T], field_columns: Mapping[str, str], key_field: str,
+                 fields: Iterable[str]) -> None:
+        requested = {key_field, *fields}
+        unknown = requested - model.model_fields.keys()
+        if unknown:
+            raise ValueError(f"Неизвестные поля {model.__name__}: {', '.join(sorted(unknown))}")
+        self.model = model
+        self.columns = {field: field_columns[field] for field in sorted(requested) if field in field_columns}
+
+    def statement(self, key: str) -> TextClause:
+        return statements.projected(key, tuple(sorted(set(self.columns.values()))))
+
+    def construct(self, row: RowMapping) -> T:
+        return self.model.model_construct(**{field: row[column] for field, column in self.columns.items()})
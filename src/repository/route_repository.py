@@ -1,55 +1,87 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from collections.abc import Sequence
+
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.iroute_repository import IRouteRepository
+from database import ScopedSession
+from database import get_identity_map
+from database import use_primary
+from directory_route_cache import directory_route_cache
+from identity_map import IdentityMap
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
+from models.reference import TravelRef
 from models.route import Route
+from repository import statements
 from repository.directory_route_repository import DirectoryRouteRepository
 from repository.travel_repository import TravelRepository
 
 
 class RouteRepository(IRouteRepository):
-    def __init__(self, session: AsyncSession, d_route_repo: DirectoryRouteRepository, travel_repo: TravelRepository):
+    def __init__(self, session: AsyncSession | ScopedSession, d_route_repo: DirectoryRouteRepository,
+                 travel_repo: TravelRepository):
         self.session = session
         self.d_route_repo = d_route_repo
         self.travel_repo = travel_repo
 
-    async def get_list(self) -> list[Route]:
-        query = text("SELECT * FROM route")
+    @staticmethod
+    def _to_route(row: RowMapping, identity_map: IdentityMap) -> Route:
+        d_route = None
+        if row["type_transport"] is not None:
+            d_route = DirectoryRouteRepository.from_row(row, identity_map, "d_route_id")
+        travel = None
+        if row["travel_status"] is not None:
+            travel = TravelRef(travel_id=row["travel_id"], status=row["travel_status"])
+        return Route(
+            route_id=row["id"],
+            d_route=d_route,
+            travels=travel,
+            start_time=row["start_time"],
+            end_time=row["end_time"]
+        )
+
+    async def _to_routes(self, rows: Sequence[RowMapping], expand_travel: bool) -> list[Route]:
+        identity_map = get_identity_map(self.session)
+        routes = [self._to_route(row, identity_map) for row in rows]
+        if expand_travel:
+            travel_ids = list({route.travels.travel_id for route in routes if route.travels is not None})
+            travels = await self.travel_repo.get_by_ids(travel_ids)
+            for route in routes:
+                if route.travels is not None:
+                    route.travels = travels.get(route.travels.travel_id)
+        return routes
+
+    async def get_list(self, expand_travel: bool = False) -> list[Route]:
+        query = statements.ROUTE_GET_LIST
         try:
             result = await self.session.execute(query)
-            result = result.mappings()
-            return [
-                Route(
-                    route_id=row["id"],
-                    d_route=await self.d_route_repo.get_by_id(row["d_route_id"]),
-                    travels=await self.travel_repo.get_by_id(row["travel_id"]),
-                    start_time=row["start_time"],
-                    end_time=row["end_time"]
-                )
-                for row in result
-            ]
+            return await self._to_routes(result.mappings().all(), expand_travel)
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка маршрутов: {e}")
             return []
 
-    async def get_by_id(self, route_id: int) -> Route | None:
-        query = text("SELECT * FROM route WHERE id = :route_id")
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       expand_travel: bool = False) -> Page[Route]:
+        query = statements.ROUTE_GET_PAGE
+        try:
+            result = await self.session.execute(query, {"after_id": after_id, "limit": limit + 1})
+            routes = await self._to_routes(result.mappings().all(), expand_travel)
+            return Page.from_items(routes, limit, lambda route: route.route_id)
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении страницы маршрутов после ID {after_id}: {e}")
+            return Page()
+
+    async def get_by_id(self, route_id: int, expand_travel: bool = False) -> Route | None:
+        query = statements.ROUTE_GET_BY_ID
         try:
             result = await self.session.execute(query, {"route_id": route_id})
-            result = result.mappings().first()
-            if result:
-                return Route(
-                    route_id=result["id"],
-                    d_route=await self.d_route_repo.get_by_id(result["d_route_id"]),
-                    travels=await self.travel_repo.get_by_id(result["travel_id"]),
-                    start_time=result["start_time"],
-                    end_time=result["end_time"]
-                )
-            return None
+            routes = await self._to_routes(result.mappings().all(), expand_travel)
+            return routes[0] if routes else None
         except SQLAlchemyError as e:
             print(f"Ошибка при получении маршрута по ID {route_id}: {e}")
             return None
@@ -61,10 +93,7 @@ class RouteRepository(IRouteRepository):
         if route.d_route is None:
             print("Ошибка: Отсутствуют данные о справочнике путешествий")
             return
-        query = text("""
-            INSERT INTO route (d_route_id, travel_id, start_time, end_time)
-            VALUES (:d_route_id, :travel_id, :start_time, :end_time)
-        """)
+        query = statements.ROUTE_ADD
         try:
             await self.session.execute(query, {
             "d_route_id": route.d_route.d_route_id,
@@ -87,14 +116,7 @@ class RouteRepository(IRouteRepository):
         if update_route.d_route is None:
             print("Ошибка: Отсутствуют данные о справочнике путешествий")
             return
-        query = text("""
-            UPDATE route
-            SET d_route_id = :d_route_id,
-            travel_id = :travel_id,
-            start_time = :start_time,
-            end_time = :end_time
-        WHERE id = :route_id
-        """)
+        query = statements.ROUTE_UPDATE
         try:
             await self.session.execute(query, {
                 "d_route_id": update_route.d_route.d_route_id,
@@ -108,37 +130,24 @@ class RouteRepository(IRouteRepository):
             print(f"Ошибка при обновлении маршрута с ID {update_route.route_id}: {e}")
             
     async def delete(self, route_id: int) -> None:
-        query = text("DELETE FROM route WHERE id = :route_id")
+        query = statements.ROUTE_DELETE
         try:
             await self.session.execute(query, {"route_id": route_id})
             await self.session.commit()
         except SQLAlchemyError as e:
             print(f"Ошибка при удалении маршрута с ID {route_id}: {e}")
 
-    async def get_routes_by_travel_id_ordered(self, travel_id: int) -> list[Route]:
-        query = text("""
-            SELECT * FROM route 
-            WHERE travel_id = :travel_id
-            ORDER BY start_time
-        """)
+    async def get_routes_by_travel_id_ordered(self, travel_id: int, expand_travel: bool = False) -> list[Route]:
+        query = statements.ROUTE_GET_BY_TRAVEL_ORDERED
         try:
             result = await self.session.execute(query, {"travel_id": travel_id})
-            rows = result.mappings().all()
-            return [
-                Route(
-                    route_id=row["id"],
-                    d_route=await self.d_route_repo.get_by_id(row["d_route_id"]),
-                    travels=await self.travel_repo.get_by_id(row["travel_id"]),
-                    start_time=row["start_time"],
-                    end_time=row["end_time"]
-                )
-                for row in rows
-            ]
+            return await self._to_routes(result.mappings().all(), expand_travel)
         except SQLAlchemyError as e:
             print(f"Ошибка при получении маршрута с travel ID {travel_id}: {e}")
         return []
     
     async def insert_city_between(self, travel_id: int, new_city_id: int, from_city_id: int, to_city_id: int) -> None:
+        use_primary()
         routes = await self.get_routes_by_travel_id_ordered(travel_id)
         if not routes:
             print("Невозможно вставить город в пустой маршрут.")
@@ -187,53 +196,33 @@ class RouteRepository(IRouteRepository):
         await self.add(route2)
         await self.session.commit()
 
-    async def get_routes_by_city(self, city_id: int) -> list[Route]:
-        query = text("""
-            SELECT * 
-            FROM route r
-            JOIN directory_route dr ON r.d_route_id = dr.id
-            WHERE departure_city = :city_id OR arrival_city = :city_id
-        """)
+    async def get_routes_by_city(self, city_id: int, expand_travel: bool = False) -> list[Route]:
+        query = statements.ROUTE_GET_BY_CITY
         try:
             result = await self.session.execute(query, {"city_id": city_id})
-            rows = result.mappings().all()
-            
-            return [
-                Route(
-                    route_id=row["id"],
-                    d_route=await self.d_route_repo.get_by_id(row["d_route_id"]),
-                    travels=await self.travel_repo.get_by_id(row["travel_id"]),
-                    start_time=row["start_time"],
-                    end_time=row["end_time"]
-                )
-                for row in rows
-            ]
-        
+            return await self._to_routes(result.mappings().all(), expand_travel)
+
         except SQLAlchemyError as e:
             print(f"Ошибка при получении маршрутов для города с ID {city_id}: {e}")
             return []
 
     async def delete_city_from_route(self, city_id: int) -> None:
+        use_primary()
         routes = await self.get_routes_by_city(city_id)
         for route in routes:
             await self.delete(route.route_id)
-        query = text("""
-            DELETE FROM directory_route
-            WHERE departure_city = :city_id OR arrival_city = :city_id
-        """)
+        query = statements.DIRECTORY_ROUTE_DELETE_BY_CITY
         try:
             await self.session.execute(query, {"city_id": city_id})
             await self.session.commit()
+            directory_route_cache.invalidate()
         except SQLAlchemyError as e:
             print(f"Ошибка при удалении записей из directory_route для города с ID {city_id}: {e}")
 
     async def change_transport(self, route_id: int, new_transport: str, new_price: int) -> None:
+        use_primary()
         try:
-            route_query = text("""
-                SELECT * 
-                FROM travel_db.route 
-                WHERE id = :route_id
-            """)
+            route_query = statements.ROUTE_GET_D_ROUTE_ID
             result = await self.session.execute(route_query, {"route_id": route_id})
             route = result.mappings().first()
 
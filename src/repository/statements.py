@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import re
+
+from functools import cache
+from typing import Any
+
+from sqlalchemy import ARRAY
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import TextClause
+from sqlalchemy import bindparam
+from sqlalchemy import text
+from sqlalchemy.types import TypeEngine
+
+from database import PRIMARY_OPTION
+from database import READ_ONLY_OPTION
+from database import WRITES_OPTION
+
+
+REGISTRY: dict[str, TextClause] = {}
+WRITTEN_TABLE = re.compile(r"\b(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+(\w+)", re.IGNORECASE)
+
+
+def _statement(key: str, sql: str, /, **params: TypeEngine[Any] | type[TypeEngine[Any]]) -> TextClause:
+    if key in REGISTRY:
+        raise ValueError(f"Запрос {key} уже зарегистрирован")
+    clause = text(sql).bindparams(*(bindparam(param, type_=type_) for param, type_ in params.items()))
+    if tables := tuple(dict.fromkeys(WRITTEN_TABLE.findall(sql))):
+        clause = clause.execution_options(**{WRITES_OPTION: tables})
+    REGISTRY[key] = clause
+    return clause
+
+
+def _query(key: str, sql: str, /, **params: TypeEngine[Any] | type[TypeEngine[Any]]) -> TextClause:
+    clause = _statement(key, sql, **params).execution_options(**{READ_ONLY_OPTION: True})
+    REGISTRY[key] = clause
+    return clause
+
+
+def _primary_query(key: str, sql: str, /, **params: TypeEngine[Any] | type[TypeEngine[Any]]) -> TextClause:
+    clause = _query(key, sql, **params).execution_options(**{PRIMARY_OPTION: True})
+    REGISTRY[key] = clause
+    return clause
+
+
+USER_COLUMNS = "id, full_name, passport, phone, email, username, password"
+ACCOMMODATION_COLUMNS = "id, price, address, name, type, rating, check_in, check_out"
+ENTERTAINMENT_COLUMNS = "id, duration, address, event_name, event_time"
+CITY_COLUMNS = "city_id, name"
+USER_FIELD_COLUMNS = {
+    "user_id": "id",
+    "fio": "full_name",
+    "number_passport": "passport",
+    "phone_number": "phone",
+    "email": "email",
+    "login": "username",
+    "password": "password"
+}
+ACCOMMODATION_FIELD_COLUMNS = {
+    "accommodation_id": "id",
+    "price": "price",
+    "address": "address",
+    "name": "name",
+    "type": "type",
+    "rating": "rating",
+    "check_in": "check_in",
+    "check_out": "check_out"
+}
+ENTERTAINMENT_FIELD_COLUMNS = {
+    "entertainment_id": "id",
+    "duration": "duration",
+    "address": "address",
+    "event_name": "event_name",
+    "event_time": "event_time"
+}
+DIRECTORY_ROUTE_CITY_COLUMNS = """
+    dr.id, dr.type_transport, dr.price, dr.distance,
+    dr.departure_city, dc.name AS departure_city_name,
+    dr.arrival_city, ac.name AS arrival_city_name
+"""
+DIRECTORY_ROUTE_CITY_JOINS = """
+    FROM directory_route dr
+    LEFT JOIN city dc ON dc.city_id = dr.departure_city
+    LEFT JOIN city ac ON ac.city_id = dr.arrival_city
+"""
+TRAVEL_USER_COLUMNS = "t.id, t.status, t.user_id, u.full_name"
+ROUTE_DETAIL_COLUMNS = """
+    r.id, r.d_route_id, r.travel_id, r.start_time, r.end_time,
+    dr.type_transport, dr.price, dr.distance,
+    dr.departure_city, dc.name AS departure_city_name,
+    dr.arrival_city, ac.name AS arrival_city_name,
+    t.status AS travel_status
+"""
+ROUTE_DETAIL_JOINS = """
+    FROM route r
+    LEFT JOIN directory_route dr ON dr.id = r.d_route_id
+    LEFT JOIN city dc ON dc.city_id = dr.departure_city
+    LEFT JOIN city ac ON ac.city_id = dr.arrival_city
+    LEFT JOIN travel t ON t.id = r.travel_id
+"""
+
+
+USER_GET_LIST = _query("user.get_list", f"SELECT {USER_COLUMNS} FROM users")
+USER_GET_PAGE = _query("user.get_page", f"""
+    SELECT {USER_COLUMNS} FROM users WHERE id > :after_id ORDER BY id LIMIT :limit
+""", after_id=Integer, limit=Integer)
+USER_GET_BY_IDS = _query("user.get_by_ids", f"SELECT {USER_COLUMNS} FROM users WHERE id = ANY(:user_ids)",
+                         user_ids=ARRAY(Integer))
+USER_GET_BY_LOGIN = _query("user.get_by_login", f"SELECT {USER_COLUMNS} FROM users WHERE username = :login",
+                           login=String)
+USER_ADD = _statement("user.add", """
+    INSERT INTO users (full_name, passport, phone, email, username, password)
+    VALUES (:full_name, :passport, :phone, :email, :username, :password)
+""", full_name=String, passport=String, phone=String, email=String, username=String, password=String)
+USER_UPDATE = _statement("user.update", """
+    UPDATE users
+    SET full_name = :fio,
+        passport = :number_passport,
+        phone = :phone_number,
+        email = :email,
+        username = :login,
+        password = :password
+    WHERE id = :user_id
+""", fio=String, number_passport=String, phone_number=String, email=String, login=String, password=String,
+    user_id=Integer)
+USER_DELETE = _statement("user.delete", "DELETE FROM users WHERE id = :user_id", user_id=Integer)
+
+
+ACCOMMODATION_GET_LIST = _query("accommodation.get_list",
+                                f"SELECT {ACCOMMODATION_COLUMNS} FROM accommodations ORDER BY id")
+ACCOMMODATION_GET_PAGE = _query("accommodation.get_page", f"""
+    SELECT {ACCOMMODATION_COLUMNS} FROM accommodations WHERE id > :after_id ORDER BY id LIMIT :limit
+""", after_id=Integer, limit=Integer)
+ACCOMMODATION_GET_BY_IDS = _query("accommodation.get_by_ids", f"""
+    SELECT {ACCOMMODATION_COLUMNS} FROM accommodations WHERE id = ANY(:accommodation_ids)
+""", accommodation_ids=ARRAY(Integer))
+ACCOMMODATION_ADD = _statement("accommodation.add", """
+    INSERT INTO accommodations (price, address, name, type, rating, check_in, check_out)
+    VALUES (:price, :address, :name, :type, :rating, :check_in, :check_out)
+""", price=Integer, address=String, name=String, type=String, rating=Integer, check_in=DateTime,
+    check_out=DateTime)
+ACCOMMODATION_UPDATE = _statement("accommodation.update", """
+    UPDATE accommodations
+    SET price = :price,
+        address = :address,
+        name = :name,
+        type = :type,
+        rating = :rating,
+        check_in = :check_in,
+        check_out = :check_out
+    WHERE id = :accommodation_id
+""", price=Integer, address=String, name=String, type=String, rating=Integer, check_in=DateTime,
+    check_out=DateTime, accommodation_id=Integer)
+ACCOMMODATION_DELETE = _statement("accommodation.delete", "DELETE FROM accommodations WHERE id = :accommodation_id",
+                                  accommodation_id=Integer)
+
+
+ENTERTAINMENT_GET_LIST = _query("entertainment.get_list",
+                                f"SELECT {ENTERTAINMENT_COLUMNS} FROM entertainment ORDER BY id")
+ENTERTAINMENT_GET_PAGE = _query("entertainment.get_page", f"""
+    SELECT {ENTERTAINMENT_COLUMNS} FROM entertainment WHERE id > :after_id ORDER BY id LIMIT :limit
+""", after_id=Integer, limit=Integer)
+ENTERTAINMENT_GET_BY_IDS = _query("entertainment.get_by_ids", f"""
+    SELECT {ENTERTAINMENT_COLUMNS} FROM entertainment WHERE id = ANY(:entertainment_ids)
+""", entertainment_ids=ARRAY(Integer))
+ENTERTAINMENT_ADD = _statement("entertainment.add", """
+    INSERT INTO entertainment (duration, address, event_name, event_time)
+    VALUES (:duration, :address, :event_name, :event_time)
+""", duration=String, address=String, event_name=String, event_time=DateTime)
+ENTERTAINMENT_UPDATE = _statement("entertainment.update", """
+    UPDATE entertainment
+    SET duration = :duration,
+        address = :address,
+        event_name = :event_name,
+        event_time = :event_time
+    WHERE id = :entertainment_id
+""", duration=String, address=String, event_name=String, event_time=DateTime, entertainment_id=Integer)
+ENTERTAINMENT_DELETE = _statement("entertainment.delete", "DELETE FROM entertainment WHERE id = :entertainment_id",
+                                  entertainment_id=Integer)
+
+
+CITY_GET_LIST = _query("city.get_list", f"SELECT {CITY_COLUMNS} FROM city")
+CITY_GET_BY_IDS = _query("city.get_by_ids", f"SELECT {CITY_COLUMNS} FROM city WHERE city_id = ANY(:city_ids)",
+                         city_ids=ARRAY(Integer))
+CITY_GET_BY_NAME = _query("city.get_by_name", f"SELECT {CITY_COLUMNS} FROM city WHERE lower(name) = lower(:name)",
+                          name=String)
+CITY_ADD = _statement("city.add", "INSERT INTO city (name) VALUES (:name) RETURNING city_id", name=String)
+CITY_UPDATE = _statement("city.update", "UPDATE city SET name = :name WHERE city_id = :city_id RETURNING city_id",
+                         name=String, city_id=Integer)
+CITY_DELETE = _statement("city.delete", "DELETE FROM city WHERE city_id = :city_id", city_id=Integer)
+
+
+DIRECTORY_ROUTE_GET_LIST = _query("directory_route.get_list", f"""
+    SELECT {DIRECTORY_ROUTE_CITY_COLUMNS}
+    {DIRECTORY_ROUTE_CITY_JOINS}
+    ORDER BY dr.id
+""")
+DIRECTORY_ROUTE_GET_PAGE = _query("directory_route.get_page", f"""
+    SELECT {DIRECTORY_ROUTE_CITY_COLUMNS}
+    {DIRECTORY_ROUTE_CITY_JOINS}
+    WHERE dr.id > :after_id
+    ORDER BY dr.id
+    LIMIT :limit
+""", after_id=Integer, limit=Integer)
+DIRECTORY_ROUTE_GET_BY_IDS = _query("directory_route.get_by_ids", f"""
+    SELECT {DIRECTORY_ROUTE_CITY_COLUMNS}
+    {DIRECTORY_ROUTE_CITY_JOINS}
+    WHERE dr.id = ANY(:directory_route_ids)
+""", directory_route_ids=ARRAY(Integer))
+DIRECTORY_ROUTE_GET_BY_CITIES = _query("directory_route.get_by_cities", f"""
+    SELECT {DIRECTORY_ROUTE_CITY_COLUMNS}
+    {DIRECTORY_ROUTE_CITY_JOINS}
+    WHERE dr.departure_city = :from_id AND dr.arrival_city = :to_id
+    ORDER BY dr.price, dr.id
+    LIMIT 1
+""", from_id=Integer, to_id=Integer)
+DIRECTORY_ROUTE_ADD = _statement("directory_route.add", """
+    INSERT INTO directory_route (type_transport, price, distance, departure_city, arrival_city)
+    VALUES (:type_transport, :price, :distance, :departure_city, :arrival_city)
+""", type_transport=String, price=Integer, distance=Integer, departure_city=Integer, arrival_city=Integer)
+DIRECTORY_ROUTE_UPDATE = _statement("directory_route.update", """
+    UPDATE directory_route
+    SET type_transport = :type_transport,
+        price = :price,
+        distance = :distance,
+        departure_city = :departure_city,
+        arrival_city = :arrival_city
+    WHERE id = :directory_route_id
+""", type_transport=String, price=Integer, distance=Integer, departure_city=Integer, arrival_city=Integer,
+    directory_route_id=Integer)
+DIRECTORY_ROUTE_DELETE = _statement("directory_route.delete",
+                                    "DELETE FROM directory_route WHERE id = :directory_route_id",
+                                    directory_route_id=Integer)
+DIRECTORY_ROUTE_DELETE_BY_CITY = _statement("directory_route.delete_by_city", """
+    DELETE FROM directory_route
+    WHERE departure_city = :city_id OR arrival_city = :city_id
+""", city_id=Integer)
+DIRECTORY_ROUTE_CHANGE_TRANSPORT = _statement("directory_route.change_transport", """
+    UPDATE directory_route
+    SET type_transport = :type_transport,
+        price = :price
+    WHERE id = :directory_route_id
+""", type_transport=String, price=Integer, directory_route_id=Integer)
+
+
+TRAVEL_GET_LIST = _query("travel.get_list", f"""
+    SELECT {TRAVEL_USER_COLUMNS}
+    FROM travel t
+    LEFT JOIN users u ON u.id = t.user_id
+    ORDER BY t.id
+""")
+TRAVEL_GET_PAGE = _query("travel.get_page", f"""
+    SELECT {TRAVEL_USER_COLUMNS}
+    FROM travel t
+    LEFT JOIN users u ON u.id = t.user_id
+    WHERE t.id > :after_id
+    ORDER BY t.id
+    LIMIT :limit
+""", after_id=Integer, limit=Integer)
+TRAVEL_GET_BY_IDS = _query("travel.get_by_ids", f"""
+    SELECT {TRAVEL_USER_COLUMNS}
+    FROM travel t
+    LEFT JOIN users u ON u.id = t.user_id
+    WHERE t.id = ANY(:travel_ids)
+""", travel_ids=ARRAY(Integer))
+TRAVEL_EXISTS = _query("travel.exists", "SELECT 1 FROM travel WHERE id = :travel_id", travel_id=Integer)
+TRAVEL_ADD = _statement("travel.add", """
+    INSERT INTO travel (status, user_id)
+    VALUES (:status, :user_id)
+    RETURNING id
+""", status=String, user_id=Integer)
+TRAVEL_UPDATE = _statement("travel.update", """
+    UPDATE travel
+    SET status = :status,
+        user_id = :user_id
+    WHERE id = :travel_id
+""", status=String, user_id=Integer, travel_id=Integer)
+TRAVEL_DELETE = _statement("travel.delete", "DELETE FROM travel WHERE id = :travel_id", travel_id=Integer)
+TRAVEL_COMPLETE = _statement("travel.complete", """
+    UPDATE travel
+    SET status = 'Завершен'
+    WHERE id = :travel_id
+""", travel_id=Integer)
+TRAVEL_GET_ARCHIVE = _query("travel.get_archive", f"""
+    SELECT {TRAVEL_USER_COLUMNS}
+    FROM travel t
+    LEFT JOIN users u ON u.id = t.user_id
+    WHERE t.status = 'Завершен'
+    ORDER BY t.id
+""")
+TRAVEL_GET_ARCHIVE_PAGE = _query("travel.get_archive_page", f"""
+    SELECT {TRAVEL_USER_COLUMNS}
+    FROM travel t
+    LEFT JOIN users u ON u.id = t.user_id
+    WHERE t.status = 'Завершен' AND t.id > :after_id
+    ORDER BY t.id
+    LIMIT :limit
+""", after_id=Integer, limit=Integer)
+TRAVEL_SEARCH_ORDERS = {
+    "id": "t.id",
+    "-id": "t.id DESC",
+    "status": "t.status, t.id",
+    "-status": "t.status DESC, t.id DESC"
+}
+TRAVEL_SEARCH = {
+    sort: _query(f"travel.search.{sort}", f"""
+        SELECT {TRAVEL_USER_COLUMNS}
+        FROM travel t
+        LEFT JOIN users u ON u.id = t.user_id
+        WHERE t.status != 'Завершен'
+          AND EXISTS (
+              SELECT 1
+              FROM route r
+              JOIN directory_route dr ON dr.id = r.d_route_id
+              WHERE r.travel_id = t.id
+                AND (:start_time IS NULL OR r.start_time >= :start_time)
+                AND (:end_time IS NULL OR r.end_time <= :end_time)
+                AND (:departure_city IS NULL OR dr.departure_city = :departure_city)
+                AND (:arrival_city IS NULL OR dr.arrival_city = :arrival_city)
+          )
+          AND (:entertainment_name IS NULL OR EXISTS (
+              SELECT 1
+              FROM travel_entertainment te
+              JOIN entertainment e ON e.id = te.entertainment_id
+              WHERE te.travel_id = t.id AND e.event_name ILIKE :entertainment_name
+          ))
+        ORDER BY {order}
+        LIMIT :limit OFFSET :offset
+    """, start_time=DateTime, end_time=DateTime, departure_city=Integer, arrival_city=Integer,
+        entertainment_name=String, limit=Integer, offset=Integer)
+    for sort, order in TRAVEL_SEARCH_ORDERS.items()
+}
+
+TRAVEL_ENTERTAINMENT_IDS = _query("travel.entertainment_ids", """
+    SELECT entertainment_id FROM travel_entertainment WHERE travel_id = :travel_id
+""", travel_id=Integer)
+TRAVEL_ACCOMMODATION_IDS = _query("travel.accommodation_ids", """
+    SELECT accommodation_id FROM travel_accommodations WHERE travel_id = :travel_id
+""", travel_id=Integer)
+TRAVEL_ENTERTAINMENTS_BY_TRAVELS = _query("travel.entertainments_by_travels", """
+    SELECT te.travel_id, e.id, e.duration, e.address, e.event_name, e.event_time
+    FROM travel_entertainment te
+    JOIN entertainment e ON e.id = te.entertainment_id
+    WHERE te.travel_id = ANY(:travel_ids)
+""", travel_ids=ARRAY(Integer))
+TRAVEL_ACCOMMODATIONS_BY_TRAVELS = _query("travel.accommodations_by_travels", """
+    SELECT ta.travel_id, a.id, a.price, a.address, a.name, a.type, a.rating, a.check_in, a.check_out
+    FROM travel_accommodations ta
+    JOIN accommodations a ON a.id = ta.accommodation_id
+    WHERE ta.travel_id = ANY(:travel_ids)
+""", travel_ids=ARRAY(Integer))
+TRAVEL_ADD_ENTERTAINMENT = _statement("travel.add_entertainment", """
+    INSERT INTO travel_entertainment (travel_id, entertainment_id)
+    VALUES (:travel_id, :entertainment_id)
+""", travel_id=Integer, entertainment_id=Integer)
+TRAVEL_ADD_ACCOMMODATION = _statement("travel.add_accommodation", """
+    INSERT INTO travel_accommodations (travel_id, accommodation_id)
+    VALUES (:travel_id, :accommodation_id)
+""", travel_id=Integer, accommodation_id=Integer)
+TRAVEL_DELETE_ENTERTAINMENTS = _statement("travel.delete_entertainments", """
+    DELETE FROM travel_entertainment WHERE travel_id = :travel_id
+""", travel_id=Integer)
+TRAVEL_DELETE_ACCOMMODATIONS = _statement("travel.delete_accommodations", """
+    DELETE FROM travel_accommodations WHERE travel_id = :travel_id
+""", travel_id=Integer)
+
+
+ROUTE_GET_LIST = _query("route.get_list", f"""
+    SELECT {ROUTE_DETAIL_COLUMNS}
+    {ROUTE_DETAIL_JOINS}
+    ORDER BY r.id
+""")
+ROUTE_GET_PAGE = _query("route.get_page", f"""
+    SELECT {ROUTE_DETAIL_COLUMNS}
+    {ROUTE_DETAIL_JOINS}
+    WHERE r.id > :after_id
+    ORDER BY r.id
+    LIMIT :limit
+""", after_id=Integer, limit=Integer)
+ROUTE_GET_BY_ID = _query("route.get_by_id", f"""
+    SELECT {ROUTE_DETAIL_COLUMNS}
+    {ROUTE_DETAIL_JOINS}
+    WHERE r.id = :route_id
+""", route_id=Integer)
+ROUTE_GET_BY_TRAVEL_ORDERED = _query("route.get_by_travel_ordered", f"""
+    SELECT {ROUTE_DETAIL_COLUMNS}
+    {ROUTE_DETAIL_JOINS}
+    WHERE r.travel_id = :travel_id
+    ORDER BY r.start_time
+""", travel_id=Integer)
+ROUTE_GET_BY_CITY = _query("route.get_by_city", f"""
+    SELECT {ROUTE_DETAIL_COLUMNS}
+    {ROUTE_DETAIL_JOINS}
+    WHERE dr.departure_city = :city_id OR dr.arrival_city = :city_id
+""", city_id=Integer)
+ROUTE_ADD = _statement("route.add", """
+    INSERT INTO route (d_route_id, travel_id, start_time, end_time)
+    VALUES (:d_route_id, :travel_id, :start_time, :end_time)
+""", d_route_id=Integer, travel_id=Integer, start_time=DateTime, end_time=DateTime)
+ROUTE_UPDATE = _statement("route.update", """
+    UPDATE route
+    SET d_route_id = :d_route_id,
+        travel_id = :travel_id,
+        start_time = :start_time,
+        end_time = :end_time
+    WHERE id = :route_id
+""", d_route_id=Integer, travel_id=Integer, start_time=DateTime, end_time=DateTime, route_id=Integer)
+ROUTE_DELETE = _statement("route.delete", "DELETE FROM route WHERE id = :route_id", route_id=Integer)
+ROUTE_GET_D_ROUTE_ID = _query("route.get_d_route_id", "SELECT d_route_id FROM route WHERE id = :route_id",
+                              route_id=Integer)
+
+
+HEALTH_CHECK = _statement("health.check", "SELECT 1")
+TABLE_VERSION_CREATE = _statement("table_version.create", """
+    CREATE TABLE IF NOT EXISTS table_version (
+        table_name TEXT PRIMARY KEY,
+        version BIGINT NOT NULL DEFAULT 0
+    )
+""")
+TABLE_VERSIONS_SQL = "SELECT table_name, version FROM table_version WHERE table_name = ANY(:tables)"
+TABLE_VERSIONS = _primary_query("table_version.get", TABLE_VERSIONS_SQL, tables=ARRAY(String))
+TABLE_VERSIONS_FOR_READ = _query("table_version.get_for_read", TABLE_VERSIONS_SQL, tables=ARRAY(String))
+
+
+PROJECTED_QUERIES: dict[str, tuple[str, frozenset[str], dict[str, TypeEngine[Any] | type[TypeEngine[Any]]]]] = {
+    "user.get_page": (
+        "SELECT {columns} FROM users WHERE id > :after_id ORDER BY id LIMIT :limit",
+        frozenset(USER_FIELD_COLUMNS.values()), {"after_id": Integer, "limit": Integer}
+    ),
+    "user.get_by_id": (
+        "SELECT {columns} FROM users WHERE id = :id",
+        frozenset(USER_FIELD_COLUMNS.values()), {"id": Integer}
+    ),
+    "accommodation.get_page": (
+        "SELECT {columns} FROM accommodations WHERE id > :after_id ORDER BY id LIMIT :limit",
+        frozenset(ACCOMMODATION_FIELD_COLUMNS.values()), {"after_id": Integer, "limit": Integer}
+    ),
+    "accommodation.get_by_id": (
+        "SELECT {columns} FROM accommodations WHERE id = :id",
+        frozenset(ACCOMMODATION_FIELD_COLUMNS.values()), {"id": Integer}
+    ),
+    "entertainment.get_page": (
+        "SELECT {columns} FROM entertainment WHERE id > :after_id ORDER BY id LIMIT :limit",
+        frozenset(ENTERTAINMENT_FIELD_COLUMNS.values()), {"after_id": Integer, "limit": Integer}
+    ),
+    "entertainment.get_by_id": (
+        "SELECT {columns} FROM entertainment WHERE id = :id",
+        frozenset(ENTERTAINMENT_FIELD_COLUMNS.values()), {"id": Integer}
+    )
+}
+
+
+@cache
+def projected(key: str, columns: tuple[str, ...]) -> TextClause:
+    sql, allowed, params = PROJECTED_QUERIES[key]
+    if not allowed.issuperset(columns):
+        raise ValueError(f"Недопустимые колонки для {key}: {', '.join(sorted(set(columns) - allowed))}")
+    return _query(f"{key}({', '.join(columns)})", sql.format(columns=", ".join(columns)), **params)
+
+
+HOT_STATEMENTS: tuple[tuple[TextClause, dict[str, Any]], ...] = (
+    (USER_GET_BY_IDS, {"user_ids": []}),
+    (USER_GET_BY_LOGIN, {"login": ""}),
+    (ACCOMMODATION_GET_BY_IDS, {"accommodation_ids": []}),
+    (ENTERTAINMENT_GET_BY_IDS, {"entertainment_ids": []}),
+    (CITY_GET_BY_IDS, {"city_ids": []}),
+    (DIRECTORY_ROUTE_GET_BY_IDS, {"directory_route_ids": []}),
+    (TRAVEL_GET_BY_IDS, {"travel_ids": []}),
+    (TRAVEL_ENTERTAINMENT_IDS, {"travel_id": 0}),
+    (TRAVEL_ACCOMMODATION_IDS, {"travel_id": 0}),
+    (TRAVEL_ENTERTAINMENTS_BY_TRAVELS, {"travel_ids": []}),
+    (TRAVEL_ACCOMMODATIONS_BY_TRAVELS, {"travel_ids": []}),
+    (ROUTE_GET_BY_ID, {"route_id": 0}),
+)
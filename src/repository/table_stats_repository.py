@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import Executable
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from abstract_repository.itable_stats_repository import ITableStatsRepository
+from database import ScopedSession
+from database import current_sessions
+from database import has_pending_write
+from database import reads_from_replica
+from database import use_primary
+from metrics import metrics
+from repository import statements
+
+
+READ_VERSIONS_STATE_KEY = "table_versions.read"
+
+
+async def get_cache_version(session: AsyncSession | ScopedSession, table: str) -> int | None:
+    if not isinstance(session, ScopedSession) or has_pending_write():
+        return None
+    versions: dict[str, int] = current_sessions().state.setdefault(READ_VERSIONS_STATE_KEY, {})
+    if table not in versions:
+        try:
+            result = await session.execute(statements.TABLE_VERSIONS_FOR_READ, {"tables": [table]})
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении версии таблицы {table}: {e}")
+            return None
+        versions[table] = next((row["version"] for row in result.mappings()), 0)
+    return versions[table]
+
+
+class TableStatsRepository(ITableStatsRepository):
+    def __init__(self, session: AsyncSession | ScopedSession):
+        self.session = session
+
+    async def _versions(self, query: Executable, tables: Collection[str]) -> dict[str, int]:
+        result = await self.session.execute(query, {"tables": list(tables)})
+        return {row["table_name"]: row["version"] for row in result.mappings()}
+
+    async def get_change_counts(self, tables: Collection[str]) -> dict[str, int]:
+        try:
+            versions = await self._versions(statements.TABLE_VERSIONS, tables)
+            if reads_from_replica() and await self._versions(statements.TABLE_VERSIONS_FOR_READ, tables) != versions:
+                metrics.increment("table_versions.replica_behind")
+                use_primary()
+            return {table: versions.get(table, 0) for table in tables}
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении версий таблиц {', '.join(tables)}: {e}")
+            return {}
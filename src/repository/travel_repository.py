@@ -1,117 +1,171 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.itravel_repository import ITravelRepository
+from database import ScopedSession
+from database import get_identity_map
+from database import use_primary
 from models.accommodation import Accommodation
 from models.entertainment import Entertainment
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
+from models.reference import UserRef
 from models.travel import Travel
+from repository import statements
 from repository.accommodation_repository import AccommodationRepository
 from repository.entertainment_repository import EntertainmentRepository
+from repository.loader import get_loader
 from repository.user_repository import UserRepository
 
 
 class TravelRepository(ITravelRepository):
-    def __init__(self, session: AsyncSession, user_repo: UserRepository, e_repo: EntertainmentRepository, 
-                                                                a_repo: AccommodationRepository):
+    def __init__(self, session: AsyncSession | ScopedSession, user_repo: UserRepository,
+                 e_repo: EntertainmentRepository, a_repo: AccommodationRepository):
         self.session = session
         self.user_repo = user_repo
         self.entertainment_repo = e_repo
         self.accommodation_repo = a_repo
 
     async def get_accommodations_by_travel(self, travel_id: int) -> list[Accommodation]:
-        query = text("SELECT accommodation_id FROM travel_accommodations WHERE travel_id = :travel_id")
+        query = statements.TRAVEL_ACCOMMODATION_IDS
         try:
             result = await self.session.execute(query, {"travel_id": travel_id})
-            result = result.fetchall()
-
-            end_list = []
-            for row in result:
-                acc = await self.accommodation_repo.get_by_id(row[0])
-                if acc is not None:
-                    end_list.append(acc)
-            return end_list
+            accommodation_ids = result.scalars().all()
+            loader = get_loader(self.session, self.accommodation_repo.get_by_ids)
+            return [acc for acc in await loader.load_many(accommodation_ids) if acc is not None]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении размещения для путешествия {travel_id}: {e}")
             return []
     
     async def get_entertainments_by_travel(self, travel_id: int) -> list[Entertainment]:
-        query = text("SELECT entertainment_id FROM travel_entertainment WHERE travel_id = :travel_id")
+        query = statements.TRAVEL_ENTERTAINMENT_IDS
         try:
             result = await self.session.execute(query, {"travel_id": travel_id})
-            result = result.fetchall()
-
-            ent_list = []
-            for row in result:
-                ent = await self.entertainment_repo.get_by_id(row[0])
-                if ent is not None:
-                    ent_list.append(ent)
-
-            return ent_list
+            entertainment_ids = result.scalars().all()
+            loader = get_loader(self.session, self.entertainment_repo.get_by_ids)
+            return [ent for ent in await loader.load_many(entertainment_ids) if ent is not None]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении развлечений в путешествие {travel_id}: {e}")
             return []
 
-    async def get_list(self) -> list[Travel]:
-        query = text("SELECT * FROM travel")
+    async def get_entertainments_by_travels(self, travel_ids: list[int]) -> dict[int, list[Entertainment]]:
+        query = statements.TRAVEL_ENTERTAINMENTS_BY_TRAVELS
+        entertainments: dict[int, list[Entertainment]] = defaultdict(list)
+        result = await self.session.execute(query, {"travel_ids": travel_ids})
+        identity_map = get_identity_map(self.session)
+        for row in result.mappings():
+            entertainments[row["travel_id"]].append(
+                identity_map.resolve(Entertainment, row["id"], EntertainmentRepository.from_row, row)
+            )
+        return entertainments
+
+    async def get_accommodations_by_travels(self, travel_ids: list[int]) -> dict[int, list[Accommodation]]:
+        query = statements.TRAVEL_ACCOMMODATIONS_BY_TRAVELS
+        accommodations: dict[int, list[Accommodation]] = defaultdict(list)
+        result = await self.session.execute(query, {"travel_ids": travel_ids})
+        identity_map = get_identity_map(self.session)
+        for row in result.mappings():
+            accommodations[row["travel_id"]].append(
+                identity_map.resolve(Accommodation, row["id"], AccommodationRepository.from_row, row)
+            )
+        return accommodations
+
+    @staticmethod
+    def _user_ref(row: RowMapping) -> UserRef:
+        return UserRef(user_id=row["user_id"], fio=row["full_name"])
+
+    async def expand_users(self, travels: list[Travel]) -> list[Travel]:
+        user_ids = list({travel.users.user_id for travel in travels if isinstance(travel.users, UserRef)})
+        if not user_ids:
+            return travels
+        users = await self.user_repo.get_by_ids(user_ids)
+        for travel in travels:
+            if isinstance(travel.users, UserRef):
+                travel.users = users.get(travel.users.user_id, travel.users)
+        return travels
+
+    async def _hydrate(self, rows: Sequence[RowMapping], with_details: bool = True) -> list[Travel]:
+        if not rows:
+            return []
+        identity_map = get_identity_map(self.session)
+        travels, missing = identity_map.find(Travel, [row["id"] for row in rows])
+        entertainments: dict[int, list[Entertainment]] = {}
+        accommodations: dict[int, list[Accommodation]] = {}
+        if with_details and missing:
+            entertainments = await self.get_entertainments_by_travels(missing)
+            accommodations = await self.get_accommodations_by_travels(missing)
+        for row in rows:
+            travel_id = row["id"]
+            if travel_id in travels:
+                continue
+            user = None
+            if row["full_name"] is not None:
+                user = identity_map.resolve(UserRef, row["user_id"], self._user_ref, row)
+            if not with_details:
+                travels[travel_id] = Travel(travel_id=travel_id, status=row["status"], users=user)
+                continue
+            travels[travel_id] = identity_map.add(Travel, travel_id, Travel(
+                travel_id=travel_id,
+                status=row["status"],
+                users=user,
+                entertainments=entertainments.get(travel_id, []),
+                accommodations=accommodations.get(travel_id, [])
+            ))
+        return [travels[row["id"]] for row in rows]
+
+    async def get_list(self, with_details: bool = True) -> list[Travel]:
+        query = statements.TRAVEL_GET_LIST
         try:
             result = await self.session.execute(query)
-            result = result.mappings()
-            return [
-                Travel(
-                    travel_id=row["id"],
-                    status=row["status"],
-                    users=await self.user_repo.get_by_id(row["user_id"]),
-                    entertainments=await self.get_entertainments_by_travel(row["id"]),
-                    accommodations=await self.get_accommodations_by_travel(row["id"])
-                )
-                for row in result
-            ]
+            return await self._hydrate(result.mappings().all(), with_details)
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка путешествий: {e}")
             return []
 
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       with_details: bool = True) -> Page[Travel]:
+        query = statements.TRAVEL_GET_PAGE
+        try:
+            result = await self.session.execute(query, {"after_id": after_id, "limit": limit + 1})
+            travels = await self._hydrate(result.mappings().all(), with_details)
+            return Page.from_items(travels, limit, lambda travel: travel.travel_id)
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении страницы путешествий после ID {after_id}: {e}")
+            return Page()
+
     async def get_by_id(self, travel_id: int) -> Travel | None:
-        query = text("SELECT * FROM travel WHERE id = :travel_id")
+        return await get_loader(self.session, self.get_by_ids).load(travel_id)
+
+    async def get_by_ids(self, travel_ids: list[int]) -> dict[int, Travel]:
+        query = statements.TRAVEL_GET_BY_IDS
+        travels, missing = get_identity_map(self.session).find(Travel, travel_ids)
+        if not missing:
+            return travels
         try:
-            result = await self.session.execute(query, {"travel_id": travel_id})
-            result = result.mappings().first()
-            if result:
-                return Travel(
-                    travel_id=result["id"],
-                    status=result["status"],
-                    users=await self.user_repo.get_by_id(result["user_id"]),
-                    entertainments=await self.get_entertainments_by_travel(result["id"]),
-                    accommodations=await self.get_accommodations_by_travel(result["id"])
-                )
-            return None
+            result = await self.session.execute(query, {"travel_ids": missing})
+            for travel in await self._hydrate(result.mappings().all()):
+                travels[travel.travel_id] = travel
+            return travels
         except SQLAlchemyError as e:
-            print(f"Ошибка при получении путешествия по ID {travel_id}: {e}")
-            return None
+            print(f"Ошибка при получении путешествий по ID {travel_ids}: {e}")
+            return travels
 
     async def add(self, travel: Travel) -> None:
         if travel.users is None:
             print("Ошибка: Отсутствуют данные о пользователях")
             return
-        query = text("""
-            INSERT INTO travel (status, user_id)
-            VALUES (:status, :user_id)
-            RETURNING id
-        """)
-        entertainment_query = text("""
-            INSERT INTO travel_entertainment (travel_id, entertainment_id)
-            VALUES (:travel_id, :entertainment_id)
-        """)
-
-        accommodation_query = text("""
-            INSERT INTO travel_accommodations (travel_id, accommodation_id)
-            VALUES (:travel_id, :accommodation_id)
-        """)
+        query = statements.TRAVEL_ADD
+        entertainment_query = statements.TRAVEL_ADD_ENTERTAINMENT
+        accommodation_query = statements.TRAVEL_ADD_ACCOMMODATION
 
         try:
             result = await self.session.execute(query, {
@@ -151,34 +205,14 @@ class TravelRepository(ITravelRepository):
         if update_travel.users is None:
             print("Ошибка: Отсутствуют данные о пользователях")
             return
-        check_query = text("""
-            SELECT 1 FROM travel WHERE id = :travel_id
-        """)
-        update_travel_query = text("""
-            UPDATE travel
-            SET status = :status,
-                user_id = :user_id
-            WHERE id = :travel_id
-        """)
-
-        delete_entertainments_query = text("""
-            DELETE FROM travel_entertainment WHERE travel_id = :travel_id
-        """)
-        
-        delete_accommodations_query = text("""
-            DELETE FROM travel_accommodations WHERE travel_id = :travel_id
-        """)
-
-        entertainment_query = text("""
-            INSERT INTO travel_entertainment (travel_id, entertainment_id)
-            VALUES (:travel_id, :entertainment_id)
-        """)
-
-        accommodation_query = text("""
-            INSERT INTO travel_accommodations (travel_id, accommodation_id)
-            VALUES (:travel_id, :accommodation_id)
-        """)
-
+        check_query = statements.TRAVEL_EXISTS
+        update_travel_query = statements.TRAVEL_UPDATE
+        delete_entertainments_query = statements.TRAVEL_DELETE_ENTERTAINMENTS
+        delete_accommodations_query = statements.TRAVEL_DELETE_ACCOMMODATIONS
+        entertainment_query = statements.TRAVEL_ADD_ENTERTAINMENT
+        accommodation_query = statements.TRAVEL_ADD_ACCOMMODATION
+
+        use_primary()
         try:
             result = await self.session.execute(check_query, {"travel_id": update_travel.travel_id})
             if result.fetchone() is None:
@@ -217,15 +251,9 @@ class TravelRepository(ITravelRepository):
             print(f"Ошибка при обновлении путешествия с ID {update_travel.travel_id}: {e}")
             
     async def delete(self, travel_id: int) -> None:
-        delete_entertainments_query = text("""
-            DELETE FROM travel_entertainment WHERE travel_id = :travel_id
-        """)
-
-        delete_accommodations_query = text("""
-            DELETE FROM travel_accommodations WHERE travel_id = :travel_id
-        """)
-
-        query = text("DELETE FROM travel WHERE id = :travel_id")
+        delete_entertainments_query = statements.TRAVEL_DELETE_ENTERTAINMENTS
+        delete_accommodations_query = statements.TRAVEL_DELETE_ACCOMMODATIONS
+        query = statements.TRAVEL_DELETE
         try:
             await self.session.execute(delete_entertainments_query, {"travel_id": travel_id})
             await self.session.execute(delete_accommodations_query, {"travel_id": travel_id})
@@ -234,61 +262,37 @@ class TravelRepository(ITravelRepository):
         except SQLAlchemyError as e:
             print(f"Ошибка при удалении путешествия с ID {travel_id}: {e}")
     
-    async def search(self, travel_dict: dict[str, Any]) -> list[Travel]: 
-        sql = """ SELECT DISTINCT t.* 
-        FROM travel t 
-        JOIN route r ON t.id = r.travel_id 
-        JOIN directory_route dr ON r.d_route_id = dr.id 
-        LEFT JOIN travel_entertainment te ON t.id = te.travel_id 
-        LEFT JOIN entertainment e ON te.entertainment_id = e.id 
-        WHERE t.status != 'Завершен' """ 
-        params = {}
-        if "start_time" in travel_dict:
-            sql += " AND r.start_time >= :start_time"
-            params["start_time"] = travel_dict["start_time"]
-
-        if "end_time" in travel_dict:
-            sql += " AND r.end_time <= :end_time"
-            params["end_time"] = travel_dict["end_time"]
-
-        if "departure_city" in travel_dict:
-            sql += " AND dr.departure_city = :departure_city"
-            params["departure_city"] = travel_dict["departure_city"]
-
-        if "arrival_city" in travel_dict:
-            sql += " AND dr.arrival_city = :arrival_city"
-            params["arrival_city"] = travel_dict["arrival_city"]
-
-        if "entertainment_name" in travel_dict:
-            sql += " AND e.name ILIKE :entertainment_name"
-            params["entertainment_name"] = f"%{travel_dict['entertainment_name']}%"
+    async def search(self, travel_dict: dict[str, Any], limit: int | None = None, offset: int = 0,
+                     sort: str = "id") -> list[Travel]:
+        query = statements.TRAVEL_SEARCH.get(sort)
+        if query is None:
+            raise ValueError(f"sort должен быть одним из следующих: {', '.join(statements.TRAVEL_SEARCH)}")
+        params = {
+            "start_time": self._to_datetime(travel_dict.get("start_time")),
+            "end_time": self._to_datetime(travel_dict.get("end_time")),
+            "departure_city": travel_dict.get("departure_city"),
+            "arrival_city": travel_dict.get("arrival_city"),
+            "entertainment_name": f"%{travel_dict['entertainment_name']}%"
+                                  if travel_dict.get("entertainment_name") else None,
+            "limit": limit,
+            "offset": offset
+        }
         try:
-            result = await self.session.execute(text(sql), params)
-            rows = result.mappings().all() 
-            print("rows: ", rows)
-            travels = []
-            for row in rows:
-                travel = Travel(
-                    travel_id=row["id"],
-                    status=row["status"],
-                    users=await self.user_repo.get_by_id(row["user_id"]),
-                    entertainments=await self.get_entertainments_by_travel(row["id"]),
-                    accommodations=await self.get_accommodations_by_travel(row["id"])
-                )
-                print("travel: ", travel)
-                travels.append(travel)
-
-            return travels
+            result = await self.session.execute(query, params)
+            return await self._hydrate(result.mappings().all())
         except SQLAlchemyError as e:
             print(f"Ошибка при поиске путешествий: {e}")
             return []
 
+    @staticmethod
+    def _to_datetime(value: datetime | str | None) -> datetime | None:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
+
     async def complete(self, travel_id: int) -> None:
         try:
-            sql = """UPDATE travel
-                    SET status = 'Завершен'
-                    WHERE id = :travel_id"""
-            await self.session.execute(text(sql), {"travel_id": travel_id})
+            await self.session.execute(statements.TRAVEL_COMPLETE, {"travel_id": travel_id})
             await self.session.commit()
 
         except SQLAlchemyError as e:
@@ -297,25 +301,18 @@ class TravelRepository(ITravelRepository):
 
     async def check_archive(self) -> list[Travel]:
         try:
-            sql = """SELECT t.*
-                    FROM travel t
-                    WHERE t.status = 'Завершен'"""
-            
-            result = await self.session.execute(text(sql))
-            rows = result.fetchall()
-
-            travels = []
-            for row in rows:
-                travel = Travel(
-                    travel_id=row["id"],
-                    status=row["status"],
-                    users=await self.user_repo.get_by_id(row["user_id"]),
-                    entertainments=await self.get_entertainments_by_travel(row["id"]),
-                    accommodations=await self.get_accommodations_by_travel(row["id"])
-                )
-                travels.append(travel)
-            return travels
-
+            result = await self.session.execute(statements.TRAVEL_GET_ARCHIVE)
+            return await self._hydrate(result.mappings().all())
         except SQLAlchemyError as e:
             print(f"Ошибка при получении завершенных путешествий: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    async def get_archive_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Page[Travel]:
+        try:
+            result = await self.session.execute(statements.TRAVEL_GET_ARCHIVE_PAGE,
+                                                {"after_id": after_id, "limit": limit + 1})
+            travels = await self._hydrate(result.mappings().all())
+            return Page.from_items(travels, limit, lambda travel: travel.travel_id)
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении страницы завершенных путешествий после ID {after_id}: {e}")
+            return Page()
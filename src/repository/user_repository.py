@@ -1,23 +1,41 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from collections.abc import Collection
+
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.iuser_repository import IUserRepository
+from database import ScopedSession
+from database import get_identity_map
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.user import User
+from repository import statements
+from repository.loader import get_loader
+from repository.projection import Projection
 
 
 class UserRepository(IUserRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession | ScopedSession):
         self.session = session
 
+    @staticmethod
+    def from_row(row: RowMapping) -> User:
+        return User(
+            user_id=row["id"],
+            fio=row["full_name"],
+            number_passport=row["passport"],
+            phone_number=row["phone"],
+            email=row["email"],
+            login=row["username"],
+            password=row["password"]
+        )
+
     async def add(self, user: User) -> None:
-        query = text("""
-            INSERT INTO users (full_name, passport, phone, email, username, password)
-            VALUES (:full_name, :passport, :phone, :email, :username, :password)
-        """)
+        query = statements.USER_ADD
         try:
             await self.session.execute(query, {
                 "full_name": user.fio,
@@ -36,79 +54,80 @@ class UserRepository(IUserRepository):
             await self.session.rollback()
 
     async def get_list(self) -> list[User]:
-        query = text("SELECT * FROM users")
+        query = statements.USER_GET_LIST
         try:
             result = await self.session.execute(query)
-            return [
-                User(
-                    user_id=row["id"],
-                    fio=row["full_name"],
-                    number_passport=row["passport"],
-                    phone_number=row["phone"],
-                    email=row["email"],
-                    login=row["username"],
-                    password=row["password"]
-                )
-                for row in result.mappings()
-            ]
+            identity_map = get_identity_map(self.session)
+            return [identity_map.resolve(User, row["id"], self.from_row, row) for row in result.mappings()]
         except SQLAlchemyError as e:
             print(f"Ошибка при получении списка пользователей: {e}")
             return []
 
-    async def get_by_id(self, user_id: int) -> User | None:
-        query = text("SELECT * FROM users WHERE id = :user_id")
+    @staticmethod
+    def _projection(fields: Collection[str]) -> Projection[User]:
+        return Projection(User, statements.USER_FIELD_COLUMNS, "user_id", fields)
+
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[User]:
+        params = {"after_id": after_id, "limit": limit + 1}
+        projection = self._projection(fields) if fields is not None else None
         try:
-            result = await self.session.execute(query, {"user_id": user_id})
-            result = result.mappings().first()
-            if result:
-                return User(
-                    user_id=result["id"],
-                    fio=result["full_name"],
-                    number_passport=result["passport"],
-                    phone_number=result["phone"],
-                    email=result["email"],
-                    login=result["username"],
-                    password=result["password"]
-                )
-            return None
+            if projection is None:
+                result = await self.session.execute(statements.USER_GET_PAGE, params)
+                identity_map = get_identity_map(self.session)
+                items = [identity_map.resolve(User, row["id"], self.from_row, row) for row in result.mappings()]
+            else:
+                result = await self.session.execute(projection.statement("user.get_page"), params)
+                items = [projection.construct(row) for row in result.mappings()]
+            return Page.from_items(items, limit, lambda item: item.user_id)
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении страницы пользователей после ID {after_id}: {e}")
+            return Page()
+
+    async def get_by_id(self, user_id: int, fields: Collection[str] | None = None) -> User | None:
+        if fields is None:
+            return await get_loader(self.session, self.get_by_ids).load(user_id)
+        projection = self._projection(fields)
+        try:
+            query = projection.statement("user.get_by_id")
+            result = await self.session.execute(query, {"id": user_id})
+            row = result.mappings().first()
+            return projection.construct(row) if row else None
         except SQLAlchemyError as e:
             print(f"Ошибка при получении пользователя по ID {user_id}: {e}")
             return None
 
+    async def get_by_ids(self, user_ids: list[int]) -> dict[int, User]:
+        query = statements.USER_GET_BY_IDS
+        identity_map = get_identity_map(self.session)
+        users, missing = identity_map.find(User, user_ids)
+        if not missing:
+            return users
+        try:
+            result = await self.session.execute(query, {"user_ids": missing})
+            for row in result.mappings():
+                users[row["id"]] = identity_map.add(User, row["id"], self.from_row(row))
+            return users
+        except SQLAlchemyError as e:
+            print(f"Ошибка при получении пользователей по ID {user_ids}: {e}")
+            return users
+
     async def get_by_login(self, login: str) -> User | None:
-        query = text("SELECT * FROM users WHERE username = :login")
+        query = statements.USER_GET_BY_LOGIN
         try:
             result = await self.session.execute(query, {"login": login})
             row = result.mappings().first() 
             if row:
-                return User(
-                    user_id=row["id"],
-                    fio=row["full_name"],
-                    number_passport=row["passport"],
-                    phone_number=row["phone"],
-                    email=row["email"],
-                    login=row["username"],
-                    password=row["password"]
-                )
+                return get_identity_map(self.session).resolve(User, row["id"], self.from_row, row)
             return None 
         except SQLAlchemyError as e:
             print(f"Ошибка при получении пользователя по логину: {e}")
             return None
    
     async def update(self, update_user: User) -> None:
-        query = text("""
-            UPDATE users
-            SET full_name = :fio,
-                passport = :number_passport,
-                phone = :phone_number,
-                email = :email,
-                username = :login,
-                password = :password
-            WHERE id = :user_id
-        """)
+        query = statements.USER_UPDATE
         try:
             await self.session.execute(query, {
-                "id": update_user.user_id,
                 "fio": update_user.fio,
                 "number_passport": update_user.number_passport,
                 "phone_number": update_user.phone_number,
@@ -121,7 +140,7 @@ class UserRepository(IUserRepository):
             print(f"Ошибка при обновлении пользователя с ID {update_user.user_id}: {e}")
 
     async def delete(self, user_id: int) -> None:
-        query = text("DELETE FROM users WHERE id = :user_id")
+        query = statements.USER_DELETE
         try:
             await self.session.execute(query, {"user_id": user_id})
             await self.session.commit()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+import time
+
+from dataclasses import dataclass
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import InterfaceError
+from sqlalchemy.exc import OperationalError
+
+from settings import Settings
+
+
+SERIALIZATION_FAILURE = "40001"
+DEADLOCK_DETECTED = "40P01"
+CONNECTION_EXCEPTION_CLASS = "08"
+ADMIN_SHUTDOWN_CLASS = "57P"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RetryPolicy:
+        return cls(
+            attempts=settings.retry_attempts,
+            base_delay=settings.retry_base_delay,
+            max_delay=settings.retry_max_delay
+        )
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    @staticmethod
+    def can_sleep(delay: float, deadline: float | None) -> bool:
+        return deadline is None or time.monotonic() + delay < deadline
+
+
+def get_sqlstate(error: DBAPIError) -> str | None:
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+    return str(sqlstate) if sqlstate else None
+
+
+def is_transient(error: Exception) -> bool:
+    if not isinstance(error, DBAPIError):
+        return False
+    if error.connection_invalidated:
+        return True
+    sqlstate = get_sqlstate(error)
+    if sqlstate is not None:
+        return (sqlstate in {SERIALIZATION_FAILURE, DEADLOCK_DETECTED}
+                or sqlstate.startswith((CONNECTION_EXCEPTION_CLASS, ADMIN_SHUTDOWN_CLASS)))
+    return isinstance(error, (OperationalError, InterfaceError))
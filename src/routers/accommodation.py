@@ -6,33 +6,56 @@ from typing import Any
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Request
+from fastapi import Response
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
+from controllers.fields import ACCOMMODATION_FIELDS
+from models.page import DEFAULT_PAGE_SIZE
+from routers.conditional import ACCOMMODATION_TABLES
+from routers.conditional import cache_page
+from routers.conditional import cached_page
+from routers.conditional import is_not_modified
+from routers.conditional import not_modified_response
+from routers.conditional import table_etag
+from routers.pagination import CursorParam
+from routers.pagination import FieldsParam
+from routers.pagination import LimitParam
+from routers.pagination import parse_fields
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import get_templates
 
 
 accommodation_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
 
 
 @accommodation_router.post("/api/accommodations", response_class=HTMLResponse)
 async def create_accommodation(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
     await service_locator.get_acc_contr().create_new_accommodation(request)
-    return templates.TemplateResponse("accommodation.html", {"request": request})
+    return get_templates().TemplateResponse("accommodation.html", {"request": request})
 
 
 @accommodation_router.get("/accommodation.html", response_class=HTMLResponse)
-async def get_all_accommodations(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
-    accommodation_list = await service_locator.get_acc_contr().get_all_accommodation()
+async def get_all_accommodations(request: Request, cursor: CursorParam = 0, limit: LimitParam = DEFAULT_PAGE_SIZE,
+                                 fields: FieldsParam = None,
+                                 service_locator: ServiceLocator = get_sl_dep) -> Response:
+    selected = parse_fields(fields, ACCOMMODATION_FIELDS)
+    etag = await table_etag(service_locator, ACCOMMODATION_TABLES, cursor, limit, selected)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    if (cached := cached_page("accommodation.html", etag)) is not None:
+        return cached
+    accommodation_list = await service_locator.get_acc_contr().get_all_accommodation(cursor, limit, selected)
     accommodations = accommodation_list.get("accommodations", []) 
     for a in accommodations:
-        a['check_in'] = datetime.fromisoformat(a['check_in'])
-        a['check_out'] = datetime.fromisoformat(a['check_out'])
-    return templates.TemplateResponse("accommodation.html", {"request": request, "accommodations": accommodations})
+        for key in ('check_in', 'check_out'):
+            if key in a:
+                a[key] = datetime.fromisoformat(a[key])
+    return cache_page("accommodation.html", etag, ACCOMMODATION_TABLES, get_templates().TemplateResponse(
+        "accommodation.html", {"request": request, "accommodations": accommodations, "limit": limit,
+                               "fields": fields, "next_cursor": accommodation_list.get("next_cursor")}))
 
 
 @accommodation_router.get("/accommodation.html")
@@ -47,7 +70,7 @@ async def get_accommodation(request: Request, service_locator: ServiceLocator =
 async def update_accommodation(accommodation_id: int, request: Request, 
                                 service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
     await service_locator.get_acc_contr().update_accommodation(accommodation_id, request)
-    return templates.TemplateResponse("accommodation.html", {"request": request})
+    return get_templates().TemplateResponse("accommodation.html", {"request": request})
 
 
 @accommodation_router.post("/accommodation/delete/{accommodation_id}", response_class=HTMLResponse)
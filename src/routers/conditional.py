@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request
+from fastapi import Response
+from fastapi import status
+from fastapi.responses import HTMLResponse
+
+from metrics import metrics
+from page_cache import page_cache
+from service_locator import ServiceLocator
+
+
+ACCOMMODATION_TABLES = ("accommodations",)
+ENTERTAINMENT_TABLES = ("entertainment",)
+USER_TABLES = ("users",)
+TRAVEL_TABLES = ("travel", "users", "travel_entertainment", "entertainment", "travel_accommodations",
+                 "accommodations")
+ROUTE_TABLES = ("route", "directory_route", "city", "travel")
+
+
+async def table_etag(service_locator: ServiceLocator, tables: tuple[str, ...], *parts: object) -> str | None:
+    changes = await service_locator.get_stats_repo().get_change_counts(tables)
+    if not changes.keys() >= set(tables):
+        return None
+    state = (tuple(changes[table] for table in tables), parts)
+    return f'W/"{hashlib.blake2b(repr(state).encode(), digest_size=12).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    matched = "*" in candidates or etag.removeprefix("W/") in candidates
+    metrics.increment("http.not_modified" if matched else "http.etag_mismatch")
+    return matched
+
+
+def not_modified_response(etag: str) -> Response:
+    return with_etag(Response(status_code=status.HTTP_304_NOT_MODIFIED), etag)
+
+
+def with_etag[R: Response](response: R, etag: str | None) -> R:
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def cached_page(template: str, etag: str | None) -> HTMLResponse | None:
+    if etag is None:
+        return None
+    body = page_cache.get((template, etag))
+    return None if body is None else with_etag(HTMLResponse(body), etag)
+
+
+def cache_page[R: Response](template: str, etag: str | None, tables: tuple[str, ...], response: R) -> R:
+    if etag is not None and response.status_code == status.HTTP_200_OK:
+        page_cache.put((template, etag), bytes(response.body), tables)
+    return with_etag(response, etag)
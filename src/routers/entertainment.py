@@ -6,35 +6,58 @@ from typing import Any
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Request
+from fastapi import Response
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
+from controllers.fields import ENTERTAINMENT_FIELDS
+from models.page import DEFAULT_PAGE_SIZE
+from routers.conditional import ENTERTAINMENT_TABLES
+from routers.conditional import cache_page
+from routers.conditional import cached_page
+from routers.conditional import is_not_modified
+from routers.conditional import not_modified_response
+from routers.conditional import table_etag
+from routers.pagination import CursorParam
+from routers.pagination import FieldsParam
+from routers.pagination import LimitParam
+from routers.pagination import parse_fields
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import get_templates
 
 
 entertainment_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
 
 
 @entertainment_router.post("/api/entertainments", response_class=HTMLResponse)
 async def create_entertainment(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
     await service_locator.get_ent_contr().create_new_entertainment(request)
-    return templates.TemplateResponse("entertainment.html", {"request": request})
+    return get_templates().TemplateResponse("entertainment.html", {"request": request})
 
 
 @entertainment_router.get("/entertainment.html", response_class=HTMLResponse)
-async def get_all_entertainments(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
-    entertainment_list = await service_locator.get_ent_contr().get_all_entertainment()
+async def get_all_entertainments(request: Request, cursor: CursorParam = 0, limit: LimitParam = DEFAULT_PAGE_SIZE,
+                                 fields: FieldsParam = None,
+                                 service_locator: ServiceLocator = get_sl_dep) -> Response:
+    selected = parse_fields(fields, ENTERTAINMENT_FIELDS)
+    etag = await table_etag(service_locator, ENTERTAINMENT_TABLES, cursor, limit, selected)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    if (cached := cached_page("entertainment.html", etag)) is not None:
+        return cached
+    entertainment_list = await service_locator.get_ent_contr().get_all_entertainment(cursor, limit, selected)
     entertainments = entertainment_list.get("entertainments", []) 
     for e in entertainments:
-        e['event_time'] = datetime.fromisoformat(e['event_time'])
-    return templates.TemplateResponse("entertainment.html", {"request": request, "entertainments": entertainments})
+        if 'event_time' in e:
+            e['event_time'] = datetime.fromisoformat(e['event_time'])
+    return cache_page("entertainment.html", etag, ENTERTAINMENT_TABLES, get_templates().TemplateResponse(
+        "entertainment.html", {"request": request, "entertainments": entertainments, "limit": limit,
+                               "fields": fields, "next_cursor": entertainment_list.get("next_cursor")}))
 
 
-@entertainment_router.get("/{entertainment_id}")
+@entertainment_router.get("/{entertainment_id:int}")
 async def get_entertainment(request: Request, service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
     result = await service_locator.get_ent_contr().get_entertainment_details(request)
     if result is None:
@@ -46,7 +69,7 @@ async def get_entertainment(request: Request, service_locator: ServiceLocator =
 async def update_entertainment(entertainment_id: int, request: Request, 
                                 service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
     await service_locator.get_ent_contr().update_entertainment(entertainment_id, request)
-    return templates.TemplateResponse("entertainment.html", {"request": request})
+    return get_templates().TemplateResponse("entertainment.html", {"request": request})
 
 
 @entertainment_router.post("/entertainment/delete/{entertainment_id}", response_class=HTMLResponse)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi import status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from city_cache import city_cache
+from database import get_engine
+from database import get_replica_engine
+from metrics import metrics
+from repository.statements import HEALTH_CHECK
+from settings import get_settings
+from warmup import is_ready
+
+
+DB_CHECK_TIMEOUT = 1.0
+
+health_router = APIRouter()
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"status": pool.status(), "saturated": False}
+    max_overflow = get_settings().max_overflow
+    size = pool.size()
+    checked_out = pool.checkedout()
+    return {
+        "size": size,
+        "checked_out": checked_out,
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": max_overflow,
+        "saturated": checked_out >= size + max_overflow
+    }
+
+
+async def get_loop_stats() -> dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.sleep(0)
+    return {
+        "lag_ms": round((loop.time() - started) * 1000, 3),
+        "tasks": len(asyncio.all_tasks(loop))
+    }
+
+
+async def check_database(engine: AsyncEngine) -> str | None:
+    try:
+        async with asyncio.timeout(DB_CHECK_TIMEOUT), engine.connect() as connection:
+            await connection.execute(HEALTH_CHECK)
+    except (SQLAlchemyError, OSError, TimeoutError) as e:
+        return str(e) or type(e).__name__
+    return None
+
+
+@health_router.get("/healthz")
+async def healthz() -> dict[str, Any]:
+    return {"status": "ok"}
+
+
+@health_router.get("/readyz")
+async def readyz() -> JSONResponse:
+    if not is_ready():
+        return JSONResponse({"status": "starting"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    engines = {"primary": get_engine()}
+    if (replica_engine := get_replica_engine()) is not None:
+        engines["replica"] = replica_engine
+
+    ready = True
+    pools: dict[str, Any] = {}
+    for name, engine in engines.items():
+        stats = get_pool_stats(engine)
+        if stats["saturated"]:
+            stats["error"] = "pool saturated"
+        elif error := await check_database(engine):
+            stats["error"] = error
+        ready = ready and "error" not in stats
+        pools[name] = stats
+
+    body = {
+        "status": "ready" if ready else "unavailable",
+        "pools": pools,
+        "event_loop": await get_loop_stats(),
+        "metrics": metrics.snapshot(),
+        "city_cache": city_cache.stats()
+    }
+    return JSONResponse(body, status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Annotated
+
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import status
+
+from controllers.fields import select_fields
+from models.page import MAX_PAGE_SIZE
+
+
+CursorParam = Annotated[int, Query(ge=0, description="ID последнего элемента предыдущей страницы")]
+LimitParam = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Размер страницы")]
+FieldsParam = Annotated[str | None, Query(description="Поля через запятую, например fields=id,name")]
+
+
+def parse_fields(fields: str | None, available: Mapping[str, str]) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+    try:
+        return tuple(select_fields(fields, available))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
@@ -5,7 +5,18 @@ from typing import Any
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Request
-
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from models.page import DEFAULT_PAGE_SIZE
+from routers.conditional import ROUTE_TABLES
+from routers.conditional import is_not_modified
+from routers.conditional import not_modified_response
+from routers.conditional import table_etag
+from routers.conditional import with_etag
+from routers.pagination import CursorParam
+from routers.pagination import LimitParam
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
 
@@ -21,12 +32,15 @@ async def create_route(request: Request, service_locator: ServiceLocator = get_s
     return {"status": "created"}
 
 
-@router.get("/{route_id}")
-async def get_route(request: Request, service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
+@router.get("/{route_id}", response_model=None)
+async def get_route(request: Request, service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any] | Response:
+    etag = await table_etag(service_locator, ROUTE_TABLES, await request.body())
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
     result = await service_locator.get_route_contr().get_route_details(request)
     if result is None:
         return {"error": "Route not found"}
-    return {"route": result}
+    return with_etag(JSONResponse(jsonable_encoder({"route": result})), etag)
 
 
 @router.put("/")
@@ -41,11 +55,15 @@ async def delete_route(request: Request, service_locator: ServiceLocator = get_s
     return {"status": "deleted"}
 
 
-@router.get("/")
-async def get_all_route(service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
+@router.get("/", response_model=None)
+async def get_all_route(request: Request, cursor: CursorParam = 0, limit: LimitParam = DEFAULT_PAGE_SIZE,
+                        service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any] | Response:
     try:
-        route_list = await service_locator.get_route_contr().get_all_route()
-        return {"routes": route_list}
+        etag = await table_etag(service_locator, ROUTE_TABLES, cursor, limit)
+        if etag is not None and is_not_modified(request, etag):
+            return not_modified_response(etag)
+        route_list = await service_locator.get_route_contr().get_all_route(cursor, limit)
+        return with_etag(JSONResponse(jsonable_encoder({"routes": route_list})), etag)
     except Exception as e:
         return {"error": "Error fetching routes", "details": str(e)}
 
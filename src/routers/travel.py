@@ -5,44 +5,77 @@ from typing import Any
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Request
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-
+from fastapi.responses import JSONResponse
+
+from models.page import DEFAULT_PAGE_SIZE
+from routers.conditional import TRAVEL_TABLES
+from routers.conditional import cache_page
+from routers.conditional import cached_page
+from routers.conditional import is_not_modified
+from routers.conditional import not_modified_response
+from routers.conditional import table_etag
+from routers.conditional import with_etag
+from routers.pagination import CursorParam
+from routers.pagination import LimitParam
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import get_templates
 
 
 travel_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
 
 
 @travel_router.post("/api/travels", response_class=HTMLResponse)
 async def create_travel(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
     await service_locator.get_travel_contr().create_new_travel(request)
-    return templates.TemplateResponse("travel.html", {"request": request})
-
-
-@travel_router.get("/{travel_id}")
-async def get_travel(request: Request, service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
-    result = await service_locator.get_travel_contr().get_travel_details(request)
-    if result is None:
-        return {"error": "Travel not found"}
-    return result
+    return get_templates().TemplateResponse("travel.html", {"request": request})
 
 
 @travel_router.get("/travel.html")
-async def get_all_travels(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
-    print("AAJDLAKDHASDç")
-    travel_list = await service_locator.get_travel_contr().get_all_travels()
+async def get_all_travels(request: Request, cursor: CursorParam = 0, limit: LimitParam = DEFAULT_PAGE_SIZE,
+                          service_locator: ServiceLocator = get_sl_dep) -> Response:
+    etag = await table_etag(service_locator, TRAVEL_TABLES, cursor, limit)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    if (cached := cached_page("travel.html", etag)) is not None:
+        return cached
+    travel_list = await service_locator.get_travel_contr().get_all_travels(cursor, limit)
     travels = travel_list.get("travels", []) 
     user_id = travels[0].users.user_id if travels and travels[0].users else None
 
     entertainments = travel_list.get("travels.entertainments", [])
     accommodations = travel_list.get("travels.accommodations", [])
-    return templates.TemplateResponse("travel.html", {"request": request, "travels": travels, "user_id": user_id,
+    return cache_page("travel.html", etag, TRAVEL_TABLES, get_templates().TemplateResponse("travel.html", {
+            "request": request, "travels": travels, "user_id": user_id,
             "entertainments": entertainments,
-            "accommodations": accommodations })
+            "accommodations": accommodations,
+            "limit": limit,
+            "next_cursor": travel_list.get("next_cursor")}))
+
+
+@travel_router.get("/archive")
+async def check_archive_travels(cursor: CursorParam = 0, limit: LimitParam = DEFAULT_PAGE_SIZE,
+                                service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
+    try:
+        result = await service_locator.get_travel_contr().check_archive_travels(cursor, limit)
+        return {"travel": result}
+    except Exception as e:
+        return {"error": "Error check archive travel", "details": str(e)}
+
+
+@travel_router.get("/{travel_id:int}", response_model=None)
+async def get_travel(request: Request, service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any] | Response:
+    etag = await table_etag(service_locator, TRAVEL_TABLES, await request.body())
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    result = await service_locator.get_travel_contr().get_travel_details(request)
+    if result is None:
+        return {"error": "Travel not found"}
+    return with_etag(JSONResponse(jsonable_encoder(result)), etag)
 
 
 @travel_router.put("/")
@@ -63,15 +96,6 @@ async def complete_travel(request: Request, service_locator: ServiceLocator = ge
     return {"status": "completed"}
 
 
-@travel_router.get("/archive")
-async def check_archive_travels(service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
-    try:
-        result = await service_locator.get_travel_contr().check_archive_travels()
-        return {"travel": result}
-    except Exception as e:
-        return {"error": "Error check archive travel", "details": str(e)}
-
-
 @travel_router.post("/search")
 async def search_travel(request: Request, service_locator: ServiceLocator = get_sl_dep) -> dict[str, Any]:
     try:
@@ -5,16 +5,29 @@ from typing import Any
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Request
+from fastapi import Response
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
+from controllers.fields import USER_FIELDS
+from models.page import DEFAULT_PAGE_SIZE
+from routers.conditional import USER_TABLES
+from routers.conditional import cache_page
+from routers.conditional import cached_page
+from routers.conditional import is_not_modified
+from routers.conditional import not_modified_response
+from routers.conditional import table_etag
+from routers.pagination import CursorParam
+from routers.pagination import FieldsParam
+from routers.pagination import LimitParam
+from routers.pagination import parse_fields
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import get_templates
 
 
-user_router = APIRouter()
+USER_TABLE_FIELDS = ("user_id", "fio", "number_passport", "phone_number", "email")
 
-templates = Jinja2Templates(directory="templates")
+user_router = APIRouter()
 
 get_sl_dep = Depends(get_service_locator)
 
@@ -35,10 +48,19 @@ async def get_user_profile(request: Request, service_locator: ServiceLocator = g
 
 
 @user_router.get("/user.html", response_class=HTMLResponse)
-async def get_all_users(request: Request, service_locator: ServiceLocator = get_sl_dep) -> HTMLResponse:
-    users_data = await service_locator.get_user_contr().get_all_users()
+async def get_all_users(request: Request, cursor: CursorParam = 0, limit: LimitParam = DEFAULT_PAGE_SIZE,
+                        fields: FieldsParam = None, service_locator: ServiceLocator = get_sl_dep) -> Response:
+    selected = parse_fields(fields, USER_FIELDS) or USER_TABLE_FIELDS
+    etag = await table_etag(service_locator, USER_TABLES, cursor, limit, selected)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    if (cached := cached_page("user.html", etag)) is not None:
+        return cached
+    users_data = await service_locator.get_user_contr().get_all_users(cursor, limit, selected)
     users = users_data.get("users", []) 
-    return templates.TemplateResponse("user.html", {"request": request, "users": users})
+    return cache_page("user.html", etag, USER_TABLES, get_templates().TemplateResponse(
+        "user.html", {"request": request, "users": users, "limit": limit, "fields": fields,
+                      "next_cursor": users_data.get("next_cursor")}))
 
 
 @user_router.delete("/")
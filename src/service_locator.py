@@ -1,42 +1,45 @@
 from __future__ import annotations
 
-import asyncio
-
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from typing import Any
-
-from sqlalchemy.exc import OperationalError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
-
-from controllers.accommodation_controller import AccommodationController
-from controllers.entertainment_controller import EntertainmentController
-from controllers.route_controller import RouteController
-from controllers.travel_controller import TravelController
-from controllers.user_controller import UserController
-from repository.accommodation_repository import AccommodationRepository
-from repository.city_repository import CityRepository
-from repository.directory_route_repository import DirectoryRouteRepository
-from repository.entertainment_repository import EntertainmentRepository
-from repository.route_repository import RouteRepository
-from repository.travel_repository import TravelRepository
-from repository.user_repository import UserRepository
-from services.accommodation_service import AccommodationService
-from services.city_service import CityService
-from services.directory_route_service import DirectoryRouteService
-from services.entertainment_service import EntertainmentService
-from services.route_service import RouteService
-from services.travel_service import TravelService
-from services.user_service import AuthService
-from services.user_service import UserService
+from typing import TYPE_CHECKING
+
+from database import ScopedSession
+from database import session_scope
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from controllers.accommodation_controller import AccommodationController
+    from controllers.entertainment_controller import EntertainmentController
+    from controllers.route_controller import RouteController
+    from controllers.travel_controller import TravelController
+    from controllers.user_controller import UserController
+    from repository.accommodation_repository import AccommodationRepository
+    from repository.city_repository import CityRepository
+    from repository.directory_route_repository import DirectoryRouteRepository
+    from repository.entertainment_repository import EntertainmentRepository
+    from repository.route_repository import RouteRepository
+    from repository.table_stats_repository import TableStatsRepository
+    from repository.travel_repository import TravelRepository
+    from repository.user_repository import UserRepository
+    from services.accommodation_service import AccommodationService
+    from services.city_service import CityService
+    from services.directory_route_service import DirectoryRouteService
+    from services.entertainment_service import EntertainmentService
+    from services.route_service import RouteService
+    from services.travel_service import TravelService
+    from services.user_service import AuthService
+    from services.user_service import UserService
 
 
 @dataclass
 class Repositories:
     def __init__(self, acc_repo: AccommodationRepository, city_repo: CityRepository, 
             d_route_repo: DirectoryRouteRepository, ent_repo: EntertainmentRepository, 
-            route_repo: RouteRepository, travel_repo: TravelRepository, user_repo: UserRepository):
+            route_repo: RouteRepository, travel_repo: TravelRepository, user_repo: UserRepository,
+            stats_repo: TableStatsRepository):
         self.acc_repo = acc_repo
         self.city_repo = city_repo
         self.d_route_repo = d_route_repo
@@ -44,6 +47,7 @@ class Repositories:
         self.route_repo = route_repo
         self.travel_repo = travel_repo
         self.user_repo = user_repo
+        self.stats_repo = stats_repo
         
 
 @dataclass
@@ -99,6 +103,9 @@ class ServiceLocator:
     def get_user_repo(self) -> UserRepository:
         return self.repositories.user_repo
 
+    def get_stats_repo(self) -> TableStatsRepository:
+        return self.repositories.stats_repo
+
     def get_acc_serv(self) -> AccommodationService:
         return self.services.acc_serv
 
@@ -139,61 +146,73 @@ class ServiceLocator:
         return self.controllers.user_contr
 
 
-async def get_sessionmaker(max_retries: int = 5, delay: int = 2) -> Any:
-    engine = create_async_engine(
-        "postgresql+asyncpg://nastya@localhost:5432/postgres",
-        connect_args={
-            "server_settings": {
-                "search_path": "travel_db" 
-            }
-        },
-        echo=True
-    )
-    
-    for attempt in range(max_retries):
-        try:
-            return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-        except OperationalError as e:
-            print(f"Ошибка подключения к БД: {e}")
-            if attempt < max_retries - 1:
-                print(f"Повторная попытка подключения через {delay} секунд...")
-                await asyncio.sleep(delay)
-            else:
-                print("Превышено максимальное количество попыток подключения.")
-                raise
-    return None
-
-
-async def get_service_locator() -> ServiceLocator:
-    async_session_maker = await get_sessionmaker()
-    async with async_session_maker() as session:
-        acc_repo = AccommodationRepository(session)
-        city_repo = CityRepository(session)
-        d_route_repo = DirectoryRouteRepository(session, city_repo)
-        ent_repo = EntertainmentRepository(session)
-        user_repo = UserRepository(session)
-        travel_repo = TravelRepository(session, user_repo, ent_repo, acc_repo)
-        route_repo = RouteRepository(session, d_route_repo, travel_repo)
-
-        acc_serv = AccommodationService(acc_repo)
-        city_serv = CityService(city_repo)
-        d_route_serv = DirectoryRouteService(d_route_repo)
-        ent_serv = EntertainmentService(ent_repo)
-        route_serv = RouteService(route_repo)
-        travel_serv = TravelService(travel_repo)
-        user_serv = UserService(user_repo)
-        auth_serv = AuthService(user_repo)
-        
-        acc_contr = AccommodationController(acc_serv)
-        route_contr = RouteController(route_serv) 
-        ent_contr = EntertainmentController(ent_serv)
-        travel_contr = TravelController(travel_serv)
-        user_contr = UserController(user_serv, auth_serv)
-
-        repositories = Repositories(acc_repo, city_repo, d_route_repo, ent_repo, route_repo, travel_repo, user_repo)
-        services = Services(acc_serv, city_serv, d_route_serv, ent_serv, route_serv, travel_serv, user_serv, auth_serv)
-        controllers = Controllers(acc_contr, route_contr, ent_contr, travel_contr, user_contr)
-        
-        return ServiceLocator(repositories, services, controllers)
-    
-    raise ValueError("Session was not provided.")
\ No newline at end of file
+def build_service_locator(session: AsyncSession | ScopedSession) -> ServiceLocator:
+    from controllers.accommodation_controller import AccommodationController
+    from controllers.entertainment_controller import EntertainmentController
+    from controllers.route_controller import RouteController
+    from controllers.travel_controller import TravelController
+    from controllers.user_controller import UserController
+    from repository.accommodation_repository import AccommodationRepository
+    from repository.city_repository import CityRepository
+    from repository.directory_route_repository import DirectoryRouteRepository
+    from repository.entertainment_repository import EntertainmentRepository
+    from repository.route_repository import RouteRepository
+    from repository.table_stats_repository import TableStatsRepository
+    from repository.travel_repository import TravelRepository
+    from repository.user_repository import UserRepository
+    from services.accommodation_service import AccommodationService
+    from services.city_service import CityService
+    from services.directory_route_service import DirectoryRouteService
+    from services.entertainment_service import EntertainmentService
+    from services.route_service import RouteService
+    from services.travel_service import TravelService
+    from services.user_service import AuthService
+    from services.user_service import UserService
+
+    acc_repo = AccommodationRepository(session)
+    city_repo = CityRepository(session)
+    d_route_repo = DirectoryRouteRepository(session, city_repo)
+    ent_repo = EntertainmentRepository(session)
+    user_repo = UserRepository(session)
+    travel_repo = TravelRepository(session, user_repo, ent_repo, acc_repo)
+    route_repo = RouteRepository(session, d_route_repo, travel_repo)
+    stats_repo = TableStatsRepository(session)
+
+    acc_serv = AccommodationService(acc_repo)
+    city_serv = CityService(city_repo)
+    d_route_serv = DirectoryRouteService(d_route_repo)
+    ent_serv = EntertainmentService(ent_repo)
+    route_serv = RouteService(route_repo)
+    travel_serv = TravelService(travel_repo)
+    user_serv = UserService(user_repo)
+    auth_serv = AuthService(user_repo)
+
+    acc_contr = AccommodationController(acc_serv)
+    route_contr = RouteController(route_serv)
+    ent_contr = EntertainmentController(ent_serv)
+    travel_contr = TravelController(travel_serv)
+    user_contr = UserController(user_serv, auth_serv)
+
+    repositories = Repositories(acc_repo, city_repo, d_route_repo, ent_repo, route_repo, travel_repo, user_repo,
+                                stats_repo)
+    services = Services(acc_serv, city_serv, d_route_serv, ent_serv, route_serv, travel_serv, user_serv, auth_serv)
+    controllers = Controllers(acc_contr, route_contr, ent_contr, travel_contr, user_contr)
+
+    return ServiceLocator(repositories, services, controllers)
+
+
+_service_locator: ServiceLocator | None = None
+
+
+def init_service_locator() -> ServiceLocator:
+    global _service_locator
+    if _service_locator is None:
+        _service_locator = build_service_locator(ScopedSession())
+    return _service_locator
+
+
+async def get_service_locator() -> AsyncIterator[ServiceLocator]:
+    if _service_locator is None:
+        raise RuntimeError("ServiceLocator не инициализирован: вызовите init_service_locator() при старте приложения.")
+    async with session_scope():
+        yield _service_locator
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from abstract_service.accommodation_service import IAccommodationService
 from models.accommodation import Accommodation
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from repository.accommodation_repository import AccommodationRepository
 
 
@@ -26,12 +30,16 @@ class AccommodationService(IAccommodationService):
     def __init__(self, repository: AccommodationRepository) -> None:
         self.repository = repository
 
-    async def get_by_id(self, accommodation_id: int) -> Accommodation | None:
-        return await self.repository.get_by_id(accommodation_id)
+    async def get_by_id(self, accommodation_id: int, fields: Collection[str] | None = None) -> Accommodation | None:
+        return await self.repository.get_by_id(accommodation_id, fields)
 
     async def get_list(self) -> list[Accommodation]:
         return await self.repository.get_list()
 
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[Accommodation]:
+        return await self.repository.get_page(after_id, limit, fields)
+
     async def add(self, accommodation: Accommodation) -> Accommodation:
         try:
             await self.repository.add(accommodation)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abstract_service.city_service import ICityService
+from city_cache import city_cache
 from models.city import City
 from repository.city_repository import CityRepository
 
@@ -29,9 +30,21 @@ class CityService(ICityService):
     async def get_by_id(self, city_id: int) -> City | None:
         return await self.repository.get_by_id(city_id)
 
+    async def get_by_name(self, name: str) -> City | None:
+        return await self.repository.get_by_name(name)
+
     async def get_all_cities(self) -> list[City]:
         return await self.repository.get_list() 
 
+    @staticmethod
+    async def refresh_cache() -> int:
+        await city_cache.refresh()
+        return len(city_cache)
+
+    @staticmethod
+    def get_cache_stats() -> dict[str, int]:
+        return city_cache.stats()
+
     async def add(self, city: City) -> City:
         try:
             await self.repository.add(city)
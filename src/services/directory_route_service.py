@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abstract_service.directory_route_service import IDirectoryRouteService
 from models.directory_route import DirectoryRoute
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from repository.directory_route_repository import DirectoryRouteRepository
 
 
@@ -26,6 +28,9 @@ class DirectoryRouteService(IDirectoryRouteService):
     async def get_by_id(self, d_route_id: int) -> DirectoryRoute | None:
         return await self.repository.get_by_id(d_route_id)
 
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Page[DirectoryRoute]:
+        return await self.repository.get_page(after_id, limit)
+
     async def add(self, d_route: DirectoryRoute) -> DirectoryRoute:
         try:
             await self.repository.add(d_route)
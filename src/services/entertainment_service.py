@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from abstract_service.entertainment_service import IEntertainmentService
 from models.entertainment import Entertainment
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from repository.entertainment_repository import EntertainmentRepository
 
 
@@ -26,8 +30,8 @@ class EntertainmentService(IEntertainmentService):
     def __init__(self, repository: EntertainmentRepository) -> None:
         self.repository = repository
 
-    async def get_by_id(self, entertainment_id: int) -> Entertainment | None:
-        return await self.repository.get_by_id(entertainment_id)
+    async def get_by_id(self, entertainment_id: int, fields: Collection[str] | None = None) -> Entertainment | None:
+        return await self.repository.get_by_id(entertainment_id, fields)
 
     async def add(self, entertainment: Entertainment) -> Entertainment:
         try:
@@ -52,3 +56,7 @@ class EntertainmentService(IEntertainmentService):
 
     async def get_list(self) -> list[Entertainment]:
         return await self.repository.get_list()
+
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[Entertainment]:
+        return await self.repository.get_page(after_id, limit, fields)
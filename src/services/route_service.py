@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from abstract_service.route_service import IRouteService
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.route import Route
 from repository.route_repository import RouteRepository
 
 
-Route.model_rebuild()
-
-
 # class RouteRepository:
 #     def get(self, route_id: int) -> Route | None:
 #         pass
@@ -29,11 +28,15 @@ class RouteService(IRouteService):
     def __init__(self, repository: RouteRepository) -> None:
         self.repository = repository
 
-    async def get_by_id(self, route_id: int) -> Route | None:
-        return await self.repository.get_by_id(route_id)
+    async def get_by_id(self, route_id: int, expand_travel: bool = False) -> Route | None:
+        return await self.repository.get_by_id(route_id, expand_travel)
+
+    async def get_all_routes(self, expand_travel: bool = False) -> list[Route]:
+        return await self.repository.get_list(expand_travel)
 
-    async def get_all_routes(self) -> list[Route]:
-        return await self.repository.get_list()
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       expand_travel: bool = False) -> Page[Route]:
+        return await self.repository.get_page(after_id, limit, expand_travel)
 
     async def add(self, route: Route) -> Route:
         try:
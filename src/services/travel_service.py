@@ -3,13 +3,12 @@ from __future__ import annotations
 from abstract_service.travel_service import ITravelService
 from models.accommodation import Accommodation
 from models.entertainment import Entertainment
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.travel import Travel
 from repository.travel_repository import TravelRepository
 
 
-Travel.model_rebuild()
-
-
 # class TravelRepository:
 #     def get(self, travel_id: int) -> Travel | None:
 #         pass
@@ -43,8 +42,21 @@ class TravelService(ITravelService):
     async def get_by_id(self, travel_id: int) -> Travel | None:
         return await self.repository.get_by_id(travel_id)
 
-    async def get_all_travels(self) -> list[Travel]:
-        return await self.repository.get_list() 
+    async def get_all_travels(self, with_details: bool = True) -> list[Travel]:
+        return await self.repository.get_list(with_details)
+
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       with_details: bool = True) -> Page[Travel]:
+        return await self.repository.get_page(after_id, limit, with_details)
+
+    async def expand_users(self, travels: list[Travel]) -> list[Travel]:
+        return await self.repository.expand_users(travels)
+
+    async def get_archive_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Page[Travel]:
+        try:
+            return await self.repository.get_archive_page(after_id, limit)
+        except (Exception):
+            raise ValueError("Ошибка при получении завершенных путешествий")
 
     async def add(self, travel: Travel) -> Travel:
         try:
@@ -66,9 +78,10 @@ class TravelService(ITravelService):
         except (Exception):
             raise ValueError("Путешествие не найдено.")
 
-    async def search(self, travel_dict: dict[str, str]) -> list[Travel]:
+    async def search(self, travel_dict: dict[str, str], limit: int | None = None, offset: int = 0,
+                     sort: str = "id") -> list[Travel]:
         try:
-            return await self.repository.search(travel_dict)
+            return await self.repository.search(travel_dict, limit, offset, sort)
         except (Exception):
             raise ValueError("Путешествие по переданным параметрам не найдено.")
     
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from abstract_service.user_service import IAuthService
 from abstract_service.user_service import IUserService
+from models.page import DEFAULT_PAGE_SIZE
+from models.page import Page
 from models.user import User
 from repository.user_repository import UserRepository
 
@@ -27,12 +31,16 @@ class UserService(IUserService):
     def __init__(self, repository: UserRepository) -> None:
         self.repository = repository
 
-    async def get_by_id(self, user_id: int) -> User | None:
-        return await self.repository.get_by_id(user_id)
+    async def get_by_id(self, user_id: int, fields: Collection[str] | None = None) -> User | None:
+        return await self.repository.get_by_id(user_id, fields)
 
     async def get_list(self) -> list[User]:
         return await self.repository.get_list()
 
+    async def get_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Collection[str] | None = None) -> Page[User]:
+        return await self.repository.get_page(after_id, limit, fields)
+
     async def update(self, updated_user: User) -> User:
         try:
             await self.repository.update(updated_user)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import os
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+from typing import ClassVar
+
+from pydantic import BaseModel
+from pydantic import field_validator
+from pydantic import model_validator
+
+
+class Settings(BaseModel):
+    ENV_PREFIX: ClassVar[str] = "TRAVEL_"
+    SETTINGS_FILE_ENV: ClassVar[str] = "TRAVEL_SETTINGS_FILE"
+    PROFILES: ClassVar[set[str]] = {"production", "development", "test"}
+
+    profile: str = "production"
+    dsn: str = "postgresql+asyncpg://nastya@localhost:5432/postgres"
+    search_path: str = "travel_db"
+    replica_dsn: str | None = None
+    replica_search_path: str | None = None
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    echo: bool | None = None
+    warmup_connections: int = 5
+    request_timeout: float = 10.0
+    retry_attempts: int = 3
+    retry_base_delay: float = 0.05
+    retry_max_delay: float = 1.0
+    page_cache_size: int = 256
+    page_cache_ttl: float = 30.0
+    reference_cache_ttl: float = 30.0
+    cache_local_size: int = 1024
+    cache_local_ttl: float = 5.0
+    cache_ttl: float = 60.0
+    cache_sqlite_path: str | None = None
+    cache_redis_url: str | None = None
+
+    @field_validator("profile")
+    @classmethod
+    def validate_profile(cls, value: str) -> str:
+        if value not in cls.PROFILES:
+            raise ValueError(f"profile должен быть одним из следующих: {', '.join(sorted(cls.PROFILES))}")
+        return value
+
+    @field_validator("pool_size", "statement_cache_size", "prepared_statement_cache_size", "retry_attempts",
+                     "warmup_connections", "page_cache_size", "cache_local_size")
+    @classmethod
+    def check_not_negative(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("значение не может быть отрицательным")
+        return value
+
+    @model_validator(mode="after")
+    def resolve_echo(self) -> Settings:
+        if self.echo is None:
+            self.echo = self.profile == "development"
+        return self
+
+    @classmethod
+    def load(cls, path: str | Path | None = None, environ: dict[str, str] | None = None) -> Settings:
+        env = dict(os.environ) if environ is None else environ
+        values: dict[str, Any] = {}
+
+        file_path = path or env.get(cls.SETTINGS_FILE_ENV)
+        if file_path:
+            values.update(json.loads(Path(file_path).read_text(encoding="utf-8")))
+
+        for name in cls.model_fields:
+            env_value = env.get(f"{cls.ENV_PREFIX}{name.upper()}")
+            if env_value is not None:
+                values[name] = env_value
+        return cls(**values)
+
+
+@cache
+def get_settings() -> Settings:
+    return Settings.load()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from collections.abc import Iterable
+
+
+class TableVersions:
+    def __init__(self) -> None:
+        self._versions: Counter[str] = Counter()
+        self._listeners: list[Callable[[tuple[str, ...]], None]] = []
+
+    def subscribe(self, listener: Callable[[tuple[str, ...]], None]) -> None:
+        self._listeners.append(listener)
+
+    def bump(self, tables: Iterable[str]) -> None:
+        changed = tuple(tables)
+        if not changed:
+            return
+        for table in changed:
+            self._versions[table] += 1
+        for listener in self._listeners:
+            listener(changed)
+
+    def get(self, table: str) -> int:
+        return self._versions[table]
+
+    def snapshot(self, tables: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self._versions[table] for table in tables)
+
+    def reset(self) -> None:
+        self._versions.clear()
+
+
+table_versions = TableVersions()
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+
+
+TEMPLATES_DIRECTORY = "templates"
+
+
+@cache
+def get_templates() -> Jinja2Templates:
+    from fastapi.templating import Jinja2Templates
+
+    return Jinja2Templates(directory=TEMPLATES_DIRECTORY)
+
+
+def warm_up_templates() -> list[str]:
+    env = get_templates().env
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return names
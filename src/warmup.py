@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from city_cache import city_cache
+from directory_route_cache import directory_route_cache
+from identity_map import IdentityMap
+from metrics import metrics
+from repository import statements
+from templating import warm_up_templates
+
+
+if TYPE_CHECKING:
+    from models.city import City
+    from models.directory_route import DirectoryRoute
+
+
+logger = logging.getLogger(__name__)
+
+_ready = False
+
+
+def is_ready() -> bool:
+    return _ready
+
+
+def set_ready(ready: bool) -> None:
+    global _ready
+    _ready = ready
+
+
+async def create_table_version(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(statements.TABLE_VERSION_CREATE)
+
+
+async def _prepare_connection(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        for statement, params in statements.HOT_STATEMENTS:
+            await connection.execute(statement, params)
+        await connection.rollback()
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    results = await asyncio.gather(
+        *(_prepare_connection(engine) for _ in range(connections)),
+        return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for error in errors:
+        if not isinstance(error, (SQLAlchemyError, OSError)):
+            raise error
+        metrics.increment("warmup.pool_errors")
+        logger.warning("Ошибка при прогреве пула соединений: %s", error)
+    return connections - len(errors)
+
+
+async def load_cities(engine: AsyncEngine) -> list[City]:
+    from repository.city_repository import CityRepository
+
+    async with engine.connect() as connection:
+        result = await connection.execute(statements.CITY_GET_LIST)
+        cities = [CityRepository.from_row(row) for row in result.mappings()]
+        await connection.rollback()
+    return cities
+
+
+async def warm_up_city_cache(engine: AsyncEngine, ttl: float) -> int:
+    city_cache.configure(partial(load_cities, engine), ttl)
+    await city_cache.refresh()
+    return len(city_cache)
+
+
+async def load_directory_routes(engine: AsyncEngine) -> list[DirectoryRoute]:
+    from repository.directory_route_repository import DirectoryRouteRepository
+
+    async with engine.connect() as connection:
+        result = await connection.execute(statements.DIRECTORY_ROUTE_GET_LIST)
+        identity_map = IdentityMap()
+        d_routes = [DirectoryRouteRepository.from_row(row, identity_map) for row in result.mappings()]
+        await connection.rollback()
+    return d_routes
+
+
+async def warm_up_directory_routes(engine: AsyncEngine, ttl: float) -> None:
+    directory_route_cache.configure(partial(load_directory_routes, engine), ttl)
+    await directory_route_cache.rebuild()
+
+
+def warm_up_models() -> None:
+    from models.accommodation import Accommodation
+    from models.city import City
+    from models.directory_route import DirectoryRoute
+    from models.entertainment import Entertainment
+    from models.route import Route
+    from models.travel import Travel
+    from models.user import User
+
+    for model in (User, City, Accommodation, Entertainment, DirectoryRoute, Travel, Route):
+        model.model_rebuild()
+
+
+async def warm_up(engines: list[AsyncEngine], connections: int, reference_cache_ttl: float) -> None:
+    warm_up_models()
+    warm_up_templates()
+    if connections and not await warm_up_pool(engines[0], connections):
+        raise RuntimeError("Не удалось открыть ни одного соединения с основной БД при прогреве.")
+    await create_table_version(engines[0])
+    for engine in engines[1:]:
+        await warm_up_pool(engine, connections)
+    await warm_up_city_cache(engines[0], reference_cache_ttl)
+    await warm_up_directory_routes(engines[0], reference_cache_ttl)
+    set_ready(True)
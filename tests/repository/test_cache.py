@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from cache.backend import CacheError
+from cache.entity import EntityCache
+from cache.memory import MemoryCache
+from cache.resp import RespCache
+from cache.resp import encode_command
+from cache.resp import read_reply
+from cache.sqlite import SQLiteCache
+from cache.tiered import TieredCache
+from models.city import City
+
+
+class RespStandIn:
+    def __init__(self) -> None:
+        self.data: dict[bytes, bytes] = {}
+        self.commands: list[bytes] = []
+        self.received = asyncio.Event()
+        self.hold: asyncio.Event | None = None
+        self.password: bytes | None = None
+        self.db = b"0"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        authenticated = self.password is None
+        try:
+            while True:
+                command = await read_reply(reader)
+                assert isinstance(command, list)
+                name, *args = [arg for arg in command if isinstance(arg, bytes)]
+                self.commands.append(name.upper())
+                self.received.set()
+                if self.hold is not None:
+                    await self.hold.wait()
+                if name.upper() == b"AUTH":
+                    authenticated = args[-1:] == [self.password]
+                    writer.write(b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n")
+                elif not authenticated:
+                    writer.write(b"-NOAUTH Authentication required.\r\n")
+                else:
+                    writer.write(self.reply(name.upper(), args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    def reply(self, name: bytes, args: list[bytes]) -> bytes:
+        if name == b"MGET":
+            values = [self.data.get(key) for key in args]
+            return b"*%d\r\n" % len(values) + b"".join(
+                b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value) for value in values
+            )
+        if name == b"SET":
+            self.data[args[0]] = args[1]
+            return b"+OK\r\n"
+        if name == b"SELECT":
+            self.db = args[0]
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = sum(self.data.pop(key, None) is not None for key in args)
+            return b":%d\r\n" % removed
+        return b"-ERR unknown command\r\n"
+
+
+@pytest_asyncio.fixture
+async def resp_server() -> AsyncGenerator[tuple[RespStandIn, int]]:
+    stand_in = RespStandIn()
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield stand_in, port
+    server.close()
+    await server.wait_closed()
+
+
+def test_encode_command() -> None:
+    assert encode_command("SET", "k", b"v", 10) == b"*4\r\n$3\r\nSET\r\n$1\r\nk\r\n$1\r\nv\r\n$2\r\n10\r\n"
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCache(max_entries=2)
+    await cache.set_many({"a": b"1", "b": b"2"})
+    await cache.get_many(["a"])
+    await cache.set_many({"c": b"3"})
+
+    assert await cache.get_many(["a", "b", "c"]) == {"a": b"1", "c": b"3"}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_is_shared_between_connections(tmp_path: Path) -> None:
+    path = str(tmp_path / "cache.sqlite")
+    writer, reader = SQLiteCache(path), SQLiteCache(path)
+    await writer.set_many({"a": b"1", "b": b"2"})
+    await writer.delete_many(["b"])
+
+    assert await reader.get_many(["a", "b"]) == {"a": b"1"}
+
+    await writer.close()
+    await reader.close()
+
+
+@pytest.mark.asyncio
+async def test_resp_cache_round_trip(resp_server: tuple[RespStandIn, int]) -> None:
+    stand_in, port = resp_server
+    cache = RespCache("127.0.0.1", port)
+    await cache.set_many({"a": b"1", "b": b"\r\n"})
+
+    assert await cache.get_many(["a", "b", "c"]) == {"a": b"1", "b": b"\r\n"}
+
+    await cache.delete_many(["a"])
+    assert await cache.get_many(["a"]) == {}
+    assert stand_in.commands == [b"SET", b"SET", b"MGET", b"DEL", b"MGET"]
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_resp_cache_authenticates_with_url_credentials(resp_server: tuple[RespStandIn, int]) -> None:
+    stand_in, port = resp_server
+    stand_in.password = b"p@ss"
+    cache = RespCache.from_url(f"redis://:p%40ss@127.0.0.1:{port}/1")
+    await cache.set_many({"a": b"1"})
+
+    assert await cache.get_many(["a"]) == {"a": b"1"}
+    assert stand_in.commands[:2] == [b"AUTH", b"SELECT"]
+    assert stand_in.db == b"1"
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_resp_cache_without_credentials_is_rejected(resp_server: tuple[RespStandIn, int]) -> None:
+    stand_in, port = resp_server
+    stand_in.password = b"secret"
+    cache = RespCache.from_url(f"redis://127.0.0.1:{port}")
+
+    with pytest.raises(CacheError, match="NOAUTH"):
+        await cache.set_many({"a": b"1"})
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_command_does_not_leave_its_reply_behind(resp_server: tuple[RespStandIn, int]) -> None:
+    stand_in, port = resp_server
+    stand_in.data.update({b"a": b"1", b"b": b"2"})
+    hold = stand_in.hold = asyncio.Event()
+    cache = RespCache("127.0.0.1", port)
+
+    pending = asyncio.create_task(cache.get_many(["a"]))
+    await stand_in.received.wait()
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    stand_in.hold = None
+    hold.set()
+
+    found = await cache.get_many(["b"])
+    await cache.close()
+
+    assert found == {"b": b"2"}
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_backfills_local_tier(resp_server: tuple[RespStandIn, int]) -> None:
+    _, port = resp_server
+    shared = RespCache("127.0.0.1", port)
+    first_worker = EntityCache("city", City, TieredCache([MemoryCache(), shared]))
+    second_local = MemoryCache()
+    second_worker = EntityCache("city", City, TieredCache([second_local, RespCache("127.0.0.1", port)]))
+
+    await first_worker.set_many({1: City(city_id=1, name="Москва")}, version=1)
+    found, missing = await second_worker.get_many([1, 2], version=1)
+
+    assert found == {1: City(city_id=1, name="Москва")}
+    assert missing == [2]
+    assert list(await second_local.get_many([second_worker.key(1, 1)])) == [second_worker.key(1, 1)]
+
+    await first_worker.backend.close()
+    await second_worker.backend.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_tier_is_skipped() -> None:
+    cache = TieredCache([MemoryCache(), RespCache("127.0.0.1", 1, timeout=0.5)])
+    await cache.set_many({"a": b"1"})
+
+    assert await cache.get_many(["a", "b"]) == {"a": b"1"}
+
+
+@pytest.mark.asyncio
+async def test_write_back_from_an_older_version_is_not_served() -> None:
+    cache = EntityCache("city", City, TieredCache([MemoryCache()]))
+    read_version, committed_version = 1, 2
+
+    await cache.set_many({1: City(city_id=1, name="Москва")}, read_version)
+    found, missing = await cache.get_many([1], committed_version)
+
+    assert found == {}
+    assert missing == [1]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from city_cache import REFRESH_BACKOFF
+from city_cache import CityCache
+from models.city import City
+
+
+def test_unloaded_cache_passes_through() -> None:
+    cache = CityCache()
+    cache.put(City(city_id=1, name="Москва"))
+
+    assert cache.get(1) is None
+    assert cache.find([1]) == ({}, [1])
+    assert len(cache) == 0
+
+
+def test_lookup_by_id_and_normalized_name() -> None:
+    cache = CityCache()
+    moscow = City(city_id=1, name="Нижний Новгород")
+    cache.load([moscow])
+
+    assert cache.get(1) is moscow
+    assert cache.get_by_name("  нижний   НОВГОРОД ") is moscow
+    assert cache.find([1, 2]) == ({1: moscow}, [2])
+
+
+def test_put_and_discard_keep_name_index_coherent() -> None:
+    cache = CityCache()
+    cache.load([City(city_id=1, name="Москва")])
+
+    cache.put(City(city_id=1, name="Казань"))
+    assert cache.get_by_name("Москва") is None
+    assert cache.get_by_name("Казань") == City(city_id=1, name="Казань")
+
+    cache.discard(1)
+    assert cache.get(1) is None
+    assert cache.get_by_name("Казань") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_passes_through_and_reloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("city_cache.time.monotonic", lambda: now[0])
+    cities = [City(city_id=1, name="Москва")]
+    cache = CityCache()
+
+    async def load() -> list[City]:
+        return list(cities)
+
+    cache.configure(load, ttl=5.0)
+    await cache.refresh()
+    cities.append(City(city_id=2, name="Казань"))
+
+    now[0] += 5.0
+    assert cache.get(2) is None
+
+    await asyncio.sleep(0)
+    assert cache.get(2) == cities[1]
+
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_write_during_refresh_reloads_again() -> None:
+    cities = [City(city_id=1, name="Москва")]
+    cache = CityCache()
+    cache.load(cities)
+
+    async def load() -> list[City]:
+        snapshot = list(cities)
+        if snapshot[0].name == "Москва":
+            cities[0] = City(city_id=1, name="Казань")
+            cache.put(cities[0])
+        return snapshot
+
+    cache.configure(load, ttl=30.0)
+    await cache.refresh()
+
+    assert cache.get_by_name("Казань") == cities[0]
+    assert cache.get_by_name("Москва") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_initial_load_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("city_cache.time.monotonic", lambda: now[0])
+    moscow = City(city_id=1, name="Москва")
+    calls: list[int] = []
+    cache = CityCache()
+
+    async def load() -> list[City]:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise OSError("connection refused")
+        return [moscow]
+
+    cache.configure(load, ttl=30.0)
+    await cache.refresh()
+    assert not cache.loaded
+
+    now[0] += REFRESH_BACKOFF.max_delay
+    assert cache.get(1) is None
+    await asyncio.sleep(0)
+
+    assert cache.get(1) is moscow
+    assert calls == [0, 1]
+
+    await cache.close()
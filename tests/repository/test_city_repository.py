@@ -9,15 +9,16 @@ import pytest_asyncio
 
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
+from database import create_engine
 from models.city import City
 from repository.city_repository import CityRepository
+from settings import get_settings
 
 
-engine = create_async_engine("postgresql+asyncpg://nastya@localhost:5432/postgres", echo=True)
+engine = create_engine(get_settings().model_copy(update={"search_path": "test"}))
 AsyncSessionMaker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 metadata = MetaData(schema='test')
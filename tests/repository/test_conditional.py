@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Any
+from typing import cast
+
+import pytest
+
+from routers.conditional import table_etag
+from service_locator import ServiceLocator
+from table_versions import table_versions
+
+
+class StatsStandIn:
+    def __init__(self, changes: dict[str, int]) -> None:
+        self.changes = changes
+
+    async def get_change_counts(self, tables: Collection[str]) -> dict[str, int]:
+        return {table: self.changes[table] for table in tables if table in self.changes}
+
+
+class LocatorStandIn:
+    def __init__(self, stats: StatsStandIn) -> None:
+        self.stats = stats
+
+    def get_stats_repo(self) -> StatsStandIn:
+        return self.stats
+
+
+def locator(changes: dict[str, int]) -> ServiceLocator:
+    return cast(ServiceLocator, cast(Any, LocatorStandIn(StatsStandIn(changes))))
+
+
+@pytest.mark.asyncio
+async def test_etag_depends_only_on_shared_counters() -> None:
+    stats = locator({"users": 10})
+    before = await table_etag(stats, ("users",), 1)
+
+    table_versions.bump(("users",))
+
+    assert await table_etag(stats, ("users",), 1) == before
+    assert await table_etag(locator({"users": 11}), ("users",), 1) != before
+    assert await table_etag(stats, ("users",), 2) != before
+
+
+@pytest.mark.asyncio
+async def test_missing_counters_disable_the_etag() -> None:
+    assert await table_etag(locator({}), ("users",)) is None
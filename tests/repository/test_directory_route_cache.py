@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from directory_route_cache import REBUILD_BACKOFF
+from directory_route_cache import DirectoryRouteCache
+from directory_route_cache import DirectoryRouteSnapshot
+from models.city import City
+from models.directory_route import DirectoryRoute
+
+
+moscow = City(city_id=1, name="Москва")
+kazan = City(city_id=2, name="Казань")
+omsk = City(city_id=3, name="Омск")
+
+
+def make_route(d_route_id: int, cost: int, departure: City, destination: City) -> DirectoryRoute:
+    return DirectoryRoute(d_route_id=d_route_id, type_transport="Поезд", cost=cost, distance=100,
+                          departure_city=departure, destination_city=destination)
+
+
+def test_snapshot_sorts_options_by_price() -> None:
+    snapshot = DirectoryRouteSnapshot.build(1, [
+        make_route(1, 500, moscow, kazan),
+        make_route(2, 300, moscow, kazan),
+        make_route(3, 200, moscow, omsk)
+    ])
+
+    assert [d_route.d_route_id for d_route in snapshot.between(1, 2)] == [2, 1]
+    assert [d_route.d_route_id for d_route in snapshot.from_city(1)] == [3, 2, 1]
+    assert snapshot.between(2, 1) == ()
+    assert snapshot.get(3) is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_rebuilds_in_background() -> None:
+    routes = [make_route(1, 500, moscow, kazan)]
+    cache = DirectoryRouteCache()
+
+    async def load() -> list[DirectoryRoute]:
+        return list(routes)
+
+    cache.configure(load, ttl=30.0)
+    await cache.rebuild()
+    first = cache.snapshot()
+    assert first is not None and first.version == 0
+
+    cheaper = make_route(2, 100, moscow, kazan)
+    routes.append(cheaper)
+    cache.invalidate()
+    assert cache.snapshot() is None
+
+    await asyncio.sleep(0)
+    second = cache.snapshot()
+    assert second is not None and second.version == 1
+    assert second.between(moscow.city_id, kazan.city_id)[0] == cheaper
+    assert len(first.routes) == 1
+
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_is_not_served(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("directory_route_cache.time.monotonic", lambda: now[0])
+    routes = [make_route(1, 500, moscow, kazan)]
+    cache = DirectoryRouteCache()
+
+    async def load() -> list[DirectoryRoute]:
+        return list(routes)
+
+    cache.configure(load, ttl=5.0)
+    await cache.rebuild()
+    routes[0] = make_route(1, 300, moscow, kazan)
+
+    now[0] += 5.0
+    assert cache.snapshot() is None
+
+    await asyncio.sleep(0)
+    snapshot = cache.snapshot()
+    assert snapshot is not None
+    assert snapshot.get(1) == routes[0]
+
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_rebuild_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("directory_route_cache.time.monotonic", lambda: now[0])
+    route = make_route(1, 500, moscow, kazan)
+    failures = [OSError("connection refused")]
+    cache = DirectoryRouteCache()
+
+    async def load() -> list[DirectoryRoute]:
+        if failures:
+            raise failures.pop()
+        return [route]
+
+    cache.configure(load, ttl=30.0)
+    await cache.rebuild()
+    assert cache.snapshot() is None
+
+    now[0] += REBUILD_BACKOFF.max_delay
+    assert cache.snapshot() is None
+    await asyncio.sleep(0)
+
+    snapshot = cache.snapshot()
+    assert snapshot is not None
+    assert snapshot.get(1) == route
+
+    await cache.close()
+
+
+def test_snapshot_hands_out_copies() -> None:
+    snapshot = DirectoryRouteSnapshot.build(1, [make_route(1, 500, moscow, kazan)])
+
+    d_route = snapshot.get(1)
+    assert d_route is not None and d_route.departure_city is not None
+    d_route.cost = 1
+    d_route.departure_city.name = "Омск"
+
+    assert snapshot.get(1) == make_route(1, 500, moscow, kazan)
+    assert snapshot.between(moscow.city_id, kazan.city_id)[0] is not snapshot.between(moscow.city_id, kazan.city_id)[0]
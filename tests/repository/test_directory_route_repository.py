@@ -9,14 +9,15 @@ import pytest_asyncio
 
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
+from database import create_engine
 from models.city import City
 from models.directory_route import DirectoryRoute
 from repository.city_repository import CityRepository
 from repository.directory_route_repository import DirectoryRouteRepository
+from settings import get_settings
 
 
 EXPECTED_CITY_ID = 6
@@ -24,7 +25,7 @@ EXPECTED_CITY_ID_P = 3
 EXPECTED_CITY_ID_K = 5
 
 
-engine = create_async_engine("postgresql+asyncpg://nastya@localhost:5432/postgres", echo=True)
+engine = create_engine(get_settings().model_copy(update={"search_path": "test"}))
 AsyncSessionMaker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 metadata = MetaData(schema='test')
@@ -207,6 +208,16 @@ async def test_get_list_directory_route(db_session: AsyncSession) -> None:
         assert route.distance == expected["distance"]
         assert route.cost == expected["price"]
 
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_stream_list_matches_get_list(db_session: AsyncSession) -> None:
+    city_repo = CityRepository(db_session)
+    directory_route_repo = DirectoryRouteRepository(db_session, city_repo)
+
+    streamed = [route async for route in directory_route_repo.stream_list(batch_size=2)]
+
+    assert streamed == await directory_route_repo.get_list()
+
 @pytest.mark.asyncio(loop_scope="function") 
 async def test_get_by_cities_success(db_session: AsyncSession):
     city_repo = CityRepository(db_session)
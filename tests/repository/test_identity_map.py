@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from identity_map import IdentityMap
+from models.city import City
+from models.user import User
+
+
+def test_find_splits_cached_and_missing_keys() -> None:
+    identity_map = IdentityMap()
+    moscow = identity_map.add(City, 1, City(city_id=1, name="Москва"))
+
+    found, missing = identity_map.find(City, [1, 2, 3])
+
+    assert found == {1: moscow}
+    assert found[1] is moscow
+    assert missing == [2, 3]
+
+
+def test_keys_are_scoped_by_model() -> None:
+    identity_map = IdentityMap()
+    identity_map.add(City, 1, City(city_id=1, name="Москва"))
+
+    assert identity_map.get(User, 1) is None
+    assert identity_map.get(City, 1) is not None
+
+
+def test_resolve_builds_each_entity_once() -> None:
+    identity_map = IdentityMap()
+    built: list[int] = []
+
+    def build(row: dict[str, object]) -> City:
+        built.append(1)
+        return City(city_id=1, name=str(row["name"]))
+
+    first = identity_map.resolve(City, 1, build, {"name": "Москва"})  # type: ignore[arg-type]
+    second = identity_map.resolve(City, 1, build, {"name": "Казань"})  # type: ignore[arg-type]
+
+    assert first is second
+    assert second.name == "Москва"
+    assert built == [1]
+
+    identity_map.clear()
+    assert len(identity_map) == 0
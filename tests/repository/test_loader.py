@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from repository.loader import DataLoader
+from repository.loader import LoaderScope
+
+
+class FakeSource:
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+
+    async def get_by_ids(self, ids: list[int]) -> dict[int, str]:
+        self.batches.append(ids)
+        return {i: f"item-{i}" for i in ids if i > 0}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_loads_in_same_tick_are_merged() -> None:
+    source = FakeSource()
+    loader = DataLoader(source.get_by_ids, LoaderScope())
+
+    items = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(-1))
+
+    assert items == ["item-1", "item-2", "item-1", None]
+    assert source.batches == [[1, 2, -1]]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_sequential_loads_are_separate_batches() -> None:
+    source = FakeSource()
+    loader = DataLoader(source.get_by_ids, LoaderScope())
+
+    assert await loader.load(1) == "item-1"
+    assert await loader.load_many([2, 3]) == ["item-2", "item-3"]
+    assert source.batches == [[1], [2, 3]]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_batch_error_is_raised_to_every_caller() -> None:
+    async def failing(ids: list[int]) -> dict[int, str]:
+        raise ValueError("boom")
+
+    loader = DataLoader(failing, LoaderScope())
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_batch_can_use_another_loader_of_its_scope() -> None:
+    scope = LoaderScope()
+    source = FakeSource()
+    inner = scope.get(source.get_by_ids)
+
+    async def outer_batch(ids: list[int]) -> dict[int, str]:
+        return {i: f"outer-{await inner.load(i)}" for i in ids}
+
+    outer = scope.get(outer_batch)
+
+    assert await asyncio.wait_for(outer.load(1), timeout=1) == "outer-item-1"
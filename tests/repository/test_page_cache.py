@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from page_cache import PageCache
+from table_versions import TableVersions
+
+
+def test_least_recently_used_page_is_evicted() -> None:
+    max_entries = 2
+    cache = PageCache(max_entries=max_entries)
+    cache.put(("user.html", "a"), b"a", ("users",))
+    cache.put(("user.html", "b"), b"b", ("users",))
+    assert cache.get(("user.html", "a")) == b"a"
+
+    cache.put(("user.html", "c"), b"c", ("users",))
+
+    assert cache.get(("user.html", "b")) is None
+    assert cache.get(("user.html", "a")) == b"a"
+    assert len(cache) == max_entries
+
+
+def test_expired_page_is_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("page_cache.time.monotonic", lambda: now[0])
+    cache = PageCache(ttl=5.0)
+    cache.put(("user.html", "a"), b"a", ("users",))
+
+    now[0] += 5.0
+
+    assert cache.get(("user.html", "a")) is None
+    assert len(cache) == 0
+
+
+def test_commit_invalidates_only_pages_of_written_tables() -> None:
+    versions = TableVersions()
+    cache = PageCache()
+    versions.subscribe(cache.invalidate)
+    cache.put(("travel.html", "a"), b"travel", ("travel", "users"))
+    cache.put(("user.html", "a"), b"users", ("users",))
+    cache.put(("accommodation.html", "a"), b"accommodations", ("accommodations",))
+
+    versions.bump({"users"})
+
+    assert cache.get(("travel.html", "a")) is None
+    assert cache.get(("user.html", "a")) is None
+    assert cache.get(("accommodation.html", "a")) == b"accommodations"
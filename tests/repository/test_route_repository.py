@@ -10,10 +10,10 @@ import pytest_asyncio
 
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
+from database import create_engine
 from models.city import City
 from models.directory_route import DirectoryRoute
 from models.route import Route
@@ -25,9 +25,10 @@ from repository.entertainment_repository import EntertainmentRepository
 from repository.route_repository import RouteRepository
 from repository.travel_repository import TravelRepository
 from repository.user_repository import UserRepository
+from settings import get_settings
 
 
-engine = create_async_engine("postgresql+asyncpg://nastya@localhost:5432/postgres", echo=True)
+engine = create_engine(get_settings().model_copy(update={"search_path": "test"}))
 AsyncSessionMaker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -553,7 +554,7 @@ async def test_get_by_id_existing_route(db_session: AsyncSession) -> None:
     city_repo = CityRepository(db_session)
     d_repo = DirectoryRouteRepository(db_session, city_repo)
     repo = RouteRepository(db_session, d_repo, travel_repo)
-    route = await repo.get_by_id(1)
+    route = await repo.get_by_id(1, expand_travel=True)
 
     assert route is not None
     assert route.d_route is not None
@@ -604,7 +605,7 @@ async def test_get_list_route(db_session: AsyncSession) -> None:
     d_repo = DirectoryRouteRepository(db_session, city_repo)
     repo = RouteRepository(db_session, d_repo, travel_repo)
 
-    list_of_routes = await repo.get_list()
+    list_of_routes = await repo.get_list(expand_travel=True)
 
     result = await db_session.execute(text("""
         SELECT dr.id, c1.name AS departure_city, c2.name AS arrival_city
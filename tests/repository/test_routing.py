@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from starlette.routing import Match
+from starlette.routing import Route
+
+from main import app
+
+
+SRC_DIRECTORY = Path(__file__).resolve().parents[2] / "src"
+HEAVY_PACKAGES = ("abstract_repository", "abstract_service", "services")
+HEAVY_MODULES = ("controllers.user_controller", "repository.city_repository", "models.user", "models.city")
+
+
+def resolve(method: str, path: str) -> str:
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    for route in app.router.routes:
+        if isinstance(route, Route) and route.matches(scope)[0] == Match.FULL:
+            return route.name
+    raise LookupError(path)
+
+
+@pytest.mark.parametrize(("path", "endpoint"), [
+    ("/travel.html", "get_all_travels"),
+    ("/archive", "check_archive_travels"),
+    ("/entertainment.html", "get_all_entertainments"),
+    ("/7", "get_entertainment")
+])
+def test_literal_pages_are_not_shadowed_by_id_routes(path: str, endpoint: str) -> None:
+    assert resolve("GET", path) == endpoint
+
+
+def test_importing_the_app_does_not_build_the_object_graph() -> None:
+    code = "import sys, main; print('\\n'.join(sys.modules))"
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIRECTORY))
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIRECTORY, env=env, capture_output=True,
+                            text=True, check=True)
+    loaded = set(result.stdout.split())
+
+    assert not {module for module in loaded if module.split(".")[0] in HEAVY_PACKAGES}
+    assert not loaded & set(HEAVY_MODULES)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import cast
+
+import pytest
+
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import database
+
+from database import BUMP_TABLE_VERSIONS
+from database import RequestSessions
+from database import ScopedSession
+from database import is_read_only
+from database import reads_primary
+from database import written_tables
+from repository import statements
+from table_versions import TableVersions
+
+
+def test_write_statements_are_tagged_with_their_tables() -> None:
+    assert written_tables(statements.USER_DELETE) == ("users",)
+    assert written_tables(statements.TRAVEL_ADD_ACCOMMODATION) == ("travel_accommodations",)
+    assert written_tables(statements.TRAVEL_GET_BY_IDS) == ()
+    assert is_read_only(statements.TABLE_VERSIONS)
+    assert reads_primary(statements.TABLE_VERSIONS)
+    assert not reads_primary(statements.TABLE_VERSIONS_FOR_READ)
+    assert not reads_primary(statements.TRAVEL_GET_BY_IDS)
+
+
+def test_bump_changes_only_the_written_tables() -> None:
+    versions = TableVersions()
+    before = versions.snapshot(("users", "travel"))
+
+    versions.bump({"travel"})
+
+    assert versions.snapshot(("users", "travel")) != before
+    assert versions.get("users") == 0
+    assert versions.get("travel") == 1
+
+
+class SessionStandIn:
+    def __init__(self) -> None:
+        self.executed: list[tuple[Executable, Any]] = []
+        self.committed = False
+
+    async def execute(self, statement: Executable, params: Any = None) -> None:
+        self.executed.append((statement, params))
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+@pytest.mark.asyncio
+async def test_commit_bumps_shared_versions_in_the_same_transaction() -> None:
+    session = SessionStandIn()
+    sessions = RequestSessions(lambda: cast(AsyncSession, cast(Any, session)), None)
+    token = database._current_sessions.set(sessions)
+    try:
+        await ScopedSession().execute(statements.TRAVEL_ADD_ACCOMMODATION, {})
+        await ScopedSession().execute(statements.USER_DELETE, {"user_id": 1})
+        await ScopedSession.commit()
+    finally:
+        database._current_sessions.reset(token)
+
+    assert session.executed[-1] == (BUMP_TABLE_VERSIONS, {"tables": ["travel_accommodations", "users"]})
+    assert session.committed
+    assert not sessions.written_tables
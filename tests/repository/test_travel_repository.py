@@ -10,19 +10,21 @@ import pytest_asyncio
 
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
+from database import create_engine
+from models.reference import UserRef
 from models.travel import Travel
 from models.user import User
 from repository.accommodation_repository import AccommodationRepository
 from repository.entertainment_repository import EntertainmentRepository
 from repository.travel_repository import TravelRepository
 from repository.user_repository import UserRepository
+from settings import get_settings
 
 
-engine = create_async_engine("postgresql+asyncpg://nastya@localhost:5432/postgres", echo=True)
+engine = create_engine(get_settings().model_copy(update={"search_path": "test"}))
 AsyncSessionMaker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -311,6 +313,22 @@ async def test_get_by_id_not_existing_travel(db_session: AsyncSession) -> None:
     assert travel is None
 
 
+@pytest.mark.asyncio(loop_scope="function")
+async def test_users_are_references_until_expanded(db_session: AsyncSession) -> None:
+    user_repo = UserRepository(db_session)
+    travel_repo = TravelRepository(db_session, user_repo, EntertainmentRepository(db_session),
+                                   AccommodationRepository(db_session))
+
+    travel = await travel_repo.get_by_id(1)
+    assert travel is not None
+    assert isinstance(travel.users, UserRef)
+    assert travel.users.fio == "Лобач Анастасия Олеговна"
+
+    await travel_repo.expand_users([travel])
+    assert isinstance(travel.users, User)
+    assert travel.users.login == "user1"
+
+
 @pytest.mark.asyncio(loop_scope="function") 
 async def test_get_list_travel(db_session: AsyncSession) -> None:
     user_repo = UserRepository(db_session)
@@ -349,3 +367,36 @@ async def test_get_list_travel(db_session: AsyncSession) -> None:
             assert entertainment.address == expected_entertainment["address"]
             assert entertainment.event_name == expected_entertainment["event_name"]
             assert entertainment.event_time == expected_entertainment["event_time"]
+
+
+@pytest.mark.asyncio(loop_scope="function") 
+async def test_search_travel_pages_without_duplicates(db_session: AsyncSession) -> None:
+    await db_session.execute(text("TRUNCATE TABLE city RESTART IDENTITY CASCADE"))
+    await db_session.execute(text("INSERT INTO city (name) VALUES ('Москва'), ('Воронеж')"))
+    await db_session.execute(text("INSERT INTO directory_route (type_transport, departure_city, arrival_city, \
+        distance, price) VALUES ('Паром', 1, 2, 500, 3000)"))
+    await db_session.execute(text("INSERT INTO travel (status, user_id) VALUES ('Планируется', 1)"))
+    for travel_id in (1, 1, 3):
+        await db_session.execute(text("INSERT INTO route (d_route_id, travel_id, start_time, end_time) \
+            VALUES (1, :travel_id, '2025-04-02 01:01:01', '2025-04-08 01:01:01')"), {"travel_id": travel_id})
+    await db_session.execute(text("INSERT INTO travel_entertainment (travel_id, entertainment_id) VALUES (1, 2), \
+        (3, 1)"))
+    await db_session.execute(text("INSERT INTO travel_accommodations (travel_id, accommodation_id) VALUES (3, 1)"))
+    await db_session.commit()
+
+    user_repo = UserRepository(db_session)
+    travel_repo = TravelRepository(db_session, user_repo, EntertainmentRepository(db_session),
+                                   AccommodationRepository(db_session))
+
+    found = await travel_repo.search({"departure_city": 1, "arrival_city": 2})
+    assert [travel.travel_id for travel in found] == [1, 3]
+
+    found = await travel_repo.search({"departure_city": 1}, limit=1, sort="-id")
+    assert [travel.travel_id for travel in found] == [3]
+
+    found = await travel_repo.search({"departure_city": 1}, limit=1, offset=1, sort="-id")
+    assert [travel.travel_id for travel in found] == [1]
+
+    found = await travel_repo.search({"entertainment_name": "Выставка"})
+    assert [travel.travel_id for travel in found] == [1]
+    assert len(found[0].entertainments) == EXPECTED_TWO
@@ -9,15 +9,16 @@ import pytest_asyncio
 
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
+from database import create_engine
 from models.user import User
 from repository.user_repository import UserRepository
+from settings import get_settings
 
 
-engine = create_async_engine("postgresql+asyncpg://nastya@localhost:5432/postgres", echo=True)
+engine = create_engine(get_settings().model_copy(update={"search_path": "test"}))
 AsyncSessionMaker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 metadata = MetaData(schema='test')
@@ -183,6 +184,25 @@ async def test_get_by_id_not_existing_user(db_session: AsyncSession) -> None:
     assert user is None
 
 
+@pytest.mark.asyncio
+async def test_get_by_ids_skips_missing_users(db_session: AsyncSession) -> None:
+    user_repo = UserRepository(db_session)
+    users = await user_repo.get_by_ids([1, 12])
+
+    assert list(users) == [1]
+    assert users[1].fio == "Лобач Анастасия Олеговна"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_by_id_is_batched(db_session: AsyncSession) -> None:
+    user_repo = UserRepository(db_session)
+    users = await asyncio.gather(user_repo.get_by_id(1), user_repo.get_by_id(1), user_repo.get_by_id(12))
+
+    assert users[0] is not None
+    assert users[0] == users[1]
+    assert users[2] is None
+
+
 @pytest.mark.asyncio(loop_scope="function") 
 async def test_get_list_user(db_session: AsyncSession) -> None:
     user_repo = UserRepository(db_session)
@@ -208,6 +228,34 @@ async def test_get_list_user(db_session: AsyncSession) -> None:
     assert list_of_users_simplified == expected_user_names
 
 
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_page_follows_cursor(db_session: AsyncSession) -> None:
+    user_repo = UserRepository(db_session)
+
+    first = await user_repo.get_page(limit=2)
+    assert [user.user_id for user in first.items] == [1, 2]
+    assert first.next_cursor == first.items[-1].user_id
+
+    assert first.next_cursor is not None
+    second = await user_repo.get_page(first.next_cursor, limit=2)
+    assert [user.user_id for user in second.items] == [3]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_page_reads_only_requested_fields(db_session: AsyncSession) -> None:
+    user_repo = UserRepository(db_session)
+
+    page = await user_repo.get_page(limit=1, fields={"fio", "email"})
+
+    user = page.items[0]
+    assert user.user_id == 1
+    assert user.fio == "Лобач Анастасия Олеговна"
+    assert user.email == "nastya@lobach.info"
+    assert "password" not in user.model_fields_set
+    assert "number_passport" not in user.model_fields_set
+
+
 @pytest.mark.asyncio
 async def test_get_exist_user_by_login(db_session: AsyncSession) -> None:
     user_repo = UserRepository(db_session)
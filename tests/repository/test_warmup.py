@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import cast
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from metrics import metrics
+from warmup import is_ready
+from warmup import warm_up
+
+
+class UnreachableEngine:
+    def connect(self) -> UnreachableEngine:
+        return self
+
+    async def __aenter__(self) -> None:
+        raise OSError("connection refused")
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_worker_is_not_ready_when_primary_pool_cannot_warm_up() -> None:
+    engine = cast(AsyncEngine, cast(Any, UnreachableEngine()))
+    connections = 2
+    errors_before = metrics.get("warmup.pool_errors")
+
+    with pytest.raises(RuntimeError):
+        await warm_up([engine], connections, reference_cache_ttl=30.0)
+
+    assert not is_ready()
+    assert metrics.get("warmup.pool_errors") - errors_before == connections